@@ -6,7 +6,6 @@ import queue
 import time
 
 import pandas as pd
-from pyModbusTCP.client import ModbusClient
 
 import scheduling.manual_schedule_manager as msm
 from control.command_runtime import mark_command_finished, mark_command_running
@@ -17,16 +16,18 @@ from control.flows import (
     safe_stop_plant as safe_stop_plant_flow,
 )
 from control.modbus_io import (
+    close_pooled_clients,
     read_enable_state as read_enable_state_io,
     send_setpoints as send_setpoints_io,
     set_enable as set_enable_io,
+    run_with_client,
     wait_until_battery_power_below_threshold as wait_until_battery_power_below_threshold_io,
 )
 from runtime.engine_command_cycle_runtime import run_command_with_lifecycle
 from runtime.engine_status_runtime import default_engine_status, update_engine_status
 from measurement.storage import find_latest_persisted_soc_for_plant
-from modbus.codec import read_point_internal
-from runtime.contracts import resolve_modbus_endpoint, sanitize_plant_name
+from modbus.codec import read_points_internal
+from runtime.contracts import cached_modbus_endpoint, sanitize_plant_name
 from runtime.paths import get_data_dir
 from scheduling.runtime import build_effective_schedule_frame, resolve_schedule_setpoint
 from runtime.shared_state import snapshot_locked
@@ -45,15 +46,7 @@ def _plant_name(config, plant_id):
 
 def _get_plant_modbus_config(config, shared_data, plant_id, transport_mode=None):
     mode = transport_mode or snapshot_locked(shared_data, lambda data: data.get("transport_mode", "local"))
-    endpoint = resolve_modbus_endpoint(config, plant_id, mode)
-    return {
-        "mode": mode,
-        "host": endpoint.get("host", "localhost"),
-        "port": int(endpoint.get("port", 5020 if plant_id == "lib" else 5021)),
-        "byte_order": endpoint.get("byte_order"),
-        "word_order": endpoint.get("word_order"),
-        "points": endpoint.get("points", {}),
-    }
+    return cached_modbus_endpoint(config, plant_id, mode)
 
 
 def _set_enable(config, shared_data, plant_id, value):
@@ -91,28 +84,30 @@ def _wait_until_battery_power_below_threshold(
 
 def _read_observed_points(config, shared_data, plant_id, transport_mode=None):
     cfg = _get_plant_modbus_config(config, shared_data, plant_id, transport_mode=transport_mode)
-    client = ModbusClient(host=cfg["host"], port=cfg["port"])
     values = {"enable_state": None, "p_battery_kw": None, "q_battery_kvar": None}
     error = None
     try:
-        if not client.open():
-            return values, {
-                "code": "connect_failed",
-                "message": f"Could not connect to {plant_id.upper()} endpoint.",
-            }
-        enable_state = read_point_internal(client, cfg, "enable")
-        p_battery = read_point_internal(client, cfg, "p_battery")
-        q_battery = read_point_internal(client, cfg, "q_battery")
+        connected, observed = run_with_client(
+            cfg,
+            lambda client: read_points_internal(client, cfg, ["enable", "p_battery", "q_battery"]),
+            failed=lambda points: any(value is None for value in points.values()),
+        )
+    except Exception as exc:
+        return values, {"code": "read_error", "message": str(exc)}
+    if not connected:
+        return values, {
+            "code": "connect_failed",
+            "message": f"Could not connect to {plant_id.upper()} endpoint.",
+        }
+    try:
+        enable_state = observed["enable"]
+        p_battery = observed["p_battery"]
+        q_battery = observed["q_battery"]
         values["enable_state"] = None if enable_state is None else int(enable_state)
         values["p_battery_kw"] = None if p_battery is None else float(p_battery)
         values["q_battery_kvar"] = None if q_battery is None else float(q_battery)
     except Exception as exc:
         error = {"code": "read_error", "message": str(exc)}
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
     return values, error
 
 
@@ -240,6 +235,17 @@ def _refresh_all_observed_state(
     return results
 
 
+_created_data_dirs = set()
+
+
+def _ensure_data_dir():
+    # Record commands only need the directory to exist once per process; the measurement writer recreates it if removed.
+    data_dir = get_data_dir(__file__)
+    if data_dir not in _created_data_dirs:
+        os.makedirs(data_dir, exist_ok=True)
+        _created_data_dirs.add(data_dir)
+
+
 def _get_daily_recording_file_path(config, plant_id):
     safe_name = sanitize_plant_name(_plant_name(config, plant_id), plant_id)
     date_str = now_tz(config).strftime("%Y%m%d")
@@ -348,8 +354,8 @@ def _get_latest_schedule_setpoint(config, shared_data, plant_id, tz):
         shared_data,
         lambda data: {
             "api_df": data.get("api_schedule_df_by_plant", {}).get(plant_id),
-            "manual_series_map": dict(data.get("manual_schedule_series_df_by_key", {})),
-            "manual_merge_enabled": dict(data.get("manual_schedule_merge_enabled_by_key", {})),
+            "manual_series_map": data.get("manual_schedule_series_df_by_key", {}),
+            "manual_merge_enabled": data.get("manual_schedule_merge_enabled_by_key", {}),
         },
     )
     p_key, q_key = msm.manual_series_keys_for_plant(plant_id)
@@ -607,7 +613,7 @@ def _execute_command(config, shared_data, command, *, plant_ids, tz, now_fn=now_
 
     if kind == "plant.record_start":
         plant_id = str(payload.get("plant_id", ""))
-        os.makedirs(get_data_dir(__file__), exist_ok=True)
+        _ensure_data_dir()
         file_path = get_daily_recording_file_path_fn(plant_id)
         with shared_data["lock"]:
             current = shared_data.get("measurements_filename_by_plant", {}).get(plant_id)
@@ -626,10 +632,10 @@ def _execute_command(config, shared_data, command, *, plant_ids, tz, now_fn=now_
         return {"state": "succeeded", "message": None, "result": {"noop": False}}
 
     if kind == "fleet.start_all":
-        os.makedirs(get_data_dir(__file__), exist_ok=True)
+        _ensure_data_dir()
+        file_path_by_plant = {pid: get_daily_recording_file_path_fn(pid) for pid in plant_ids}
         with shared_data["lock"]:
-            for pid in plant_ids:
-                shared_data["measurements_filename_by_plant"][pid] = get_daily_recording_file_path_fn(pid)
+            shared_data["measurements_filename_by_plant"].update(file_path_by_plant)
         per_plant = {}
         any_failed = False
         for pid in plant_ids:
@@ -767,5 +773,6 @@ def control_engine_agent(config, shared_data):
         elapsed = time.monotonic() - loop_start
         time.sleep(max(0.0, CONTROL_ENGINE_LOOP_PERIOD_S - elapsed))
 
+    close_pooled_clients()
     _update_control_engine_status(shared_data, now_value=now_tz(config), set_alive=False, last_loop_end=now_tz(config))
     logging.info("Control engine agent stopped.")
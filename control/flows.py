@@ -2,9 +2,24 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
+# Observed-state fields cleared on a transport switch; the next successful read repopulates them.
+_TRANSPORT_RESET_OBSERVED_STATE = {
+    "enable_state": None,
+    "p_battery_kw": None,
+    "q_battery_kvar": None,
+    "last_attempt": None,
+    "last_success": None,
+    "error": None,
+    "read_status": "unknown",
+    "last_error": None,
+    "consecutive_failures": 0,
+    "stale": True,
+}
+
 
 def safe_stop_plant(
     shared_data,
@@ -72,11 +87,15 @@ def safe_stop_plant(
 
 
 def safe_stop_all_plants(plant_ids, safe_stop_plant_fn):
-    """Apply safe-stop for each plant and return results map."""
-    results = {}
-    for plant_id in plant_ids:
-        results[plant_id] = safe_stop_plant_fn(plant_id)
-    return results
+    """Apply safe-stop for each plant concurrently and return results map."""
+    plant_ids = list(plant_ids)
+    if len(plant_ids) <= 1:
+        return {plant_id: safe_stop_plant_fn(plant_id) for plant_id in plant_ids}
+
+    # Each safe-stop mostly waits on its own plant's power decay, so the waits overlap.
+    with ThreadPoolExecutor(max_workers=len(plant_ids), thread_name_prefix="safe-stop") as executor:
+        futures = {plant_id: executor.submit(safe_stop_plant_fn, plant_id) for plant_id in plant_ids}
+    return {plant_id: future.result() for plant_id, future in futures.items()}
 
 
 def perform_transport_switch(shared_data, plant_ids, requested_mode, safe_stop_all_plants_fn):
@@ -88,36 +107,30 @@ def perform_transport_switch(shared_data, plant_ids, requested_mode, safe_stop_a
 
         safe_stop_all_plants_fn()
 
+        # Build the reset values before taking the lock so the critical section is only dict updates.
+        stopped_by_plant = {plant_id: False for plant_id in plant_ids}
+        transition_by_plant = {plant_id: "stopped" for plant_id in plant_ids}
+        no_file_by_plant = {plant_id: None for plant_id in plant_ids}
+        empty_df_by_plant = {plant_id: pd.DataFrame() for plant_id in plant_ids}
+        operating_state_by_plant = {plant_id: "unknown" for plant_id in plant_ids}
         with shared_data["lock"]:
             observed_state_map = shared_data.setdefault("plant_observed_state_by_plant", {})
-            plant_operating_state_map = shared_data.setdefault("plant_operating_state_by_plant", {})
             dispatch_write_status_map = shared_data.setdefault("dispatch_write_status_by_plant", {})
+            shared_data["scheduler_running_by_plant"].update(stopped_by_plant)
+            shared_data["plant_transition_by_plant"].update(transition_by_plant)
+            shared_data["measurements_filename_by_plant"].update(no_file_by_plant)
+            shared_data["current_file_df_by_plant"].update(empty_df_by_plant)
+            shared_data["current_file_path_by_plant"].update(no_file_by_plant)
+            shared_data.setdefault("plant_operating_state_by_plant", {}).update(operating_state_by_plant)
             for plant_id in plant_ids:
-                shared_data["scheduler_running_by_plant"][plant_id] = False
-                shared_data["plant_transition_by_plant"][plant_id] = "stopped"
-                shared_data["measurements_filename_by_plant"][plant_id] = None
-                shared_data["current_file_df_by_plant"][plant_id] = pd.DataFrame()
-                shared_data["current_file_path_by_plant"][plant_id] = None
-                prev_observed = dict(observed_state_map.get(plant_id, {}) or {})
-                prev_observed.update(
-                    {
-                        "enable_state": None,
-                        "p_battery_kw": None,
-                        "q_battery_kvar": None,
-                        "last_attempt": None,
-                        "last_success": None,
-                        "error": None,
-                        "read_status": "unknown",
-                        "last_error": None,
-                        "consecutive_failures": 0,
-                        "stale": True,
-                    }
-                )
-                observed_state_map[plant_id] = prev_observed
-                plant_operating_state_map[plant_id] = "unknown"
-                dispatch_state = dict(dispatch_write_status_map.get(plant_id, {}) or {})
-                dispatch_state["sending_enabled"] = False
-                dispatch_write_status_map[plant_id] = dispatch_state
+                observed_state_map[plant_id] = {
+                    **(observed_state_map.get(plant_id) or {}),
+                    **_TRANSPORT_RESET_OBSERVED_STATE,
+                }
+                dispatch_write_status_map[plant_id] = {
+                    **(dispatch_write_status_map.get(plant_id) or {}),
+                    "sending_enabled": False,
+                }
             shared_data["transport_mode"] = requested_mode
             shared_data["transport_switching"] = False
         logging.info("Control flow: transport mode switched to %s", requested_mode)
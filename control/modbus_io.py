@@ -1,73 +1,147 @@
 """Control-path Modbus I/O helpers for engine control and safe-stop flows."""
 
 import logging
+import threading
 import time
 
 from pyModbusTCP.client import ModbusClient
+from pyModbusTCP.constants import MB_EXCEPT_ERR, MB_NO_ERR
 
-from modbus.codec import read_point_internal, write_point_internal
+from modbus.codec import read_point_internal, read_points_internal, write_point_internal, write_points_internal
+
+
+# Connected clients keyed by (host, port). A client is checked out while in use,
+# so concurrent callers never share a socket. pyModbusTCP reports socket errors
+# through ``last_error`` instead of raising, and ``is_open`` stays true on a socket
+# the device has dropped, so ``run_with_client`` closes a client whose request
+# failed with a transport error and retries once on a fresh connection.
+_client_pool_lock = threading.Lock()
+_client_pool = {}
+
+
+def _endpoint_key(endpoint_cfg):
+    return (endpoint_cfg["host"], endpoint_cfg["port"])
+
+
+def acquire_client(endpoint_cfg):
+    """Check out a connected client for the endpoint, or return None if it cannot connect."""
+    with _client_pool_lock:
+        client = _client_pool.pop(_endpoint_key(endpoint_cfg), None)
+    if client is not None and client.is_open:
+        return client
+    if client is None:
+        client = ModbusClient(host=endpoint_cfg["host"], port=endpoint_cfg["port"])
+    if client.open():
+        return client
+    _close_quietly(client)
+    return None
+
+
+def release_client(endpoint_cfg, client, *, healthy=True):
+    """Return a checked-out client to the pool, or close it after an error."""
+    if client is None:
+        return
+    if healthy:
+        with _client_pool_lock:
+            key = _endpoint_key(endpoint_cfg)
+            if key not in _client_pool:
+                _client_pool[key] = client
+                return
+    _close_quietly(client)
+
+
+def close_pooled_clients():
+    with _client_pool_lock:
+        clients = list(_client_pool.values())
+        _client_pool.clear()
+    for client in clients:
+        _close_quietly(client)
+
+
+def _close_quietly(client):
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+def _has_transport_error(client):
+    last_error = getattr(client, "last_error", MB_NO_ERR)
+    return bool(last_error) and last_error != MB_EXCEPT_ERR
+
+
+def run_with_client(endpoint_cfg, operation, failed=lambda result: not result):
+    """
+    Run ``operation(client)`` on a pooled client and return ``(connected, result)``.
+
+    When ``failed(result)`` is true and the client reports a transport error, that client is closed and the
+    operation runs once more on a fresh connection. ``connected`` is False if no connection could be opened;
+    exceptions from ``operation`` propagate after the client is closed.
+    """
+    for attempt in range(2):
+        client = acquire_client(endpoint_cfg)
+        if client is None:
+            return False, None
+        healthy = False
+        try:
+            result = operation(client)
+            healthy = not (failed(result) and _has_transport_error(client))
+        finally:
+            release_client(endpoint_cfg, client, healthy=healthy)
+        if healthy or attempt:
+            return True, result
 
 
 def set_enable(endpoint_cfg, plant_label, value):
-    client = ModbusClient(host=endpoint_cfg["host"], port=endpoint_cfg["port"])
     try:
-        if not client.open():
-            logging.warning(
-                "Control I/O: could not connect to %s (%s mode) for enable.",
-                plant_label,
-                endpoint_cfg["mode"],
-            )
-            return False
-        return bool(write_point_internal(client, endpoint_cfg, "enable", int(value)))
+        connected, ok = run_with_client(
+            endpoint_cfg,
+            lambda client: bool(write_point_internal(client, endpoint_cfg, "enable", int(value))),
+        )
     except Exception as exc:
         logging.error("Control I/O: enable write error (%s): %s", plant_label, exc)
         return False
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
+    if not connected:
+        logging.warning(
+            "Control I/O: could not connect to %s (%s mode) for enable.",
+            plant_label,
+            endpoint_cfg["mode"],
+        )
+        return False
+    return ok
 
 
 def send_setpoints(endpoint_cfg, plant_label, p_kw, q_kvar):
-    client = ModbusClient(host=endpoint_cfg["host"], port=endpoint_cfg["port"])
     try:
-        if not client.open():
-            logging.warning(
-                "Control I/O: could not connect to %s (%s mode) for setpoints.",
-                plant_label,
-                endpoint_cfg["mode"],
-            )
-            return False
-        p_ok = write_point_internal(client, endpoint_cfg, "p_setpoint", p_kw)
-        q_ok = write_point_internal(client, endpoint_cfg, "q_setpoint", q_kvar)
-        return bool(p_ok and q_ok)
+        connected, ok = run_with_client(
+            endpoint_cfg,
+            lambda client: bool(write_points_internal(client, endpoint_cfg, {"p_setpoint": p_kw, "q_setpoint": q_kvar})),
+        )
     except Exception as exc:
         logging.error("Control I/O: setpoint write error (%s): %s", plant_label, exc)
         return False
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
+    if not connected:
+        logging.warning(
+            "Control I/O: could not connect to %s (%s mode) for setpoints.",
+            plant_label,
+            endpoint_cfg["mode"],
+        )
+        return False
+    return ok
 
 
 def read_enable_state(endpoint_cfg):
-    client = ModbusClient(host=endpoint_cfg["host"], port=endpoint_cfg["port"])
     try:
-        if not client.open():
-            return None
-        value = read_point_internal(client, endpoint_cfg, "enable")
-        if value is None:
-            return None
-        return int(value)
+        _, value = run_with_client(
+            endpoint_cfg,
+            lambda client: read_point_internal(client, endpoint_cfg, "enable"),
+            failed=lambda result: result is None,
+        )
     except Exception:
         return None
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
+    if value is None:
+        return None
+    return int(value)
 
 
 def wait_until_battery_power_below_threshold(
@@ -80,9 +154,13 @@ def wait_until_battery_power_below_threshold(
     started_at = time.monotonic()
     deadline = time.time() + timeout_s
     while time.time() < deadline:
-        client = ModbusClient(host=endpoint_cfg["host"], port=endpoint_cfg["port"])
         try:
-            if not client.open():
+            connected, battery_values = run_with_client(
+                endpoint_cfg,
+                lambda client: read_points_internal(client, endpoint_cfg, ["p_battery", "q_battery"]),
+                failed=lambda values: any(value is None for value in values.values()),
+            )
+            if not connected:
                 if fail_fast_on_connect_failure:
                     logging.warning(
                         "Control I/O: power decay wait fail-fast on connect failure (%s mode, %s:%s) after %.2fs.",
@@ -93,8 +171,8 @@ def wait_until_battery_power_below_threshold(
                     )
                     return False
             else:
-                p_kw = read_point_internal(client, endpoint_cfg, "p_battery")
-                q_kvar = read_point_internal(client, endpoint_cfg, "q_battery")
+                p_kw = battery_values["p_battery"]
+                q_kvar = battery_values["q_battery"]
                 if p_kw is not None and q_kvar is not None:
                     if abs(p_kw) < threshold_kw and abs(q_kvar) < threshold_kw:
                         logging.info(
@@ -106,11 +184,6 @@ def wait_until_battery_power_below_threshold(
                         return True
         except Exception:
             pass
-        finally:
-            try:
-                client.close()
-            except Exception:
-                pass
         time.sleep(1.0)
     logging.warning(
         "Control I/O: power decay wait timed out after %.2fs (threshold=%.3f).",
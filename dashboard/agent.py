@@ -6,12 +6,15 @@ import math
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 import dash
 import pandas as pd
 import plotly.graph_objects as go
-from dash import ALL, Dash, Input, Output, State, callback_context, dcc, html
+from dash import ALL, Dash, Input, Output, Patch, State, callback_context, dcc, html, no_update
 from dash.exceptions import PreventUpdate
 
 from control.command_runtime import enqueue_control_command
@@ -30,25 +33,48 @@ from dashboard.control_health import (
 from dashboard.history import (
     build_slider_marks,
     clamp_epoch_range,
+    history_file_spans,
     load_cropped_measurements_for_range,
     scan_measurement_history_index,
     serialize_measurements_for_download,
 )
 from dashboard.layout import build_dashboard_layout
-from dashboard.logs import get_logs_dir, get_today_log_file_path, parse_and_format_historical_logs, read_log_tail
+from dashboard.logs import (
+    build_log_file_options,
+    get_logs_dir,
+    get_today_log_file_path,
+    list_historical_log_files,
+    parse_and_format_historical_logs,
+    read_log_tail,
+)
 from dashboard.plotting import (
     DEFAULT_PLOT_THEME,
     DEFAULT_TRACE_COLORS,
+    HISTORY_MAX_MEASUREMENT_ROWS,
     apply_figure_theme,
+    build_history_timeline_traces,
     create_plant_figure,
     create_manual_series_figure,
+    figure_revision_factory,
+    move_time_indicator,
+    numeric_column_values,
+    same_figure_inputs,
+    step_change_rows,
+    time_indicator_patch,
+    time_indicator_shape_indexes,
+    wall_clock_time_values,
 )
 from dashboard.ui_state import (
+    binary_toggle_classes,
+    diff_editor_rows,
     get_plant_power_toggle_state,
     get_recording_toggle_state,
     is_observed_state_effectively_stale,
+    output_group_slices,
     resolve_click_feedback_transition_state,
     resolve_runtime_transition_state,
+    skip_unchanged_output_groups,
+    skip_unchanged_outputs,
 )
 from dashboard.settings_ui_state import (
     api_connection_controls_state,
@@ -60,13 +86,95 @@ from dashboard.settings_ui_state import (
     resolve_command_click_feedback_state,
 )
 import scheduling.manual_schedule_manager as msm
-from measurement.storage import MEASUREMENT_COLUMNS
+from measurement.storage import MEASUREMENT_COLUMNS, latest_measurement_row
 from runtime.contracts import sanitize_plant_name
 from runtime.paths import get_assets_dir, get_data_dir, get_project_root
 from scheduling.runtime import build_effective_schedule_frame
 from settings.command_runtime import enqueue_settings_command
 from runtime.shared_state import snapshot_locked
-from time_utils import get_config_tz, normalize_datetime_series, normalize_schedule_index, normalize_timestamp_value, now_tz
+from time_utils import get_config_tz, normalize_schedule_index, normalize_timestamp_value, now_tz
+
+
+# Read-only fallback for per-key status lookups that are only inspected, never mutated.
+_EMPTY_MAP = MappingProxyType({})
+_METRIC_LABELS = {"soc": "SoC", "p": "P", "q": "Q", "v": "V"}
+_STATUS_CONTROL_BUTTONS = ("start", "stop", "dispatch-enable", "dispatch-disable", "record", "record-stop")
+# update_status_and_graphs outputs as (skip group, component id, prop). Grouped outputs are skipped while unchanged
+# for a browser; each control button is its own group so one transition only resends that button's props.
+_STATUS_OUTPUTS = (
+    ("inline", "api-status-inline", "children"),
+    ("inline", "control-engine-status-inline", "children"),
+    ("inline", "control-queue-status-inline", "children"),
+    ("summary", "operator-plant-summary-table", "children"),
+    (None, "status-lib", "children"),
+    (None, "status-vrfb", "children"),
+    (None, "graph-lib", "figure"),
+    (None, "graph-vrfb", "figure"),
+    *(
+        (f"{button}-{plant_id}", f"{button}-{plant_id}", prop)
+        for plant_id in ("lib", "vrfb")
+        for button in _STATUS_CONTROL_BUTTONS
+        for prop in ("children", "className", "disabled")
+    ),
+    (None, "status-graph-revision-store", "data"),
+    (None, "status-output-fingerprint-store", "data"),
+)
+_STATUS_OUTPUT_GROUPS = output_group_slices(_STATUS_OUTPUTS)
+# Plant power buttons that open the toggle confirm modal, with the side they request.
+_PLANT_POWER_CONFIRM_TRIGGERS = {
+    "start-lib": ("lib", "positive"),
+    "stop-lib": ("lib", "negative"),
+    "start-vrfb": ("vrfb", "positive"),
+    "stop-vrfb": ("vrfb", "negative"),
+}
+# (start, stop) slices of update_api_tab outputs that are skipped while unchanged for a browser.
+_API_TAB_OUTPUT_GROUPS = {"status": (0, 1), "posting": (1, 2)}
+_API_PREVIEW_LAYOUT = {"height": 340, "margin": {"l": 40, "r": 20, "t": 40, "b": 30}, "uirevision": "api-preview"}
+
+
+@lru_cache(maxsize=256)
+def _format_ts_cached(value, tz):
+    ts = normalize_timestamp_value(value, tz)
+    if pd.isna(ts):
+        return None
+    return ts.strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
+def _format_ts(value, tz):
+    # Posting status timestamps repeat across polls until the next post, so hashable values hit the cache.
+    if value is None or isinstance(value, (str, int, float, datetime)):
+        return _format_ts_cached(value, tz)
+    ts = normalize_timestamp_value(value, tz)
+    if pd.isna(ts):
+        return None
+    return ts.strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
+def _format_value(value):
+    try:
+        return f"{float(value):.3f}"
+    except (TypeError, ValueError):
+        return "n/a"
+
+
+def _metric_label(metric):
+    return _METRIC_LABELS.get(str(metric).lower(), str(metric).upper())
+
+
+def _parse_trigger_id(prop_id):
+    if not prop_id:
+        return None
+    raw = str(prop_id).split(".")[0]
+    if raw.startswith("{") and raw.endswith("}"):
+        try:
+            return json.loads(raw)
+        except Exception:
+            return raw
+    return raw
+
+
+def _command_status_action_token(status):
+    return f"{status.get('kind')}:{status.get('id')}:{status.get('state')}"
 
 
 def dashboard_agent(config, shared_data):
@@ -112,10 +220,26 @@ def dashboard_agent(config, shared_data):
     ui_transition_feedback_hold_s = 2.0
     ui_confirm_toggle_min_hold_s = max(ui_transition_feedback_hold_s, float(config["MEASUREMENT_PERIOD_S"]))
     ui_confirm_toggle_max_hold_s = max(6.0, ui_confirm_toggle_min_hold_s + float(config["MEASUREMENT_PERIOD_S"]))
+    manual_figure_static_by_key = {
+        series_key: (
+            f"{meta['label']} (Manual Override)",
+            meta["unit"],
+            trace_colors["p_setpoint"] if meta["signal"] == "p" else trace_colors["q_setpoint"],
+            f"manual-{series_key}",
+        )
+        for series_key, meta in msm.MANUAL_SERIES_META.items()
+    }
 
-    def plant_name(plant_id):
+    def _resolve_plant_name(plant_id):
         return str((plants_cfg.get(plant_id, {}) or {}).get("name", plant_id.upper()))
 
+    plant_name_by_id = {plant_id: _resolve_plant_name(plant_id) for plant_id in plant_ids}
+    plant_suffix_by_id = {plant_id: sanitize_plant_name(plant_name_by_id[plant_id], plant_id) for plant_id in plant_ids}
+
+    def plant_name(plant_id):
+        name = plant_name_by_id.get(plant_id)
+        return name if name is not None else _resolve_plant_name(plant_id)
+
     def _voltage_padding_kv_for_plant(plant_id):
         plant_cfg = (plants_cfg.get(plant_id, {}) or {})
         model_cfg = (plant_cfg.get("model", {}) or {})
@@ -146,25 +270,53 @@ def dashboard_agent(config, shared_data):
         add_minutes = 10 - minute_mod if minute_mod != 0 else 10
         return base + pd.Timedelta(minutes=add_minutes)
 
-    def _sync_manual_draft_shared_state_locked(data, *, now_value=None):
-        manual_series_map = dict(data.get("manual_schedule_draft_series_df_by_key", {}))
-        for key in msm.MANUAL_SERIES_KEYS:
-            manual_series_map.setdefault(key, pd.DataFrame(columns=["setpoint"]))
-        window_start, window_end = _manual_window_bounds(now_value=now_value)
-        pruned_series_map = msm.prune_manual_series_map_to_window(manual_series_map, tz, window_start, window_end)
-        data["manual_schedule_draft_series_df_by_key"] = pruned_series_map
+    def _sync_manual_draft_shared_state(update_series_map=None, *, now_value=None):
+        # The draft map is copy-on-write: prune outside the lock, then publish only if no other writer swapped it.
+        while True:
+            current_map = snapshot_locked(shared_data, lambda data: data.get("manual_schedule_draft_series_df_by_key"))
+            manual_series_map = dict(current_map or {})
+            if update_series_map is not None:
+                update_series_map(manual_series_map)
+            for key in msm.MANUAL_SERIES_KEYS:
+                manual_series_map.setdefault(key, pd.DataFrame(columns=["setpoint"]))
+            window_start, window_end = _manual_window_bounds(now_value=now_value)
+            pruned_series_map = msm.prune_manual_series_map_to_window(manual_series_map, tz, window_start, window_end)
+            with shared_data["lock"]:
+                if shared_data.get("manual_schedule_draft_series_df_by_key") is current_map:
+                    shared_data["manual_schedule_draft_series_df_by_key"] = pruned_series_map
+                    return pruned_series_map
 
     def _set_manual_series_from_editor(series_key, rows, start_dt):
         if series_key not in msm.MANUAL_SERIES_KEYS:
             raise ValueError("Invalid manual schedule selector")
         series_df = msm.manual_editor_rows_to_series_df(rows, start_dt, timezone_name=config.get("TIMEZONE_NAME"))
-        with shared_data["lock"]:
-            _sync_manual_draft_shared_state_locked(shared_data)
-            series_map = dict(shared_data.get("manual_schedule_draft_series_df_by_key", {}))
+
+        def _apply_editor_series(series_map):
             series_map[series_key] = series_df
-            shared_data["manual_schedule_draft_series_df_by_key"] = series_map
-            _sync_manual_draft_shared_state_locked(shared_data)
-        return series_df
+
+        # Return the frame as published (pruned to the window), not the unpruned editor frame.
+        return _sync_manual_draft_shared_state(_apply_editor_series)[series_key]
+
+    # Last editor state written to the shared draft per series, with the stored frame it produced.
+    persisted_manual_editor_by_key = {}
+
+    # Last status-tab figure per plant with the inputs it was built from; reused while the inputs are unchanged.
+    # Revisions let each browser tell the callback which cached figure it already shows.
+    status_figure_cache_by_plant = {}
+    next_figure_revision = figure_revision_factory()
+
+    # Status plots span today and tomorrow, so the window only moves at local midnight.
+    status_window_by_day = {}
+
+    def _status_window(now_value):
+        day = now_value.date()
+        window = status_window_by_day.get(day)
+        if window is None:
+            window_start = now_value.replace(hour=0, minute=0, second=0, microsecond=0)
+            window = (window_start, window_start + timedelta(days=2))
+            status_window_by_day.clear()
+            status_window_by_day[day] = window
+        return window
 
     def _get_manual_series_snapshot():
         return snapshot_locked(
@@ -172,8 +324,8 @@ def dashboard_agent(config, shared_data):
             lambda data: {
                 "draft_series_map": dict(data.get("manual_schedule_draft_series_df_by_key", {})),
                 "runtime_state": dict(data.get("manual_series_runtime_state_by_key", {})),
-                "applied_series_map": dict(data.get("manual_schedule_series_df_by_key", {})),
-                "merge_enabled": dict(data.get("manual_schedule_merge_enabled_by_key", {})),
+                "applied_series_map": data.get("manual_schedule_series_df_by_key", {}),
+                "merge_enabled": data.get("manual_schedule_merge_enabled_by_key", {}),
             },
         )
 
@@ -199,20 +351,6 @@ def dashboard_agent(config, shared_data):
         start_dt = pd.Timestamp(date_value).replace(hour=hour, minute=minute, second=second, microsecond=0)
         return normalize_timestamp_value(start_dt, tz)
 
-    def _parse_trigger_id(prop_id):
-        if not prop_id:
-            return None
-        raw = str(prop_id).split(".")[0]
-        if raw.startswith("{") and raw.endswith("}"):
-            try:
-                return json.loads(raw)
-            except Exception:
-                return raw
-        return raw
-
-    def _command_status_action_token(status):
-        return f"{status.get('kind')}:{status.get('id')}:{status.get('state')}"
-
     def _enqueue_dashboard_control_intent(intent, *, trigger_id=None):
         status = enqueue_control_command(
             shared_data,
@@ -256,18 +394,6 @@ def dashboard_agent(config, shared_data):
         )
         return status
 
-    def _binary_toggle_classes(active_side, *, semantic=True):
-        positive = ["toggle-option"]
-        negative = ["toggle-option"]
-        if semantic:
-            positive.append("toggle-option--positive")
-            negative.append("toggle-option--negative")
-        if active_side == "positive":
-            positive.append("active")
-        elif active_side == "negative":
-            negative.append("active")
-        return " ".join(positive), " ".join(negative)
-
     def _toggle_confirm_request_for_transport(*, requested_side):
         side = "positive" if str(requested_side) == "positive" else "negative"
         requested_mode = "local" if side == "positive" else "remote"
@@ -306,6 +432,7 @@ def dashboard_agent(config, shared_data):
         current_server_state=None,
         min_hold_s=None,
         max_hold_s=None,
+        now_ts=None,
     ):
         if not isinstance(action_data, dict):
             return None
@@ -317,7 +444,8 @@ def dashboard_agent(config, shared_data):
             ts_ms = int(action_data.get("timestamp_ms"))
         except (TypeError, ValueError):
             return None
-        now_ts = now_tz(config)
+        if now_ts is None:
+            now_ts = now_tz(config)
         age_s = (float(now_ts.timestamp()) * 1000.0 - float(ts_ms)) / 1000.0
         if age_s < 0:
             age_s = 0.0
@@ -385,32 +513,12 @@ def dashboard_agent(config, shared_data):
         if not isinstance(index_data, dict) or not index_data.get("has_data"):
             return _empty_history_timeline_figure("No historical measurements found.")
 
-        fig = go.Figure()
         color_by_plant = {"lib": trace_colors["api_lib"], "vrfb": trace_colors["api_vrfb"]}
         label_by_plant = {"lib": plant_name("lib"), "vrfb": plant_name("vrfb")}
-
-        for plant_id in plant_ids:
-            for item in (index_data.get("files_by_plant", {}) or {}).get(plant_id, []):
-                start_ts = _epoch_ms_to_ts(item.get("start_ms"))
-                end_ts = _epoch_ms_to_ts(item.get("end_ms"))
-                if pd.isna(start_ts) or pd.isna(end_ts):
-                    continue
-                fig.add_trace(
-                    go.Scatter(
-                        x=[start_ts, end_ts],
-                        y=[label_by_plant.get(plant_id, plant_id.upper())] * 2,
-                        mode="lines",
-                        line=dict(color=color_by_plant.get(plant_id, plot_theme["muted"]), width=8),
-                        name=label_by_plant.get(plant_id, plant_id.upper()),
-                        legendgroup=plant_id,
-                        showlegend=not any(t.legendgroup == plant_id for t in fig.data),
-                        hovertemplate=(
-                            f"{label_by_plant.get(plant_id, plant_id.upper())}<br>"
-                            f"{os.path.basename(str(item.get('path', '')))}<br>"
-                            "Start: %{x|%Y-%m-%d %H:%M:%S}<extra></extra>"
-                        ),
-                    )
-                )
+        file_spans = history_file_spans(index_data.get("files_by_plant"), plant_ids, tz)
+        fig = go.Figure(
+            data=build_history_timeline_traces(file_spans, label_by_plant, color_by_plant, plot_theme["muted"])
+        )
 
         if selected_range and len(selected_range) == 2:
             try:
@@ -459,6 +567,8 @@ def dashboard_agent(config, shared_data):
         fig.add_annotation(text=message, xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         return fig
 
+    history_load_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard-history")
+
     def _load_history_df_for_plant(index_data, plant_id, selected_range):
         if not isinstance(index_data, dict) or not index_data.get("has_data"):
             return pd.DataFrame(columns=MEASUREMENT_COLUMNS)
@@ -485,7 +595,7 @@ def dashboard_agent(config, shared_data):
     with shared_data["lock"]:
         if "manual_schedule_draft_series_df_by_key" not in shared_data:
             shared_data["manual_schedule_draft_series_df_by_key"] = msm.default_manual_series_map()
-        _sync_manual_draft_shared_state_locked(shared_data)
+    _sync_manual_draft_shared_state()
 
     app.layout = build_dashboard_layout(
         config,
@@ -568,9 +678,18 @@ def dashboard_agent(config, shared_data):
             Input("control-action", "data"),
             Input("toggle-confirm-action", "data"),
         ],
+        [
+            State("transport-mode-selector", "data"),
+            State("transport-local-btn", "children"),
+            State("transport-local-btn", "className"),
+            State("transport-local-btn", "disabled"),
+            State("transport-remote-btn", "children"),
+            State("transport-remote-btn", "className"),
+            State("transport-remote-btn", "disabled"),
+        ],
         prevent_initial_call=False,
     )
-    def render_transport_toggle(_n_intervals, _control_action, toggle_confirm_action):
+    def render_transport_toggle(_n_intervals, _control_action, toggle_confirm_action, *current_props):
         with shared_data["lock"]:
             stored_mode = str(shared_data.get("transport_mode", "local") or "local")
             transport_switching = bool(shared_data.get("transport_switching", False))
@@ -592,8 +711,8 @@ def dashboard_agent(config, shared_data):
                 active_side = "negative"
                 local_label = "Local"
                 remote_label = "Switching to Remote..."
-            local_class, remote_class = _binary_toggle_classes(active_side, semantic=False)
-            return (
+            local_class, remote_class = binary_toggle_classes(active_side, semantic=False)
+            outputs = (
                 "local" if active_side == "positive" else "remote",
                 local_label,
                 local_class,
@@ -602,12 +721,13 @@ def dashboard_agent(config, shared_data):
                 remote_class,
                 True,
             )
+            return skip_unchanged_outputs(outputs, current_props, no_update)
 
         active_side = "negative" if stored_mode == "remote" else "positive"
-        local_class, remote_class = _binary_toggle_classes(active_side, semantic=False)
+        local_class, remote_class = binary_toggle_classes(active_side, semantic=False)
         local_disabled = bool(transport_switching or stored_mode == "local")
         remote_disabled = bool(transport_switching or stored_mode == "remote")
-        return (
+        outputs = (
             stored_mode,
             "Local",
             local_class,
@@ -616,6 +736,8 @@ def dashboard_agent(config, shared_data):
             remote_class,
             remote_disabled,
         )
+        # Toggle props only change on transitions; leave unchanged ones out of the response.
+        return skip_unchanged_outputs(outputs, current_props, no_update)
 
     @app.callback(
         [
@@ -631,11 +753,8 @@ def dashboard_agent(config, shared_data):
             Input("stop-lib", "n_clicks"),
             Input("start-vrfb", "n_clicks"),
             Input("stop-vrfb", "n_clicks"),
-            Input("toggle-confirm-cancel", "n_clicks"),
-            Input("toggle-confirm-confirm", "n_clicks"),
         ],
-        [State("toggle-confirm-request", "data")],
-        prevent_initial_call=False,
+        prevent_initial_call=True,
     )
     def handle_toggle_confirm_modal(
         _transport_local_clicks,
@@ -644,47 +763,48 @@ def dashboard_agent(config, shared_data):
         _stop_lib_clicks,
         _start_vrfb_clicks,
         _stop_vrfb_clicks,
-        _cancel_clicks,
-        _confirm_clicks,
-        current_request,
     ):
         ctx = callback_context
-        hidden_class = "modal-overlay hidden"
-        open_class = "modal-overlay"
-        default_title = "Confirm Action"
-        default_text = ""
-
         if not ctx.triggered:
-            return hidden_class, default_title, default_text, None
+            raise PreventUpdate
+        open_class = "modal-overlay"
 
         trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        if trigger_id in {"toggle-confirm-cancel", "toggle-confirm-confirm"}:
-            return hidden_class, default_title, default_text, None
-
-        with shared_data["lock"]:
-            stored_mode = str(shared_data.get("transport_mode", "local") or "local")
-
         if trigger_id in {"transport-local-btn", "transport-remote-btn"}:
             requested_side = "positive" if trigger_id == "transport-local-btn" else "negative"
             requested_mode = "local" if requested_side == "positive" else "remote"
+            with shared_data["lock"]:
+                stored_mode = str(shared_data.get("transport_mode", "local") or "local")
             if requested_mode == stored_mode:
-                return hidden_class, default_title, default_text, current_request
+                # The modal is already closed and the request unchanged; nothing to send back.
+                raise PreventUpdate
             req = _toggle_confirm_request_for_transport(requested_side=requested_side)
             return open_class, req["title"], req["message"], req
 
-        plant_trigger_map = {
-            "start-lib": ("lib", "positive"),
-            "stop-lib": ("lib", "negative"),
-            "start-vrfb": ("vrfb", "positive"),
-            "stop-vrfb": ("vrfb", "negative"),
-        }
-        mapped = plant_trigger_map.get(trigger_id)
+        mapped = _PLANT_POWER_CONFIRM_TRIGGERS.get(trigger_id)
         if mapped:
             plant_id, requested_side = mapped
             req = _toggle_confirm_request_for_plant_power(plant_id=plant_id, requested_side=requested_side)
             return open_class, req["title"], req["message"], req
 
-        return hidden_class, default_title, default_text, current_request
+        raise PreventUpdate
+
+    # Opening the modal needs the server-side transport mode; closing it does not, so it happens in the browser.
+    app.clientside_callback(
+        """
+        function(cancelClicks, confirmClicks) {
+            return ["modal-overlay hidden", "Confirm Action", "", null];
+        }
+        """,
+        [
+            Output("toggle-confirm-modal", "className", allow_duplicate=True),
+            Output("toggle-confirm-modal-title", "children", allow_duplicate=True),
+            Output("toggle-confirm-modal-text", "children", allow_duplicate=True),
+            Output("toggle-confirm-request", "data", allow_duplicate=True),
+        ],
+        [Input("toggle-confirm-cancel", "n_clicks"), Input("toggle-confirm-confirm", "n_clicks")],
+        prevent_initial_call=True,
+    )
 
     @app.callback(
         [
@@ -702,9 +822,18 @@ def dashboard_agent(config, shared_data):
             Input("api-posting-enable-btn", "n_clicks_timestamp"),
             Input("api-posting-disable-btn", "n_clicks_timestamp"),
         ],
+        [
+            State("api-posting-toggle-store", "data"),
+            State("api-posting-enable-btn", "children"),
+            State("api-posting-enable-btn", "className"),
+            State("api-posting-disable-btn", "children"),
+            State("api-posting-disable-btn", "className"),
+            State("api-posting-enable-btn", "disabled"),
+            State("api-posting-disable-btn", "disabled"),
+        ],
         prevent_initial_call=False,
     )
-    def render_api_posting_toggle(_n_intervals, _action_token, enable_click_ts_ms, disable_click_ts_ms):
+    def render_api_posting_toggle(_n_intervals, _action_token, enable_click_ts_ms, disable_click_ts_ms, *current_props):
         config_default = bool(config.get("ISTENTORE_POST_MEASUREMENTS_IN_API_MODE", True))
         posting_runtime = snapshot_locked(
             shared_data,
@@ -723,8 +852,8 @@ def dashboard_agent(config, shared_data):
         display_state = posting_display_state(server_state, feedback_state)
         controls = posting_controls_state(display_state)
         visual_enabled = display_state in {"enabled", "enabling"}
-        enable_class, disable_class = _binary_toggle_classes("positive" if visual_enabled else "negative")
-        return (
+        enable_class, disable_class = binary_toggle_classes("positive" if visual_enabled else "negative")
+        outputs = (
             bool(policy_enabled),
             controls["enable_label"],
             enable_class,
@@ -733,6 +862,7 @@ def dashboard_agent(config, shared_data):
             bool(controls["enable_disabled"]),
             bool(controls["disable_disabled"]),
         )
+        return skip_unchanged_outputs(outputs, current_props, no_update)
 
     @app.callback(
         Output("posting-settings-action", "data"),
@@ -765,9 +895,17 @@ def dashboard_agent(config, shared_data):
             Input("set-password-btn", "n_clicks_timestamp"),
             Input("disconnect-api-btn", "n_clicks_timestamp"),
         ],
+        [
+            State("set-password-btn", "children"),
+            State("set-password-btn", "className"),
+            State("set-password-btn", "disabled"),
+            State("disconnect-api-btn", "children"),
+            State("disconnect-api-btn", "className"),
+            State("disconnect-api-btn", "disabled"),
+        ],
         prevent_initial_call=False,
     )
-    def render_api_connection_buttons(_n, _action_token, connect_click_ts_ms, disconnect_click_ts_ms):
+    def render_api_connection_buttons(_n, _action_token, connect_click_ts_ms, disconnect_click_ts_ms, *current_props):
         snapshot = snapshot_locked(
             shared_data,
             lambda data: {
@@ -786,8 +924,8 @@ def dashboard_agent(config, shared_data):
         display_state = api_connection_display_state(api_runtime.get("state"), feedback_state)
         controls = api_connection_controls_state(display_state)
         active_side = "positive" if display_state in {"connected", "connecting"} else "negative"
-        connect_class, disconnect_class = _binary_toggle_classes(active_side)
-        return (
+        connect_class, disconnect_class = binary_toggle_classes(active_side)
+        outputs = (
             controls["connect_label"],
             connect_class,
             bool(controls["connect_disabled"]),
@@ -795,6 +933,7 @@ def dashboard_agent(config, shared_data):
             disconnect_class,
             bool(controls["disconnect_disabled"]),
         )
+        return skip_unchanged_outputs(outputs, current_props, no_update)
 
     @app.callback(
         Output("api-connection-action", "data"),
@@ -813,7 +952,36 @@ def dashboard_agent(config, shared_data):
         status = _enqueue_dashboard_settings_intent(intent, trigger_id=trigger_id)
         return _command_status_action_token(status)
 
-    @app.callback(
+    # The fleet confirm modal only reflects which button was clicked, so it is toggled in the browser.
+    app.clientside_callback(
+        """
+        function(startAllClicks, stopAllClicks, cancelClicks, confirmClicks, currentRequest) {
+            var ctx = window.dash_clientside.callback_context;
+            var triggerId = ctx.triggered.length ? ctx.triggered[0].prop_id.split(".")[0] : null;
+            var hiddenClass = "modal-overlay hidden";
+            var defaultTitle = "Confirm Fleet Action";
+            if (triggerId === "start-all-btn") {
+                return [
+                    "modal-overlay",
+                    "Confirm Start All",
+                    "Start All will enable recording and start operation for both plants. Continue?",
+                    "start_all"
+                ];
+            }
+            if (triggerId === "stop-all-btn") {
+                return [
+                    "modal-overlay",
+                    "Confirm Stop All",
+                    "Stop All will safe-stop both plants and stop recording for both plants. Continue?",
+                    "stop_all"
+                ];
+            }
+            if (triggerId === "bulk-control-cancel") {
+                return [hiddenClass, defaultTitle, "", null];
+            }
+            return [hiddenClass, defaultTitle, "", currentRequest];
+        }
+        """,
         [
             Output("bulk-control-modal", "className"),
             Output("bulk-control-modal-title", "children"),
@@ -827,39 +995,8 @@ def dashboard_agent(config, shared_data):
             Input("bulk-control-confirm", "n_clicks"),
         ],
         [State("bulk-control-request", "data")],
-        prevent_initial_call=False,
+        prevent_initial_call=True,
     )
-    def handle_bulk_control_modal(start_all_clicks, stop_all_clicks, cancel_clicks, confirm_clicks, current_request):
-        ctx = callback_context
-        hidden_class = "modal-overlay hidden"
-        open_class = "modal-overlay"
-        default_title = "Confirm Fleet Action"
-        default_text = ""
-
-        if not ctx.triggered:
-            return hidden_class, default_title, default_text, current_request
-
-        trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        if trigger_id == "start-all-btn":
-            return (
-                open_class,
-                "Confirm Start All",
-                "Start All will enable recording and start operation for both plants. Continue?",
-                "start_all",
-            )
-        if trigger_id == "stop-all-btn":
-            return (
-                open_class,
-                "Confirm Stop All",
-                "Stop All will safe-stop both plants and stop recording for both plants. Continue?",
-                "stop_all",
-            )
-        if trigger_id == "bulk-control-cancel":
-            return hidden_class, default_title, default_text, None
-        if trigger_id == "bulk-control-confirm":
-            return hidden_class, default_title, default_text, current_request
-
-        return hidden_class, default_title, default_text, current_request
 
     @app.callback(
         [Output("control-action", "data"), Output("toggle-confirm-action", "data")],
@@ -976,6 +1113,7 @@ def dashboard_agent(config, shared_data):
             Input("manual-toggle-vrfb-q-enable-btn", "n_clicks_timestamp"),
             Input("manual-toggle-vrfb-q-disable-btn", "n_clicks_timestamp"),
             Input("manual-toggle-vrfb-q-update-btn", "n_clicks_timestamp"),
+            Input("main-tabs", "value"),
         ],
         prevent_initial_call=False,
     )
@@ -995,7 +1133,10 @@ def dashboard_agent(config, shared_data):
         vrfb_q_activate_ts,
         vrfb_q_inactivate_ts,
         vrfb_q_update_ts,
+        active_tab,
     ):
+        if active_tab != "manual":
+            raise PreventUpdate
         ts_map = {
             "lib_p": {"activate": lib_p_activate_ts, "inactivate": lib_p_inactivate_ts, "update": lib_p_update_ts},
             "lib_q": {"activate": lib_q_activate_ts, "inactivate": lib_q_inactivate_ts, "update": lib_q_update_ts},
@@ -1010,7 +1151,7 @@ def dashboard_agent(config, shared_data):
 
         outputs = []
         for key in ("lib_p", "lib_q", "vrfb_p", "vrfb_q"):
-            runtime = dict(runtime_state_map.get(key, {}) or {})
+            runtime = runtime_state_map.get(key) or _EMPTY_MAP
             server_state = str(runtime.get("state") or ("active" if runtime.get("active") else "inactive"))
             click_ts = ts_map.get(key, {})
             display_state = manual_series_display_state(
@@ -1042,7 +1183,7 @@ def dashboard_agent(config, shared_data):
             has_draft_rows = not msm.normalize_manual_series_df(draft_df, timezone_name=config.get("TIMEZONE_NAME")).empty
             is_dirty = _manual_series_is_dirty(key, draft_df, applied_df)
             control_state = manual_series_controls_state(display_state, has_draft_rows=has_draft_rows, is_dirty=is_dirty)
-            active_cls, inactive_cls = _binary_toggle_classes("positive" if bool(control_state["active_visual"]) else "negative")
+            active_cls, inactive_cls = binary_toggle_classes("positive" if bool(control_state["active_visual"]) else "negative")
             outputs.extend(
                 [
                     control_state["activate_label"],
@@ -1099,6 +1240,7 @@ def dashboard_agent(config, shared_data):
             Output("manual-graph-vrfb-q", "figure"),
         ],
         [
+            Input("main-tabs", "value"),
             Input("interval-component", "n_intervals"),
             Input("manual-editor-rows-store", "data"),
             Input("manual-editor-status-store", "data"),
@@ -1106,7 +1248,9 @@ def dashboard_agent(config, shared_data):
         ],
         prevent_initial_call=False,
     )
-    def update_manual_override_plots(*_):
+    def update_manual_override_plots(active_tab, *_):
+        if active_tab != "manual":
+            raise PreventUpdate
         snapshot = _get_manual_series_snapshot()
         draft_series_map = snapshot["draft_series_map"]
         applied_series_map = snapshot["applied_series_map"]
@@ -1114,20 +1258,19 @@ def dashboard_agent(config, shared_data):
         window_start, window_end = _manual_window_bounds()
 
         def fig_for(series_key):
-            meta = msm.MANUAL_SERIES_META[series_key]
-            is_p = meta["signal"] == "p"
+            title, unit_label, line_color, uirevision_key = manual_figure_static_by_key[series_key]
             return create_manual_series_figure(
-                title=f"{meta['label']} (Manual Override)",
-                unit_label=meta["unit"],
+                title=title,
+                unit_label=unit_label,
                 staged_series_df=draft_series_map.get(series_key, pd.DataFrame()),
                 applied_series_df=applied_series_map.get(series_key, pd.DataFrame()),
-                applied_enabled=bool(dict(runtime_state.get(series_key, {}) or {}).get("active", False)),
+                applied_enabled=bool((runtime_state.get(series_key) or _EMPTY_MAP).get("active", False)),
                 tz=tz,
                 plot_theme=plot_theme,
-                line_color=trace_colors["p_setpoint"] if is_p else trace_colors["q_setpoint"],
+                line_color=line_color,
                 x_window_start=window_start,
                 x_window_end=window_end,
-                uirevision_key=f"manual-{series_key}",
+                uirevision_key=uirevision_key,
             )
 
         return (
@@ -1151,9 +1294,7 @@ def dashboard_agent(config, shared_data):
     def load_manual_editor_for_selected_series(series_key):
         if series_key not in msm.MANUAL_SERIES_KEYS:
             series_key = "lib_p"
-        with shared_data["lock"]:
-            _sync_manual_draft_shared_state_locked(shared_data)
-            series_df = dict(shared_data.get("manual_schedule_draft_series_df_by_key", {})).get(series_key, pd.DataFrame())
+        series_df = _sync_manual_draft_shared_state().get(series_key, pd.DataFrame())
         start_ts, rows = msm.manual_series_df_to_editor_rows_and_start(series_df, timezone_name=config.get("TIMEZONE_NAME"))
         if start_ts is None or pd.isna(start_ts):
             start_ts = _round_up_to_next_10min(now_tz(config))
@@ -1306,9 +1447,9 @@ def dashboard_agent(config, shared_data):
             if not effective_upload_contents:
                 raise PreventUpdate
             try:
-                _, content_string = effective_upload_contents.split(",", 1)
-                csv_text = base64.b64decode(content_string).decode("utf-8")
-                loaded_rows = msm.load_manual_editor_rows_from_relative_csv_text(csv_text)
+                content_string = effective_upload_contents.partition(",")[2]
+                csv_bytes = base64.b64decode(content_string)
+                loaded_rows = msm.load_manual_editor_rows_from_relative_csv_text(csv_bytes)
                 display_name = upload_filename_state or "uploaded file"
                 return loaded_rows, None, f"Loaded CSV '{display_name}' into editor."
             except Exception as exc:
@@ -1392,7 +1533,19 @@ def dashboard_agent(config, shared_data):
                 new_rows[0]["hours"] = 0
                 new_rows[0]["minutes"] = 0
                 new_rows[0]["seconds"] = 0
-            return _sanitize_editor_rows(new_rows), dash.no_update, dash.no_update
+            new_rows = _sanitize_editor_rows(new_rows)
+            # Field edits only send the changed cells back to the store.
+            row_changes = diff_editor_rows(current_rows, new_rows)
+            if not row_changes:
+                # Structural changes, or edits normalized back to the stored rows, re-send the full list.
+                return new_rows, dash.no_update, dash.no_update
+            rows_patch = Patch()
+            for idx, field, value in row_changes:
+                if field is None:
+                    rows_patch[idx] = value
+                else:
+                    rows_patch[idx][field] = value
+            return rows_patch, dash.no_update, dash.no_update
 
         raise PreventUpdate
 
@@ -1583,11 +1736,31 @@ def dashboard_agent(config, shared_data):
         prevent_initial_call=True,
     )
     def persist_manual_editor_to_shared(rows, start_date, start_hour, start_minute, start_second, series_key):
+        editor_signature = (
+            tuple(
+                (row.get("hours"), row.get("minutes"), row.get("seconds"), row.get("setpoint"), row.get("kind"))
+                for row in (dict(row or {}) for row in (rows or []))
+            ),
+            start_date,
+            start_hour,
+            start_minute,
+            start_second,
+        )
+        last_persisted = persisted_manual_editor_by_key.get(series_key)
+        if last_persisted is not None and last_persisted[0] == editor_signature:
+            current_draft_df = snapshot_locked(
+                shared_data,
+                lambda data: (data.get("manual_schedule_draft_series_df_by_key", {}) or {}).get(series_key),
+            )
+            # Skip only while the shared draft is still the frame this editor state produced.
+            if current_draft_df is last_persisted[1]:
+                raise PreventUpdate
         try:
             start_dt = None
             if list(rows or []):
                 start_dt = _editor_start_to_datetime(start_date, start_hour, start_minute, start_second)
-            _set_manual_series_from_editor(series_key, rows or [], start_dt)
+            published_df = _set_manual_series_from_editor(series_key, rows or [], start_dt)
+            persisted_manual_editor_by_key[series_key] = (editor_signature, published_df)
             row_list = list(rows or [])
             value_count = sum(1 for row in row_list if str((row or {}).get("kind", "value")) != "end")
             has_end = any(str((row or {}).get("kind", "value")) == "end" for row in row_list)
@@ -1598,32 +1771,91 @@ def dashboard_agent(config, shared_data):
         except Exception as exc:
             return f"Manual editor validation failed: {exc}"
 
+    # Last rendered posting card per plant with the status entry it was built from; status entries are refreshed
+    # with new field values (nested dicts included), so equality means the card text is unchanged.
+    posting_card_cache_by_plant = {}
+    # Last API preview figure dict with the schedule frames it was drawn from and its revision.
+    api_preview_figure_cache = {}
+
+    def _api_preview_figure(api_map):
+        preview_inputs = tuple(api_map.get(plant_id) for plant_id in plant_ids)
+        cached_preview = api_preview_figure_cache.get("entry")
+        if cached_preview is not None and same_figure_inputs(cached_preview[0], preview_inputs):
+            return cached_preview[1], cached_preview[2]
+
+        colors = {"lib": trace_colors["api_lib"], "vrfb": trace_colors["api_vrfb"]}
+        traces = []
+        for plant_id in plant_ids:
+            df = normalize_schedule_index(api_map.get(plant_id, pd.DataFrame()), tz)
+            if df.empty:
+                continue
+            df = step_change_rows(df, "power_setpoint_kw")
+            traces.append(
+                go.Scatter(
+                    x=wall_clock_time_values(df.index),
+                    y=numeric_column_values(df, "power_setpoint_kw"),
+                    mode="lines",
+                    line_shape="hv",
+                    name=f"{plant_name(plant_id)} API P Setpoint",
+                    line=dict(color=colors.get(plant_id, plot_theme["muted"]), width=2),
+                )
+            )
+        fig = go.Figure(data=traces)
+
+        if not fig.data:
+            fig.add_annotation(text="No API schedule available.", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+
+        apply_figure_theme(fig, plot_theme, **_API_PREVIEW_LAYOUT)
+        fig.update_yaxes(title_text="kW")
+        fig = fig.to_dict()
+        revision = next_figure_revision("api")
+        api_preview_figure_cache["entry"] = (preview_inputs, fig, revision)
+        return fig, revision
+
     @app.callback(
         [
             Output("api-connection-status", "children"),
             Output("api-measurement-posting-status", "children"),
             Output("api-preview-graph", "figure"),
+            Output("api-tab-output-fingerprint-store", "data"),
         ],
         [
             Input("interval-component", "n_intervals"),
             Input("api-connection-action", "data"),
             Input("posting-settings-action", "data"),
+            Input("main-tabs", "value"),
         ],
+        State("api-tab-output-fingerprint-store", "data"),
     )
-    def update_api_tab(n_intervals, api_connection_action, posting_settings_action):
-        with shared_data["lock"]:
-            status = shared_data.get("data_fetcher_status", {}).copy()
-            api_password = shared_data.get("api_password")
-            api_connection_runtime = dict(shared_data.get("api_connection_runtime", {}) or {})
-            posting_runtime = dict(shared_data.get("posting_runtime", {}) or {})
-            api_map = {
-                plant_id: shared_data.get("api_schedule_df_by_plant", {}).get(plant_id, pd.DataFrame()).copy()
-                for plant_id in plant_ids
-            }
-            post_status_map = {
-                plant_id: dict((shared_data.get("measurement_post_status", {}) or {}).get(plant_id, {}) or {})
-                for plant_id in plant_ids
-            }
+    def update_api_tab(
+        n_intervals,
+        api_connection_action,
+        posting_settings_action,
+        active_tab,
+        output_fingerprint_by_group,
+    ):
+        if active_tab != "api":
+            raise PreventUpdate
+        snapshot = snapshot_locked(
+            shared_data,
+            lambda data: {
+                "status": dict(data.get("data_fetcher_status", {}) or {}),
+                "api_password": data.get("api_password"),
+                "api_connection_runtime": dict(data.get("api_connection_runtime", {}) or {}),
+                "posting_runtime": dict(data.get("posting_runtime", {}) or {}),
+                "api_map": dict(data.get("api_schedule_df_by_plant", {}) or {}),
+                "post_status_map": {
+                    plant_id: dict(status_entry or {})
+                    for plant_id, status_entry in (data.get("measurement_post_status", {}) or {}).items()
+                },
+            },
+        )
+        status = snapshot["status"]
+        api_password = snapshot["api_password"]
+        api_connection_runtime = snapshot["api_connection_runtime"]
+        posting_runtime = snapshot["posting_runtime"]
+        api_map = snapshot["api_map"]
+        post_status_map = snapshot["post_status_map"]
         auth_state = "Password stored" if api_password else "No stored password"
         posting_policy_enabled = bool(
             posting_runtime.get(
@@ -1653,47 +1885,39 @@ def dashboard_agent(config, shared_data):
         if api_error_text:
             status_text += f" | Error: {api_error_text}"
 
-        def format_ts(value):
-            ts = normalize_timestamp_value(value, tz)
-            if pd.isna(ts):
-                return None
-            return ts.strftime("%Y-%m-%d %H:%M:%S %Z")
-
-        def format_value(value):
-            try:
-                return f"{float(value):.3f}"
-            except (TypeError, ValueError):
-                return "n/a"
-
-        def metric_label(metric):
-            mapping = {"soc": "SoC", "p": "P", "q": "Q", "v": "V"}
-            return mapping.get(str(metric).lower(), str(metric).upper())
-
         def build_plant_posting_card(plant_id):
-            plant_status = post_status_map.get(plant_id, {})
+            plant_status = post_status_map.get(plant_id) or _EMPTY_MAP
+            cached = posting_card_cache_by_plant.get(plant_id)
+            if cached is not None and cached[0] == plant_status:
+                return cached[1]
+            card = _render_plant_posting_card(plant_id, plant_status)
+            posting_card_cache_by_plant[plant_id] = (plant_status, card)
+            return card
+
+        def _render_plant_posting_card(plant_id, plant_status):
             posting_enabled = bool(plant_status.get("posting_enabled", False))
 
-            last_success = plant_status.get("last_success") if isinstance(plant_status.get("last_success"), dict) else None
-            if last_success:
-                success_ts = format_ts(last_success.get("timestamp")) or "n/a"
-                success_meas_ts = format_ts(last_success.get("measurement_timestamp")) or "n/a"
+            last_success = plant_status.get("last_success")
+            if last_success and isinstance(last_success, dict):
+                success_ts = _format_ts(last_success.get("timestamp"), tz) or "n/a"
+                success_meas_ts = _format_ts(last_success.get("measurement_timestamp"), tz) or "n/a"
                 success_text = (
-                    f"Metric={metric_label(last_success.get('metric'))} "
+                    f"Metric={_metric_label(last_success.get('metric'))} "
                     f"Series={last_success.get('series_id')} "
-                    f"Value={format_value(last_success.get('value'))} | "
+                    f"Value={_format_value(last_success.get('value'))} | "
                     f"Measurement ts: {success_meas_ts} | Sent: {success_ts}"
                 )
             else:
                 success_text = "No successful post yet."
 
-            last_attempt = plant_status.get("last_attempt") if isinstance(plant_status.get("last_attempt"), dict) else None
-            if last_attempt:
-                attempt_ts = format_ts(last_attempt.get("timestamp")) or "n/a"
+            last_attempt = plant_status.get("last_attempt")
+            if last_attempt and isinstance(last_attempt, dict):
+                attempt_ts = _format_ts(last_attempt.get("timestamp"), tz) or "n/a"
                 attempt_result = str(last_attempt.get("result") or "unknown").upper()
                 attempt_text = (
-                    f"Metric={metric_label(last_attempt.get('metric'))} "
+                    f"Metric={_metric_label(last_attempt.get('metric'))} "
                     f"Series={last_attempt.get('series_id')} "
-                    f"Value={format_value(last_attempt.get('value'))} "
+                    f"Value={_format_value(last_attempt.get('value'))} "
                     f"Attempt={last_attempt.get('attempt')} "
                     f"Result={attempt_result} | At: {attempt_ts}"
                 )
@@ -1703,9 +1927,9 @@ def dashboard_agent(config, shared_data):
             else:
                 attempt_text = "No attempts yet."
 
-            last_error = plant_status.get("last_error") if isinstance(plant_status.get("last_error"), dict) else None
-            if last_error:
-                error_ts = format_ts(last_error.get("timestamp")) or "n/a"
+            last_error = plant_status.get("last_error")
+            if last_error and isinstance(last_error, dict):
+                error_ts = _format_ts(last_error.get("timestamp"), tz) or "n/a"
                 error_text = f"{error_ts}: {last_error.get('message')}"
             else:
                 error_text = "No errors."
@@ -1713,7 +1937,7 @@ def dashboard_agent(config, shared_data):
             pending_count = int(plant_status.get("pending_queue_count", 0) or 0)
             oldest_age_s = plant_status.get("oldest_pending_age_s")
             oldest_age_text = "n/a" if oldest_age_s is None else f"{oldest_age_s}s"
-            last_enqueue_text = format_ts(plant_status.get("last_enqueue")) or "n/a"
+            last_enqueue_text = _format_ts(plant_status.get("last_enqueue"), tz) or "n/a"
 
             return html.Div(
                 className="posting-card",
@@ -1739,83 +1963,23 @@ def dashboard_agent(config, shared_data):
             ],
         )
 
-        fig = go.Figure()
-        colors = {"lib": trace_colors["api_lib"], "vrfb": trace_colors["api_vrfb"]}
-        for plant_id in plant_ids:
-            df = normalize_schedule_index(api_map.get(plant_id, pd.DataFrame()), tz)
-            if df.empty:
-                continue
-            fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df.get("power_setpoint_kw", []),
-                    mode="lines",
-                    line_shape="hv",
-                    name=f"{plant_name(plant_id)} API P Setpoint",
-                    line=dict(color=colors.get(plant_id, plot_theme["muted"]), width=2),
-                )
-            )
-
-        if not fig.data:
-            fig.add_annotation(text="No API schedule available.", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-
-        apply_figure_theme(
-            fig,
-            plot_theme,
-            height=340,
-            margin=dict(l=40, r=20, t=40, b=30),
-            uirevision="api-preview",
+        # Status text and posting cards are skipped for a browser that already shows them; the preview is tracked
+        # by its revision since figure reprs elide long arrays.
+        outputs, output_fingerprints = skip_unchanged_output_groups(
+            [status_text, posting_cards],
+            _API_TAB_OUTPUT_GROUPS,
+            output_fingerprint_by_group,
+            no_update,
         )
-        fig.update_yaxes(title_text="kW")
-        return status_text, posting_cards, fig
+        preview_fig, preview_revision = _api_preview_figure(api_map)
+        output_fingerprints["preview"] = preview_revision
+        previous_fingerprints = output_fingerprint_by_group if isinstance(output_fingerprint_by_group, dict) else {}
+        outputs.append(no_update if previous_fingerprints.get("preview") == preview_revision else preview_fig)
+        outputs.append(output_fingerprints if output_fingerprints != previous_fingerprints else no_update)
+        return tuple(outputs)
 
     @app.callback(
-        [
-            Output("api-status-inline", "children"),
-            Output("control-engine-status-inline", "children"),
-            Output("control-queue-status-inline", "children"),
-            Output("operator-plant-summary-table", "children"),
-            Output("status-lib", "children"),
-            Output("status-vrfb", "children"),
-            Output("graph-lib", "figure"),
-            Output("graph-vrfb", "figure"),
-            Output("start-lib", "children"),
-            Output("start-lib", "className"),
-            Output("start-lib", "disabled"),
-            Output("stop-lib", "children"),
-            Output("stop-lib", "className"),
-            Output("stop-lib", "disabled"),
-            Output("dispatch-enable-lib", "children"),
-            Output("dispatch-enable-lib", "className"),
-            Output("dispatch-enable-lib", "disabled"),
-            Output("dispatch-disable-lib", "children"),
-            Output("dispatch-disable-lib", "className"),
-            Output("dispatch-disable-lib", "disabled"),
-            Output("record-lib", "children"),
-            Output("record-lib", "className"),
-            Output("record-lib", "disabled"),
-            Output("record-stop-lib", "children"),
-            Output("record-stop-lib", "className"),
-            Output("record-stop-lib", "disabled"),
-            Output("start-vrfb", "children"),
-            Output("start-vrfb", "className"),
-            Output("start-vrfb", "disabled"),
-            Output("stop-vrfb", "children"),
-            Output("stop-vrfb", "className"),
-            Output("stop-vrfb", "disabled"),
-            Output("dispatch-enable-vrfb", "children"),
-            Output("dispatch-enable-vrfb", "className"),
-            Output("dispatch-enable-vrfb", "disabled"),
-            Output("dispatch-disable-vrfb", "children"),
-            Output("dispatch-disable-vrfb", "className"),
-            Output("dispatch-disable-vrfb", "disabled"),
-            Output("record-vrfb", "children"),
-            Output("record-vrfb", "className"),
-            Output("record-vrfb", "disabled"),
-            Output("record-stop-vrfb", "children"),
-            Output("record-stop-vrfb", "className"),
-            Output("record-stop-vrfb", "disabled"),
-        ],
+        [Output(component_id, prop) for _group, component_id, prop in _STATUS_OUTPUTS],
         [
             Input("interval-component", "n_intervals"),
             Input("control-action", "data"),
@@ -1828,7 +1992,10 @@ def dashboard_agent(config, shared_data):
             Input("dispatch-disable-vrfb", "n_clicks_timestamp"),
             Input("record-vrfb", "n_clicks_timestamp"),
             Input("record-stop-vrfb", "n_clicks_timestamp"),
+            Input("main-tabs", "value"),
         ],
+        State("status-graph-revision-store", "data"),
+        State("status-output-fingerprint-store", "data"),
     )
     def update_status_and_graphs(
         n_intervals,
@@ -1842,6 +2009,9 @@ def dashboard_agent(config, shared_data):
         dispatch_disable_vrfb_click_ts_ms,
         record_vrfb_click_ts_ms,
         record_stop_vrfb_click_ts_ms,
+        active_tab,
+        graph_revision_by_plant,
+        output_fingerprint_by_group,
     ):
         with shared_data["lock"]:
             transport_mode = shared_data.get("transport_mode", "local")
@@ -1853,55 +2023,40 @@ def dashboard_agent(config, shared_data):
             dispatch_write_status_by_plant = dict(shared_data.get("dispatch_write_status_by_plant", {}))
             control_engine_status = dict(shared_data.get("control_engine_status", {}))
             status = shared_data.get("data_fetcher_status", {}).copy()
-            api_schedule_map = {
-                plant_id: shared_data.get("api_schedule_df_by_plant", {}).get(plant_id, pd.DataFrame()).copy()
-                for plant_id in plant_ids
-            }
-            manual_series_map = dict(shared_data.get("manual_schedule_series_df_by_key", {}))
-            manual_merge_enabled = dict(shared_data.get("manual_schedule_merge_enabled_by_key", {}))
-            measurements_map = {
-                plant_id: shared_data.get("current_file_df_by_plant", {}).get(plant_id, pd.DataFrame()).copy()
-                for plant_id in plant_ids
-            }
+            api_schedule_map = dict(shared_data.get("api_schedule_df_by_plant", {}))
+            # Applied manual maps are copy-on-write, so the published dicts can be shared as-is.
+            manual_series_map = shared_data.get("manual_schedule_series_df_by_key", {})
+            manual_merge_enabled = shared_data.get("manual_schedule_merge_enabled_by_key", {})
+            measurements_map = dict(shared_data.get("current_file_df_by_plant", {}))
 
         status_now = now_tz(config)
-        enable_state_by_plant = {}
         observed_effective_stale_by_plant = {}
+        runtime_state_by_plant = {}
         for plant_id in plant_ids:
-            observed = dict(observed_state_by_plant.get(plant_id, {}) or {})
-            effective_stale = is_observed_state_effectively_stale(
-                observed,
-                now_ts=status_now,
-            )
-            observed_effective_stale_by_plant[plant_id] = bool(effective_stale)
-            if effective_stale:
-                enable_state_by_plant[plant_id] = None
-            else:
-                enable_state_by_plant[plant_id] = observed.get("enable_state")
-        _engine_state_by_plant = {
-            plant_id: resolve_runtime_transition(
+            observed = observed_state_by_plant.get(plant_id) or _EMPTY_MAP
+            effective_stale = bool(is_observed_state_effectively_stale(observed, now_ts=status_now))
+            observed_effective_stale_by_plant[plant_id] = effective_stale
+            engine_state = resolve_runtime_transition(
                 plant_id,
                 transition_by_plant.get(plant_id, "unknown"),
-                enable_state_by_plant.get(plant_id),
+                None if effective_stale else observed.get("enable_state"),
             )
-            for plant_id in plant_ids
-        }
-        click_feedback_by_plant = {}
-        for plant_id in plant_ids:
             confirm_feedback = _toggle_action_feedback_state(
                 toggle_confirm_action,
                 toggle_key="plant_power",
                 resource_key=plant_id,
-                current_server_state=_engine_state_by_plant.get(plant_id, "unknown"),
+                current_server_state=engine_state,
                 min_hold_s=ui_confirm_toggle_min_hold_s,
                 max_hold_s=ui_confirm_toggle_max_hold_s,
+                now_ts=status_now,
             )
-            if not confirm_feedback:
-                click_feedback_by_plant[plant_id] = None
-                continue
-            click_feedback_by_plant[plant_id] = (
-                "starting" if str(confirm_feedback.get("requested_side")) == "positive" else "stopping"
-            )
+            if confirm_feedback:
+                # A pending power toggle shows its requested transition until the engine state catches up.
+                runtime_state_by_plant[plant_id] = (
+                    "starting" if str(confirm_feedback.get("requested_side")) == "positive" else "stopping"
+                )
+            else:
+                runtime_state_by_plant[plant_id] = engine_state
         record_click_feedback_by_plant = {
             "lib": resolve_click_feedback_transition_state(
                 start_click_ts_ms=record_lib_click_ts_ms,
@@ -1934,13 +2089,6 @@ def dashboard_agent(config, shared_data):
                 hold_seconds=ui_transition_feedback_hold_s,
             ),
         }
-        runtime_state_by_plant = {}
-        for plant_id in plant_ids:
-            pending_feedback_state = click_feedback_by_plant.get(plant_id)
-            if pending_feedback_state in {"starting", "stopping"}:
-                runtime_state_by_plant[plant_id] = pending_feedback_state
-                continue
-            runtime_state_by_plant[plant_id] = _engine_state_by_plant.get(plant_id, "unknown")
 
         api_inline = (
             f"API Connected: {bool(status.get('connected'))} | "
@@ -1980,19 +2128,7 @@ def dashboard_agent(config, shared_data):
             )
 
         def _latest_measurements_row(plant_id):
-            measurements_df = measurements_map.get(plant_id, pd.DataFrame())
-            if not isinstance(measurements_df, pd.DataFrame) or measurements_df.empty:
-                return {}
-            df_latest = measurements_df.copy()
-            if "timestamp" in df_latest.columns:
-                df_latest["__ts"] = normalize_datetime_series(df_latest["timestamp"], tz)
-                df_latest = df_latest.dropna(subset=["__ts"]).sort_values("__ts")
-                if df_latest.empty:
-                    return {}
-            try:
-                return dict(df_latest.iloc[-1].to_dict())
-            except Exception:
-                return {}
+            return latest_measurement_row(measurements_map.get(plant_id), tz)
 
         def _status_chip(plant_id):
             is_running = str(runtime_state_by_plant.get(plant_id, "unknown") or "unknown").lower() == "running"
@@ -2044,8 +2180,7 @@ def dashboard_agent(config, shared_data):
             ],
         )
 
-        status_window_start = status_now.replace(hour=0, minute=0, second=0, microsecond=0)
-        status_window_end = status_window_start + timedelta(days=2)
+        status_window_start, status_window_end = _status_window(status_now)
 
         def plant_status_text(plant_id):
             recording = recording_files.get(plant_id)
@@ -2060,7 +2195,7 @@ def dashboard_agent(config, shared_data):
             rec_text = f"Recording: On ({os.path.basename(recording)})" if recording else "Recording: Off"
             observed = dict(observed_state_by_plant.get(plant_id, {}) or {})
             observed["stale"] = effective_stale
-            dispatch_write_state = dict(dispatch_write_status_by_plant.get(plant_id, {}) or {})
+            dispatch_write_state = dispatch_write_status_by_plant.get(plant_id) or _EMPTY_MAP
             health_lines = summarize_plant_modbus_health(observed, status_now)
             dispatch_lines = summarize_dispatch_write_status(dispatch_write_state, dispatch_enabled=dispatch_enabled)
             rows = [
@@ -2076,10 +2211,26 @@ def dashboard_agent(config, shared_data):
             rows.extend(html.Div(text, className="status-text") for text in health_lines)
             return rows
 
-        effective_schedule_map = {}
-        for plant_id in plant_ids:
+        def _plant_figure(plant_id):
             p_key, q_key = msm.manual_series_keys_for_plant(plant_id)
-            effective_schedule_map[plant_id] = build_effective_schedule_frame(
+            figure_inputs = (
+                api_schedule_map.get(plant_id),
+                manual_series_map.get(p_key),
+                manual_series_map.get(q_key),
+                bool(manual_merge_enabled.get(p_key, False)),
+                bool(manual_merge_enabled.get(q_key, False)),
+                measurements_map.get(plant_id),
+                transport_mode,
+                status_window_start,
+            )
+            cached = status_figure_cache_by_plant.get(plant_id)
+            if cached is not None and same_figure_inputs(cached["inputs"], figure_inputs):
+                if client_graph_revisions.get(plant_id) == cached["revision"]:
+                    # This browser already shows this figure; only move the time indicator.
+                    return time_indicator_patch(cached["indicator_shape_indexes"], status_now), cached["revision"]
+                return move_time_indicator(cached["figure"], status_now), cached["revision"]
+
+            effective_schedule = build_effective_schedule_frame(
                 api_schedule_map.get(plant_id, pd.DataFrame()),
                 manual_series_map.get(p_key, pd.DataFrame()),
                 manual_series_map.get(q_key, pd.DataFrame()),
@@ -2087,37 +2238,38 @@ def dashboard_agent(config, shared_data):
                 manual_q_enabled=bool(manual_merge_enabled.get(q_key, False)),
                 tz=tz,
             )
+            figure = create_plant_figure(
+                plant_id,
+                plant_name,
+                normalize_schedule_index(effective_schedule, tz),
+                measurements_map.get(plant_id, pd.DataFrame()),
+                uirevision_key=f"{plant_id}:merged:{transport_mode}",
+                tz=tz,
+                plot_theme=plot_theme,
+                trace_colors=trace_colors,
+                x_window_start=status_window_start,
+                x_window_end=status_window_end,
+                time_indicator_ts=status_now,
+                voltage_autorange_padding_kv=_voltage_padding_kv_for_plant(plant_id),
+            ).to_dict()
+            revision = next_figure_revision()
+            status_figure_cache_by_plant[plant_id] = {
+                "inputs": figure_inputs,
+                "figure": figure,
+                "revision": revision,
+                "indicator_shape_indexes": time_indicator_shape_indexes(figure),
+            }
+            return figure, revision
 
-        lib_schedule = normalize_schedule_index(effective_schedule_map.get("lib", pd.DataFrame()), tz)
-        vrfb_schedule = normalize_schedule_index(effective_schedule_map.get("vrfb", pd.DataFrame()), tz)
-        lib_fig = create_plant_figure(
-            "lib",
-            plant_name,
-            lib_schedule,
-            measurements_map.get("lib", pd.DataFrame()),
-            uirevision_key=f"lib:merged:{transport_mode}",
-            tz=tz,
-            plot_theme=plot_theme,
-            trace_colors=trace_colors,
-            x_window_start=status_window_start,
-            x_window_end=status_window_end,
-            time_indicator_ts=status_now,
-            voltage_autorange_padding_kv=_voltage_padding_kv_for_plant("lib"),
-        )
-        vrfb_fig = create_plant_figure(
-            "vrfb",
-            plant_name,
-            vrfb_schedule,
-            measurements_map.get("vrfb", pd.DataFrame()),
-            uirevision_key=f"vrfb:merged:{transport_mode}",
-            tz=tz,
-            plot_theme=plot_theme,
-            trace_colors=trace_colors,
-            x_window_start=status_window_start,
-            x_window_end=status_window_end,
-            time_indicator_ts=status_now,
-            voltage_autorange_padding_kv=_voltage_padding_kv_for_plant("vrfb"),
-        )
+        client_graph_revisions = dict(graph_revision_by_plant or {})
+        if active_tab == "status":
+            lib_fig, lib_revision = _plant_figure("lib")
+            vrfb_fig, vrfb_revision = _plant_figure("vrfb")
+            graph_revisions = {"lib": lib_revision, "vrfb": vrfb_revision}
+        else:
+            # Hidden plots are brought up to date by the tab switch back to Status, which re-runs this callback.
+            lib_fig = vrfb_fig = no_update
+            graph_revisions = client_graph_revisions
 
         def _dispatch_toggle_state(dispatch_enabled, click_feedback_state=None):
             feedback = str(click_feedback_state or "").lower()
@@ -2155,9 +2307,9 @@ def dashboard_agent(config, shared_data):
             scheduler_running.get("lib", False),
             click_feedback_state=dispatch_click_feedback_by_plant.get("lib"),
         )
-        lib_power_classes = _binary_toggle_classes(lib_power_controls["active_side"])
-        lib_dispatch_classes = _binary_toggle_classes(lib_dispatch_controls["active_side"])
-        lib_record_classes = _binary_toggle_classes(lib_record_controls["active_side"])
+        lib_power_classes = binary_toggle_classes(lib_power_controls["active_side"])
+        lib_dispatch_classes = binary_toggle_classes(lib_dispatch_controls["active_side"])
+        lib_record_classes = binary_toggle_classes(lib_record_controls["active_side"])
 
         vrfb_power_controls = get_plant_power_toggle_state(runtime_state_by_plant.get("vrfb", "unknown"))
         vrfb_record_controls = get_recording_toggle_state(
@@ -2168,11 +2320,11 @@ def dashboard_agent(config, shared_data):
             scheduler_running.get("vrfb", False),
             click_feedback_state=dispatch_click_feedback_by_plant.get("vrfb"),
         )
-        vrfb_power_classes = _binary_toggle_classes(vrfb_power_controls["active_side"])
-        vrfb_dispatch_classes = _binary_toggle_classes(vrfb_dispatch_controls["active_side"])
-        vrfb_record_classes = _binary_toggle_classes(vrfb_record_controls["active_side"])
+        vrfb_power_classes = binary_toggle_classes(vrfb_power_controls["active_side"])
+        vrfb_dispatch_classes = binary_toggle_classes(vrfb_dispatch_controls["active_side"])
+        vrfb_record_classes = binary_toggle_classes(vrfb_record_controls["active_side"])
 
-        return (
+        outputs = [
             api_inline,
             control_engine_inline,
             control_queue_inline,
@@ -2217,7 +2369,17 @@ def dashboard_agent(config, shared_data):
             vrfb_record_controls["negative_label"],
             vrfb_record_classes[1],
             bool(vrfb_record_controls["negative_disabled"]),
+            graph_revisions if graph_revisions != client_graph_revisions else no_update,
+        ]
+        # Inline texts, the summary table and button props rarely change; skip groups this browser already shows.
+        outputs, output_fingerprints = skip_unchanged_output_groups(
+            outputs,
+            _STATUS_OUTPUT_GROUPS,
+            output_fingerprint_by_group,
+            no_update,
         )
+        outputs.append(output_fingerprints if output_fingerprints != output_fingerprint_by_group else no_update)
+        return tuple(outputs)
 
     @app.callback(
         [
@@ -2237,7 +2399,6 @@ def dashboard_agent(config, shared_data):
         if active_tab != "plots":
             raise PreventUpdate
 
-        plant_suffix_by_id = {plant_id: sanitize_plant_name(plant_name(plant_id), plant_id) for plant_id in plant_ids}
         index_data = scan_measurement_history_index(data_dir, plant_suffix_by_id, tz)
 
         if not index_data.get("has_data"):
@@ -2343,9 +2504,13 @@ def dashboard_agent(config, shared_data):
                 plot_theme=plot_theme,
                 trace_colors=trace_colors,
                 voltage_autorange_padding_kv=_voltage_padding_kv_for_plant(plant_id),
+                max_measurement_rows=HISTORY_MAX_MEASUREMENT_ROWS,
             )
 
-        return build_plant_fig("lib"), build_plant_fig("vrfb")
+        # The two plants load independent files; CSV parsing releases the GIL for much of the work.
+        lib_future = history_load_pool.submit(build_plant_fig, "lib")
+        vrfb_future = history_load_pool.submit(build_plant_fig, "vrfb")
+        return lib_future.result(), vrfb_future.result()
 
     def _download_history_csv_payload(plant_id, index_data, selected_range, range_meta):
         domain_start = (index_data or {}).get("global_start_ms")
@@ -2388,47 +2553,60 @@ def dashboard_agent(config, shared_data):
             raise PreventUpdate
         return _download_history_csv_payload("vrfb", index_data, selected_range, range_meta)
 
+    # Last log directory scan as ((logs_dir, today_path, dir mtime_ns), files); the listing only changes when files
+    # are created, renamed or removed, all of which bump the directory mtime.
+    log_file_scan_cache = {"entry": (None, [])}
+
+    def _scan_historical_log_files(logs_dir, today_path):
+        try:
+            mtime_ns = os.stat(logs_dir).st_mtime_ns
+        except OSError:
+            return []
+        key = (logs_dir, today_path, mtime_ns)
+        cached_key, cached_files = log_file_scan_cache["entry"]
+        if cached_key == key:
+            return cached_files
+        log_files = list_historical_log_files(logs_dir, exclude_path=today_path)
+        log_file_scan_cache["entry"] = (key, log_files)
+        return log_files
+
     @app.callback(
         Output("log-file-selector", "options"),
-        Input("interval-component", "n_intervals"),
+        [
+            Input("interval-component", "n_intervals"),
+            Input("main-tabs", "value"),
+            Input("log-file-selector", "search_value"),
+        ],
+        [State("log-file-selector", "options"), State("log-file-selector", "value")],
     )
-    def update_log_file_options(n_intervals):
-        options = [{"label": "Today", "value": "today"}]
+    def update_log_file_options(n_intervals, active_tab, search_value, current_options, selected_file):
+        if active_tab != "logs":
+            raise PreventUpdate
         logs_dir = get_logs_dir(project_dir)
-        today_path = os.path.abspath(get_today_log_file_path(project_dir, tz))
+        today_path = get_today_log_file_path(project_dir, tz)
         try:
-            if os.path.exists(logs_dir):
-                log_files = []
-                for filename in os.listdir(logs_dir):
-                    if not filename.endswith(".log"):
-                        continue
-                    full_path = os.path.join(logs_dir, filename)
-                    if os.path.abspath(full_path) == today_path:
-                        continue
-                    try:
-                        date_str = filename.split("_", 1)[0]
-                        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                        log_files.append((date_obj, date_obj.strftime("%Y-%m-%d"), full_path))
-                    except (ValueError, IndexError):
-                        log_files.append((None, filename, full_path))
-
-                dated = [item for item in log_files if item[0] is not None]
-                undated = [item for item in log_files if item[0] is None]
-                dated.sort(key=lambda item: item[0], reverse=True)
-                undated.sort(key=lambda item: item[1], reverse=True)
-
-                for _, display_name, full_path in dated + undated:
-                    options.append({"label": display_name, "value": full_path})
+            log_files = _scan_historical_log_files(logs_dir, today_path)
         except Exception as exc:
             logging.error("Dashboard: failed to scan log files: %s", exc)
+            log_files = []
+        # Only the newest files (or the search matches) are sent, so the dropdown stays small as logs accumulate.
+        options = build_log_file_options(log_files, search_value=search_value, selected_value=selected_file)
+        if options == current_options:
+            raise PreventUpdate
         return options
 
     @app.callback(
         [Output("logs-display", "children"), Output("log-file-path", "children")],
-        [Input("interval-component", "n_intervals"), Input("log-file-selector", "value")],
+        [
+            Input("interval-component", "n_intervals"),
+            Input("log-file-selector", "value"),
+            Input("main-tabs", "value"),
+        ],
         prevent_initial_call=False,
     )
-    def update_logs_display(n_intervals, selected_file):
+    def update_logs_display(n_intervals, selected_file, active_tab):
+        if active_tab != "logs":
+            raise PreventUpdate
         ctx = callback_context
         trigger_id = ctx.triggered[0]["prop_id"].split(".")[0] if ctx.triggered else None
         selected = selected_file or "today"
@@ -2449,8 +2627,9 @@ def dashboard_agent(config, shared_data):
             return formatted, f"File: {log_file_path}"
 
         try:
-            with open(selected, "r", encoding="utf-8", errors="replace") as handle:
-                file_content = handle.read()
+            if not os.path.isfile(selected):
+                raise FileNotFoundError(f"No such log file: '{selected}'")
+            file_content = read_log_tail(selected, max_lines=1000)
             formatted = parse_and_format_historical_logs(file_content)
             if not formatted:
                 formatted = [html.Div("No parseable log entries.", className="logs-empty")]
@@ -2469,9 +2648,9 @@ def dashboard_agent(config, shared_data):
     thread = threading.Thread(target=run_app, daemon=True)
     thread.start()
 
-    while not shared_data["shutdown_event"].is_set():
-        time.sleep(1)
+    shared_data["shutdown_event"].wait()
 
+    history_load_pool.shutdown(wait=False)
     logging.info("Dashboard agent stopped.")
 
 
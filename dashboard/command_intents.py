@@ -1,23 +1,25 @@
 """Pure helpers that map dashboard triggers to control-engine command intents."""
 
 
+# Trigger id -> (command kind, plant id) for the per-plant control buttons.
+_CONTROL_TRIGGER_ACTIONS = {
+    "start-lib": ("plant.start", "lib"),
+    "stop-lib": ("plant.stop", "lib"),
+    "dispatch-enable-lib": ("plant.dispatch_enable", "lib"),
+    "dispatch-disable-lib": ("plant.dispatch_disable", "lib"),
+    "record-lib": ("plant.record_start", "lib"),
+    "record-stop-lib": ("plant.record_stop", "lib"),
+    "start-vrfb": ("plant.start", "vrfb"),
+    "stop-vrfb": ("plant.stop", "vrfb"),
+    "dispatch-enable-vrfb": ("plant.dispatch_enable", "vrfb"),
+    "dispatch-disable-vrfb": ("plant.dispatch_disable", "vrfb"),
+    "record-vrfb": ("plant.record_start", "vrfb"),
+    "record-stop-vrfb": ("plant.record_stop", "vrfb"),
+}
+
+
 def command_intent_from_control_trigger(trigger_id, *, bulk_request=None):
     """Return normalized command intent dict for dashboard control triggers."""
-    action_map = {
-        "start-lib": ("plant.start", {"plant_id": "lib"}),
-        "stop-lib": ("plant.stop", {"plant_id": "lib"}),
-        "dispatch-enable-lib": ("plant.dispatch_enable", {"plant_id": "lib"}),
-        "dispatch-disable-lib": ("plant.dispatch_disable", {"plant_id": "lib"}),
-        "record-lib": ("plant.record_start", {"plant_id": "lib"}),
-        "record-stop-lib": ("plant.record_stop", {"plant_id": "lib"}),
-        "start-vrfb": ("plant.start", {"plant_id": "vrfb"}),
-        "stop-vrfb": ("plant.stop", {"plant_id": "vrfb"}),
-        "dispatch-enable-vrfb": ("plant.dispatch_enable", {"plant_id": "vrfb"}),
-        "dispatch-disable-vrfb": ("plant.dispatch_disable", {"plant_id": "vrfb"}),
-        "record-vrfb": ("plant.record_start", {"plant_id": "vrfb"}),
-        "record-stop-vrfb": ("plant.record_stop", {"plant_id": "vrfb"}),
-    }
-
     if trigger_id == "bulk-control-confirm":
         if bulk_request == "start_all":
             return {"kind": "fleet.start_all", "payload": {}}
@@ -25,11 +27,11 @@ def command_intent_from_control_trigger(trigger_id, *, bulk_request=None):
             return {"kind": "fleet.stop_all", "payload": {}}
         return None
 
-    mapped = action_map.get(trigger_id)
+    mapped = _CONTROL_TRIGGER_ACTIONS.get(trigger_id)
     if not mapped:
         return None
-    kind, payload = mapped
-    return {"kind": kind, "payload": dict(payload)}
+    kind, plant_id = mapped
+    return {"kind": kind, "payload": {"plant_id": plant_id}}
 
 
 def transport_switch_intent_from_confirm(trigger_id, *, stored_mode):
@@ -2,15 +2,25 @@
 
 import os
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
 
 from measurement.storage import MEASUREMENT_COLUMNS, load_file_for_cache
-from time_utils import normalize_timestamp_value, serialize_iso_with_tz
+from time_utils import normalize_timestamp_value, serialize_iso_series_with_tz
 
 
 _HISTORY_FILE_RE = re.compile(r"^\d{8}_(?P<suffix>[a-z0-9_-]+)\.csv$", re.IGNORECASE)
+_HISTORY_FRAME_CACHE_MAX_FILES = 8
+
+# Parsed history files keyed by absolute path; entries are reused while (mtime_ns, size, tz) match.
+# Index metadata is tiny and kept for every file; parsed frames are bounded LRU.
+_history_cache_lock = threading.Lock()
+_history_meta_cache = {}
+_history_frame_cache = OrderedDict()
 
 
 def _ts_to_epoch_ms(value: Any, tz) -> int | None:
@@ -24,6 +34,60 @@ def _epoch_ms_to_ts(value: Any, tz) -> pd.Timestamp:
     return normalize_timestamp_value(pd.to_datetime(int(value), unit="ms", utc=True), tz)
 
 
+def _history_file_signature(file_path, tz):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, getattr(tz, "key", str(tz)))
+
+
+def load_history_file_cached(file_path, tz):
+    """Return the normalized measurements frame for one history file, reusing unchanged parses.
+
+    Callers must treat the returned frame as read-only.
+    """
+    cache_key = os.path.abspath(file_path)
+    signature = _history_file_signature(file_path, tz)
+    if signature is not None:
+        with _history_cache_lock:
+            cached = _history_frame_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                _history_frame_cache.move_to_end(cache_key)
+                return cached[1]
+
+    df = load_file_for_cache(file_path, tz)
+    if signature is not None:
+        with _history_cache_lock:
+            _history_frame_cache[cache_key] = (signature, df)
+            _history_frame_cache.move_to_end(cache_key)
+            while len(_history_frame_cache) > _HISTORY_FRAME_CACHE_MAX_FILES:
+                _history_frame_cache.popitem(last=False)
+    return df
+
+
+def _history_file_meta(file_path, tz):
+    cache_key = os.path.abspath(file_path)
+    signature = _history_file_signature(file_path, tz)
+    if signature is not None:
+        with _history_cache_lock:
+            cached = _history_meta_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    df = load_history_file_cached(file_path, tz)
+    meta = None
+    if not df.empty and "timestamp" in df.columns:
+        start_ms = _ts_to_epoch_ms(df["timestamp"].min(), tz)
+        end_ms = _ts_to_epoch_ms(df["timestamp"].max(), tz)
+        if start_ms is not None and end_ms is not None:
+            meta = {"start_ms": int(start_ms), "end_ms": int(end_ms), "rows": int(len(df))}
+    if signature is not None:
+        with _history_cache_lock:
+            _history_meta_cache[cache_key] = (signature, meta)
+    return meta
+
+
 def scan_measurement_history_index(data_dir, plant_suffix_by_id, tz):
     """Scan measurement CSV files and return JSON-safe index metadata."""
     files_by_plant = {plant_id: [] for plant_id in plant_suffix_by_id}
@@ -52,23 +116,17 @@ def scan_measurement_history_index(data_dir, plant_suffix_by_id, tz):
         if not os.path.isfile(file_path):
             continue
 
-        df = load_file_for_cache(file_path, tz)
-        if df.empty or "timestamp" not in df.columns:
-            continue
-
-        start_ts = df["timestamp"].min()
-        end_ts = df["timestamp"].max()
-        start_ms = _ts_to_epoch_ms(start_ts, tz)
-        end_ms = _ts_to_epoch_ms(end_ts, tz)
-        if start_ms is None or end_ms is None:
+        meta = _history_file_meta(file_path, tz)
+        if meta is None:
             continue
 
-        rows = int(len(df))
+        start_ms = meta["start_ms"]
+        end_ms = meta["end_ms"]
         item = {
             "path": file_path,
-            "start_ms": int(start_ms),
-            "end_ms": int(end_ms),
-            "rows": rows,
+            "start_ms": start_ms,
+            "end_ms": end_ms,
+            "rows": meta["rows"],
         }
         files_by_plant[plant_id].append(item)
 
@@ -88,6 +146,31 @@ def scan_measurement_history_index(data_dir, plant_suffix_by_id, tz):
     }
 
 
+def history_file_spans(files_by_plant, plant_ids, tz):
+    """
+    Return ``(plant_id, item, start_ts, end_ts)`` for indexed files whose bounds are valid, in plant order.
+
+    All epoch-ms bounds are converted to timezone-aware timestamps in one vectorized pass.
+    """
+    files_by_plant = files_by_plant or {}
+    entries = [(plant_id, item) for plant_id in plant_ids for item in (files_by_plant.get(plant_id) or [])]
+    if not entries:
+        return []
+
+    def _bounds(key):
+        epoch_ms = pd.to_numeric(pd.Series([item.get(key) for _, item in entries], dtype=object), errors="coerce")
+        return pd.to_datetime(epoch_ms, unit="ms", utc=True).dt.tz_convert(tz)
+
+    starts = _bounds("start_ms")
+    ends = _bounds("end_ms")
+    valid = (starts.notna() & ends.notna()).to_numpy()
+    return [
+        (plant_id, item, starts.iat[idx], ends.iat[idx])
+        for idx, (plant_id, item) in enumerate(entries)
+        if valid[idx]
+    ]
+
+
 def clamp_epoch_range(selected, domain_min, domain_max):
     """Clamp or default a selected range to the slider domain."""
     if domain_min is None or domain_max is None:
@@ -125,12 +208,15 @@ def build_slider_marks(start_ms, end_ms, tz, max_marks=8):
     end_ms = int(end_ms)
     if end_ms < start_ms:
         start_ms, end_ms = end_ms, start_ms
+    # Bounds only move when history files change, so refresh ticks hit the cache.
+    return dict(_slider_mark_items(start_ms, end_ms, tz, max(2, int(max_marks or 8))))
+
 
+@lru_cache(maxsize=32)
+def _slider_mark_items(start_ms, end_ms, tz, count):
     if start_ms == end_ms:
-        label = _epoch_ms_to_ts(start_ms, tz).strftime("%m-%d %H:%M")
-        return {start_ms: label}
+        return ((start_ms, _epoch_ms_to_ts(start_ms, tz).strftime("%m-%d %H:%M")),)
 
-    count = max(2, int(max_marks or 8))
     span = end_ms - start_ms
     if span <= count - 1:
         values = list(range(start_ms, end_ms + 1))
@@ -141,11 +227,7 @@ def build_slider_marks(start_ms, end_ms, tz, max_marks=8):
             values.append(int(value))
         values = sorted(set(values))
 
-    marks = {}
-    for value in values:
-        ts = _epoch_ms_to_ts(value, tz)
-        marks[int(value)] = ts.strftime("%m-%d %H:%M")
-    return marks
+    return tuple((int(value), _epoch_ms_to_ts(value, tz).strftime("%m-%d %H:%M")) for value in values)
 
 
 def load_cropped_measurements_for_range(file_meta_list, start_ms, end_ms, tz):
@@ -169,7 +251,7 @@ def load_cropped_measurements_for_range(file_meta_list, start_ms, end_ms, tz):
         path = item.get("path")
         if not path:
             continue
-        df = load_file_for_cache(path, tz)
+        df = load_history_file_cached(path, tz)
         if df.empty:
             continue
         if "timestamp" not in df.columns:
@@ -200,5 +282,5 @@ def serialize_measurements_for_download(df, tz):
         if col not in result.columns:
             result[col] = pd.NA
     result = result[MEASUREMENT_COLUMNS].copy()
-    result["timestamp"] = result["timestamp"].apply(lambda value: serialize_iso_with_tz(value, tz=tz))
+    result["timestamp"] = serialize_iso_series_with_tz(result["timestamp"], tz)
     return result
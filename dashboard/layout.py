@@ -645,6 +645,9 @@ def build_dashboard_layout(
             dcc.Store(id="manual-editor-rows-store", data=[]),
             dcc.Store(id="manual-editor-status-store", data=""),
             dcc.Store(id="manual-editor-delete-index-store", data=None),
+            dcc.Store(id="status-graph-revision-store", data={}),
+            dcc.Store(id="status-output-fingerprint-store", data={}),
+            dcc.Store(id="api-tab-output-fingerprint-store", data={}),
             dcc.Store(id="plots-index-store", data={"has_data": False, "files_by_plant": {"lib": [], "vrfb": []}}),
             dcc.Store(id="plots-range-meta-store", data=None),
             dcc.Download(id="manual-editor-download"),
@@ -1,33 +1,29 @@
 """Dashboard log parsing and file helpers."""
 
+import io
 import os
 import re
 from collections import deque
-from datetime import datetime
+from datetime import date, datetime
 
 from dash import html
 from runtime.paths import get_logs_dir as _repo_logs_dir
 
+_DATED_LOG_FILE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})_")
+# One pass over the whole buffer; horizontal whitespace around each line is ignored.
+_LOG_LINE_RE = re.compile(
+    r"^[^\S\n]*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - (\w+) - (.*?\S)[^\S\n]*$",
+    re.MULTILINE,
+)
+_LOG_TAIL_BLOCK_BYTES = 64 * 1024
+_LOG_LEVEL_COLORS = {"ERROR": "#ef4444", "WARNING": "#f97316", "INFO": "#22c55e"}
+
 
 def parse_and_format_historical_logs(file_content):
-    pattern = r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - (\w+) - (.+)"
     formatted_entries = []
-    for line in (file_content or "").splitlines():
-        match = re.match(pattern, line.strip())
-        if not match:
-            continue
-
-        timestamp, level, message = match.groups()
+    for timestamp, level, message in _LOG_LINE_RE.findall(file_content or ""):
         level = level.upper()
-        if level == "ERROR":
-            color = "#ef4444"
-        elif level == "WARNING":
-            color = "#f97316"
-        elif level == "INFO":
-            color = "#22c55e"
-        else:
-            color = "#94a3b8"
-
+        color = _LOG_LEVEL_COLORS.get(level, "#94a3b8")
         formatted_entries.append(
             html.Div(
                 [
@@ -49,9 +45,72 @@ def get_today_log_file_path(base_dir, tz):
     return os.path.join(get_logs_dir(base_dir), f"{today_str}_hil_scheduler.log")
 
 
-def read_log_tail(file_path, max_lines=1000):
+def list_historical_log_files(logs_dir, exclude_path=None):
+    """Return ``(label, path)`` pairs for ``*.log`` files, dated files newest first, then undated by name."""
+    exclude_abspath = os.path.abspath(exclude_path) if exclude_path else None
+    dated = []
+    undated = []
+    if not os.path.isdir(logs_dir):
+        return []
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".log"):
+                continue
+            if exclude_abspath is not None and os.path.abspath(entry.path) == exclude_abspath:
+                continue
+            match = _DATED_LOG_FILE_RE.match(entry.name)
+            date_obj = None
+            if match:
+                try:
+                    date_obj = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+                except ValueError:
+                    date_obj = None
+            if date_obj is None:
+                undated.append((entry.name, entry.path))
+            else:
+                dated.append((date_obj, entry.path))
+
+    dated.sort(key=lambda item: item[0], reverse=True)
+    undated.sort(key=lambda item: item[0], reverse=True)
+    return [(date_obj.isoformat(), path) for date_obj, path in dated] + undated
+
+
+def build_log_file_options(log_files, *, search_value=None, selected_value=None, limit=50):
+    """
+    Return log selector options: "Today" plus at most ``limit`` historical files.
+
+    ``log_files`` are ``(label, path)`` pairs newest first; ``search_value`` filters them by label and the
+    currently selected file is kept even when it falls outside the filtered window.
+    """
+    needle = str(search_value or "").strip().lower()
+    options = [{"label": "Today", "value": "today"}]
+    selected_option = None
+    for label, path in log_files:
+        if path == selected_value:
+            selected_option = {"label": label, "value": path}
+        if len(options) <= limit and (not needle or needle in label.lower()):
+            options.append({"label": label, "value": path})
+    if selected_option is not None and selected_option not in options:
+        options.append(selected_option)
+    return options
+
+
+def read_log_tail(file_path, max_lines=1000, block_size=_LOG_TAIL_BLOCK_BYTES):
+    """Return the last ``max_lines`` lines of a log file, reading blocks back from the end instead of the whole file."""
     if not os.path.exists(file_path):
         return ""
-    with open(file_path, "r", encoding="utf-8", errors="replace") as handle:
-        tail_lines = deque(handle, maxlen=max_lines)
+    blocks = []
+    newline_count = 0
+    with open(file_path, "rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        # One newline more than needed guarantees the first kept line starts on a line boundary.
+        while position > 0 and newline_count <= max_lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            handle.seek(position)
+            block = handle.read(read_size)
+            blocks.append(block)
+            newline_count += block.count(b"\n")
+    text = b"".join(reversed(blocks)).decode("utf-8", errors="replace")
+    tail_lines = deque(io.StringIO(text, newline=None), maxlen=max_lines)
     return "".join(tail_lines)
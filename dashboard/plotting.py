@@ -1,6 +1,14 @@
 """Plot/theme helpers for dashboard figures."""
 
+import itertools
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
 import plotly.graph_objects as go
+from dash import Patch
+import plotly.io as pio
 import pandas as pd
 from plotly.subplots import make_subplots
 
@@ -30,16 +38,39 @@ DEFAULT_TRACE_COLORS = {
     "api_vrfb": "#3f65c8",
 }
 
+# Measurement rows sent per plant figure; longer recordings are reduced with min/max bucketing.
+DEFAULT_MAX_MEASUREMENT_ROWS = 6000
+# History ranges can span weeks; the selected range is reloaded on every slider change, so a coarser cap keeps
+# multi-day payloads small while narrower selections still come back at full resolution.
+HISTORY_MAX_MEASUREMENT_ROWS = 2000
+_MEASUREMENT_PLOT_COLUMNS = (
+    "p_setpoint_kw",
+    "battery_active_power_kw",
+    "p_poi_kw",
+    "soc_pu",
+    "q_setpoint_kvar",
+    "battery_reactive_power_kvar",
+    "q_poi_kvar",
+    "v_poi_kV",
+)
 
-def apply_figure_theme(fig, plot_theme, *, height, margin, uirevision, showlegend=True, legend_y=1.08):
-    fig.update_layout(
-        height=height,
-        margin=margin,
-        showlegend=showlegend,
+
+@lru_cache(maxsize=8)
+def _theme_template(theme_items):
+    plot_theme = dict(theme_items)
+    axis_style = dict(
+        gridcolor=plot_theme["grid"],
+        linecolor=plot_theme["grid"],
+        zerolinecolor=plot_theme["grid"],
+        tickfont=dict(color=plot_theme["muted"], family=plot_theme["font_family"]),
+        title_font=dict(color=plot_theme["axis"], family=plot_theme["font_family"]),
+    )
+    # Template axis styles apply to every x/y axis of a figure, including subplot axes.
+    template = go.layout.Template(pio.templates[pio.templates.default])
+    template.layout.update(
         legend=dict(
             orientation="h",
             yanchor="bottom",
-            y=legend_y,
             xanchor="center",
             x=0.5,
             bgcolor="rgba(255, 255, 255, 0.7)",
@@ -50,21 +81,20 @@ def apply_figure_theme(fig, plot_theme, *, height, margin, uirevision, showlegen
         plot_bgcolor=plot_theme["plot_bg"],
         paper_bgcolor=plot_theme["paper_bg"],
         font=dict(color=plot_theme["text"], family=plot_theme["font_family"], size=12),
-        uirevision=uirevision,
+        xaxis=axis_style,
+        yaxis=axis_style,
     )
-    fig.update_xaxes(
-        gridcolor=plot_theme["grid"],
-        linecolor=plot_theme["grid"],
-        zerolinecolor=plot_theme["grid"],
-        tickfont=dict(color=plot_theme["muted"], family=plot_theme["font_family"]),
-        title_font=dict(color=plot_theme["axis"], family=plot_theme["font_family"]),
-    )
-    fig.update_yaxes(
-        gridcolor=plot_theme["grid"],
-        linecolor=plot_theme["grid"],
-        zerolinecolor=plot_theme["grid"],
-        tickfont=dict(color=plot_theme["muted"], family=plot_theme["font_family"]),
-        title_font=dict(color=plot_theme["axis"], family=plot_theme["font_family"]),
+    return template
+
+
+def apply_figure_theme(fig, plot_theme, *, height, margin, uirevision, showlegend=True, legend_y=1.08):
+    fig.update_layout(
+        template=_theme_template(tuple(sorted(plot_theme.items()))),
+        height=height,
+        margin=margin,
+        showlegend=showlegend,
+        legend_y=legend_y,
+        uirevision=uirevision,
     )
     if fig.layout.annotations:
         for annotation in fig.layout.annotations:
@@ -75,6 +105,78 @@ def apply_figure_theme(fig, plot_theme, *, height, margin, uirevision, showlegen
             )
 
 
+def wall_clock_time_values(values):
+    """
+    Return datetimes as naive wall-clock datetime64 values for Plotly traces.
+
+    plotly.js ignores UTC offsets in date strings, so local wall-clock values plot identically while
+    serializing as one datetime64 buffer instead of per-point offset-aware Timestamp strings.
+    """
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy()
+
+
+def numeric_column_values(df, column):
+    """Return a dataframe column as a NumPy array, or an empty float array when missing."""
+    if df is None or column not in df.columns:
+        return np.empty(0, dtype=float)
+    return df[column].to_numpy()
+
+
+def float32_column_values(df, column):
+    """
+    Return a numeric column as float32 (about 7 significant digits), which Plotly sends as a typed array half
+    the size of float64; missing or non-numeric values become NaN.
+    """
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+def downsample_rows_min_max(df, value_columns, max_rows):
+    """
+    Return at most ``max_rows`` rows of ``df``, keeping each bucket's first row plus the rows holding every
+    value column's bucket minimum and maximum so plotted envelopes and spikes survive.
+    """
+    row_count = len(df)
+    columns = [column for column in value_columns if column in df.columns]
+    if max_rows is None or row_count <= int(max_rows) or not columns:
+        return df
+
+    bucket_count = max(1, int(max_rows) // (2 * len(columns) + 1))
+    buckets = np.arange(row_count) * bucket_count // row_count
+    keep = np.zeros(row_count, dtype=bool)
+    keep[np.flatnonzero(np.diff(buckets, prepend=-1))] = True
+    keep[-1] = True
+    for column in columns:
+        values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+        missing = np.isnan(values)
+        keep[pd.Series(np.where(missing, np.inf, values)).groupby(buckets).idxmin().to_numpy()] = True
+        keep[pd.Series(np.where(missing, -np.inf, values)).groupby(buckets).idxmax().to_numpy()] = True
+    return df.iloc[np.flatnonzero(keep)]
+
+
+def step_change_rows(df, column):
+    """
+    Return the rows of ``df`` where ``column`` changes value, the row before each missing value, and the last row.
+
+    A ``line_shape="hv"`` trace holds each value until the next point, so the repeated values dropped here draw
+    nothing new; schedules that hold a setpoint for hours shrink to their change points.
+    """
+    if df is None or column not in df.columns or len(df) <= 2:
+        return df
+    values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+    missing = np.isnan(values)
+    keep = np.ones(len(values), dtype=bool)
+    keep[1:] = (values[1:] != values[:-1]) & ~(missing[1:] & missing[:-1])
+    # An hv segment ending on a NaN point is not drawn, so the row before a gap closes the held run.
+    keep[:-1] |= missing[1:] & ~missing[:-1]
+    keep[-1] = True
+    if keep.all():
+        return df
+    return df.iloc[np.flatnonzero(keep)]
+
+
 def create_plant_figure(
     plant_id,
     plant_name_fn,
@@ -88,6 +190,8 @@ def create_plant_figure(
     x_window_end=None,
     time_indicator_ts=None,
     voltage_autorange_padding_kv=None,
+    max_measurement_rows=DEFAULT_MAX_MEASUREMENT_ROWS,
+    use_webgl=True,
 ):
     fig = make_subplots(
         rows=4,
@@ -111,26 +215,29 @@ def create_plant_figure(
     else:
         schedule_plot_df = None
 
-    if measurements_df is not None and not measurements_df.empty:
-        df = measurements_df.copy()
-        if "timestamp" in df.columns:
-            df["datetime"] = normalize_datetime_series(df["timestamp"], tz)
-            df = df.dropna(subset=["datetime"])
-        else:
-            df["datetime"] = []
-
+    if measurements_df is not None and not measurements_df.empty and "timestamp" in measurements_df.columns:
+        # Filter on the normalized timestamps first so only plotted rows are copied.
+        datetimes = normalize_datetime_series(measurements_df["timestamp"], tz)
+        keep = datetimes.notna()
         if x_window_start is not None:
-            df = df.loc[df["datetime"] >= x_window_start]
+            keep &= datetimes >= x_window_start
         if x_window_end is not None:
-            df = df.loc[df["datetime"] < x_window_end]
+            keep &= datetimes < x_window_end
+        df = measurements_df.loc[keep].assign(datetime=datetimes.loc[keep])
+    elif measurements_df is not None and not measurements_df.empty:
+        df = measurements_df.copy()
+        df["datetime"] = []
     else:
         df = pd.DataFrame()
+    voltage_df = df
+    df = downsample_rows_min_max(df, _MEASUREMENT_PLOT_COLUMNS, max_measurement_rows)
 
     pref_x = None
     pref_y = None
     if schedule_plot_df is not None and not schedule_plot_df.empty and "power_setpoint_kw" in schedule_plot_df.columns:
-        pref_x = schedule_plot_df.index
-        pref_y = schedule_plot_df["power_setpoint_kw"]
+        pref_df = step_change_rows(schedule_plot_df, "power_setpoint_kw")
+        pref_x = pref_df.index
+        pref_y = pref_df["power_setpoint_kw"]
     elif not df.empty and "p_setpoint_kw" in df.columns:
         pref_x = df["datetime"]
         pref_y = df["p_setpoint_kw"]
@@ -138,12 +245,16 @@ def create_plant_figure(
     qref_x = None
     qref_y = None
     if schedule_plot_df is not None and not schedule_plot_df.empty and "reactive_power_setpoint_kvar" in schedule_plot_df.columns:
-        qref_x = schedule_plot_df.index
-        qref_y = schedule_plot_df["reactive_power_setpoint_kvar"]
+        qref_df = step_change_rows(schedule_plot_df, "reactive_power_setpoint_kvar")
+        qref_x = qref_df.index
+        qref_y = qref_df["reactive_power_setpoint_kvar"]
     elif not df.empty and "q_setpoint_kvar" in df.columns:
         qref_x = df["datetime"]
         qref_y = df["q_setpoint_kvar"]
 
+    # Measurement series can hold thousands of points; WebGL draws them on one canvas instead of SVG paths.
+    measurement_scatter = go.Scattergl if use_webgl else go.Scatter
+
     legend_rank = {
         "Pref": 10,
         "P POI": 20,
@@ -155,9 +266,17 @@ def create_plant_figure(
         "Voltage": 80,
     }
 
+    # Traces are collected and added in one add_traces call, which validates the batch once.
+    traces = []
+    trace_rows = []
+
+    def _add_trace(trace, row):
+        traces.append(trace)
+        trace_rows.append(row)
+
     # Legend order (when traces are present): Pref, P POI, P Bat, SoC, Qref, Q POI, Q Bat, Voltage.
     if pref_x is not None and pref_y is not None:
-        fig.add_trace(
+        _add_trace(
             go.Scatter(
                 x=pref_x,
                 y=pref_y,
@@ -168,15 +287,14 @@ def create_plant_figure(
                 legendrank=legend_rank["Pref"],
             ),
             row=1,
-            col=1,
         )
 
     if not df.empty:
         if "battery_active_power_kw" in df.columns:
-            fig.add_trace(
-                go.Scatter(
+            _add_trace(
+                measurement_scatter(
                     x=df["datetime"],
-                    y=df["battery_active_power_kw"],
+                    y=float32_column_values(df, "battery_active_power_kw"),
                     mode="lines",
                     line_shape="hv",
                     name="P Bat",
@@ -184,13 +302,12 @@ def create_plant_figure(
                     legendrank=legend_rank["P Bat"],
                 ),
                 row=1,
-                col=1,
             )
         if "p_poi_kw" in df.columns:
-            fig.add_trace(
-                go.Scatter(
+            _add_trace(
+                measurement_scatter(
                     x=df["datetime"],
-                    y=df["p_poi_kw"],
+                    y=float32_column_values(df, "p_poi_kw"),
                     mode="lines",
                     line_shape="hv",
                     name="P POI",
@@ -198,24 +315,22 @@ def create_plant_figure(
                     legendrank=legend_rank["P POI"],
                 ),
                 row=1,
-                col=1,
             )
         if "soc_pu" in df.columns:
-            fig.add_trace(
-                go.Scatter(
+            _add_trace(
+                measurement_scatter(
                     x=df["datetime"],
-                    y=df["soc_pu"],
+                    y=float32_column_values(df, "soc_pu"),
                     mode="lines",
                     name="SoC",
                     line=dict(color=trace_colors["soc"], width=2),
                     legendrank=legend_rank["SoC"],
                 ),
                 row=2,
-                col=1,
             )
 
         if qref_x is not None and qref_y is not None:
-            fig.add_trace(
+            _add_trace(
                 go.Scatter(
                     x=qref_x,
                     y=qref_y,
@@ -226,13 +341,12 @@ def create_plant_figure(
                     legendrank=legend_rank["Qref"],
                 ),
                 row=3,
-                col=1,
             )
         if "battery_reactive_power_kvar" in df.columns:
-            fig.add_trace(
-                go.Scatter(
+            _add_trace(
+                measurement_scatter(
                     x=df["datetime"],
-                    y=df["battery_reactive_power_kvar"],
+                    y=float32_column_values(df, "battery_reactive_power_kvar"),
                     mode="lines",
                     line_shape="hv",
                     name="Q Bat",
@@ -240,13 +354,12 @@ def create_plant_figure(
                     legendrank=legend_rank["Q Bat"],
                 ),
                 row=3,
-                col=1,
             )
         if "q_poi_kvar" in df.columns:
-            fig.add_trace(
-                go.Scatter(
+            _add_trace(
+                measurement_scatter(
                     x=df["datetime"],
-                    y=df["q_poi_kvar"],
+                    y=float32_column_values(df, "q_poi_kvar"),
                     mode="lines",
                     line_shape="hv",
                     name="Q POI",
@@ -254,21 +367,19 @@ def create_plant_figure(
                     legendrank=legend_rank["Q POI"],
                 ),
                 row=3,
-                col=1,
             )
         if "v_poi_kV" in df.columns:
-            voltage_series = pd.to_numeric(df["v_poi_kV"], errors="coerce")
-            fig.add_trace(
-                go.Scatter(
+            voltage_series = pd.to_numeric(voltage_df["v_poi_kV"], errors="coerce")
+            _add_trace(
+                measurement_scatter(
                     x=df["datetime"],
-                    y=df["v_poi_kV"],
+                    y=float32_column_values(df, "v_poi_kV"),
                     mode="lines",
                     name="Voltage",
                     line=dict(color=trace_colors["v_poi"], width=2),
                     legendrank=legend_rank["Voltage"],
                 ),
                 row=4,
-                col=1,
             )
             try:
                 voltage_padding = float(voltage_autorange_padding_kv)
@@ -288,7 +399,7 @@ def create_plant_figure(
 
     elif qref_x is not None and qref_y is not None:
         # Preserve Q reference visibility when only schedule data is available.
-        fig.add_trace(
+        _add_trace(
             go.Scatter(
                 x=qref_x,
                 y=qref_y,
@@ -299,9 +410,11 @@ def create_plant_figure(
                 legendrank=legend_rank["Qref"],
             ),
             row=3,
-            col=1,
         )
 
+    if traces:
+        fig.add_traces(traces, rows=trace_rows, cols=[1] * len(traces))
+
     apply_figure_theme(
         fig,
         plot_theme,
@@ -324,6 +437,107 @@ def create_plant_figure(
     return fig
 
 
+def build_history_timeline_traces(file_spans, label_by_plant, color_by_plant, default_color):
+    """
+    Return one timeline trace per plant from ``(plant_id, item, start_ts, end_ts)`` history file spans.
+
+    Each file is a segment of its plant's trace, separated by gaps, so a long history stays one trace per plant;
+    the file name travels as ``customdata`` for the hover text.
+    """
+    segments_by_plant = {}
+    for plant_id, item, start_ts, end_ts in file_spans:
+        x_values, file_names = segments_by_plant.setdefault(plant_id, ([], []))
+        if x_values:
+            x_values.append(None)
+            file_names.append(None)
+        file_name = os.path.basename(str(item.get("path", "")))
+        x_values.extend((start_ts, end_ts))
+        file_names.extend((file_name, file_name))
+
+    traces = []
+    for plant_id, (x_values, file_names) in segments_by_plant.items():
+        label = label_by_plant.get(plant_id, plant_id.upper())
+        traces.append(
+            go.Scatter(
+                x=x_values,
+                y=[None if value is None else label for value in x_values],
+                customdata=file_names,
+                mode="lines",
+                line=dict(color=color_by_plant.get(plant_id, default_color), width=8),
+                name=label,
+                legendgroup=plant_id,
+                hovertemplate=f"{label}<br>%{{customdata}}<br>Start: %{{x|%Y-%m-%d %H:%M:%S}}<extra></extra>",
+            )
+        )
+    return traces
+
+
+def same_figure_inputs(previous_inputs, current_inputs):
+    """Return True when figure inputs match: DataFrames by identity (writers replace them), other values by equality."""
+    if len(previous_inputs) != len(current_inputs):
+        return False
+    for previous, current in zip(previous_inputs, current_inputs):
+        if previous is current:
+            continue
+        if isinstance(previous, pd.DataFrame) or isinstance(current, pd.DataFrame) or previous != current:
+            return False
+    return True
+
+
+def _is_time_indicator_shape(shape):
+    return shape.get("type") == "line" and str(shape.get("yref", "")).endswith("domain") and shape.get("x0") == shape.get("x1")
+
+
+def time_indicator_shape_indexes(figure):
+    """Return the positions of the time-indicator lines in a plant figure dict's ``layout.shapes``."""
+    shapes = (figure.get("layout", {}) or {}).get("shapes", []) or []
+    return [idx for idx, shape in enumerate(shapes) if _is_time_indicator_shape(shape)]
+
+
+def time_indicator_patch(shape_indexes, time_indicator_ts):
+    """Return a ``Patch`` that moves the time-indicator lines at ``shape_indexes`` to ``time_indicator_ts``."""
+    figure_patch = Patch()
+    for shape_idx in shape_indexes:
+        figure_patch["layout"]["shapes"][shape_idx]["x0"] = time_indicator_ts
+        figure_patch["layout"]["shapes"][shape_idx]["x1"] = time_indicator_ts
+    return figure_patch
+
+
+def figure_revision_factory(prefix=""):
+    """
+    Return a callable producing figure revision ids, optionally tagged with a kind.
+
+    Ids carry the process id and start time, so a browser never matches a revision from an earlier server run.
+    """
+    base = f"{prefix}{os.getpid()}-{time.time_ns()}"
+    counter = itertools.count(1)
+
+    def next_revision(kind=None):
+        return f"{base}:{kind}:{next(counter)}" if kind else f"{base}:{next(counter)}"
+
+    return next_revision
+
+
+def move_time_indicator(figure, time_indicator_ts):
+    """Return a copy of a plant figure dict with its time-indicator lines moved to ``time_indicator_ts``.
+
+    Only the layout and shape containers are copied; trace data is shared with ``figure``.
+    """
+    layout = dict(figure.get("layout", {}) or {})
+    shapes = []
+    for shape in layout.get("shapes", []) or []:
+        shape = dict(shape)
+        if _is_time_indicator_shape(shape):
+            shape["x0"] = time_indicator_ts
+            shape["x1"] = time_indicator_ts
+        shapes.append(shape)
+    if shapes:
+        layout["shapes"] = shapes
+    moved = dict(figure)
+    moved["layout"] = layout
+    return moved
+
+
 def create_manual_series_figure(
     *,
     title,
@@ -2,51 +2,76 @@ import logging
 import math
 import os
 import threading
-import time
 
 import pandas as pd
 import plotly.graph_objects as go
-from dash import Dash, Input, Output, State, dcc, html
+from dash import Dash, Input, Output, State, dcc, html, no_update
 from dash.exceptions import PreventUpdate
 
 from dashboard.history import (
     build_slider_marks,
     clamp_epoch_range,
+    history_file_spans,
     load_cropped_measurements_for_range,
     scan_measurement_history_index,
 )
 from dashboard.plotting import (
     DEFAULT_PLOT_THEME,
     DEFAULT_TRACE_COLORS,
+    HISTORY_MAX_MEASUREMENT_ROWS,
     apply_figure_theme,
+    build_history_timeline_traces,
     create_plant_figure,
+    figure_revision_factory,
+    move_time_indicator,
+    same_figure_inputs,
+    time_indicator_patch,
+    time_indicator_shape_indexes,
 )
 from dashboard.ui_state import (
+    binary_toggle_classes,
     get_plant_power_toggle_state,
     get_recording_toggle_state,
     is_observed_state_effectively_stale,
+    output_group_slices,
     resolve_runtime_transition_state,
+    skip_unchanged_output_groups,
 )
 import scheduling.manual_schedule_manager as msm
-from measurement.storage import MEASUREMENT_COLUMNS
+from measurement.storage import MEASUREMENT_COLUMNS, latest_measurement_row
 from runtime.contracts import sanitize_plant_name
 from runtime.paths import get_assets_dir, get_data_dir, get_project_root
 from runtime.shared_state import snapshot_locked
 from scheduling.runtime import build_effective_schedule_frame
-from time_utils import get_config_tz, normalize_datetime_series, normalize_schedule_index, normalize_timestamp_value, now_tz
+from time_utils import get_config_tz, normalize_schedule_index, normalize_timestamp_value, now_tz
 
 
 DEFAULT_PUBLIC_HISTORY_EMPTY_RANGE = [0, 1]
-
-
-def _binary_toggle_classes(active_side):
-    positive = ["toggle-option", "toggle-option--positive"]
-    negative = ["toggle-option", "toggle-option--negative"]
-    if active_side == "positive":
-        positive.append("active")
-    elif active_side == "negative":
-        negative.append("active")
-    return " ".join(positive), " ".join(negative)
+_PUBLIC_STATUS_CONTROL_BUTTONS = ("start", "stop", "dispatch-enable", "dispatch-disable", "record", "record-stop")
+# update_public_status_and_graphs outputs as (skip group, component id, prop). Grouped outputs are skipped while
+# unchanged for a browser; each control button is its own group.
+_PUBLIC_STATUS_OUTPUTS = (
+    ("indicators", "public-api-connection-indicator", "children"),
+    ("indicators", "public-api-connection-indicator", "className"),
+    ("indicators", "public-api-today-indicator", "children"),
+    ("indicators", "public-api-today-indicator", "className"),
+    ("indicators", "public-api-tomorrow-indicator", "children"),
+    ("indicators", "public-api-tomorrow-indicator", "className"),
+    ("indicators", "public-transport-text", "children"),
+    ("indicators", "public-error-text", "children"),
+    ("summary", "public-plant-summary-table", "children"),
+    *(
+        (f"{button}-{plant_id}", f"public-{button}-{plant_id}", prop)
+        for plant_id in ("lib", "vrfb")
+        for button in _PUBLIC_STATUS_CONTROL_BUTTONS
+        for prop in ("children", "className")
+    ),
+    (None, "public-graph-lib", "figure"),
+    (None, "public-graph-vrfb", "figure"),
+    (None, "public-status-output-fingerprint-store", "data"),
+    (None, "public-status-graph-revision-store", "data"),
+)
+_PUBLIC_STATUS_OUTPUT_GROUPS = output_group_slices(_PUBLIC_STATUS_OUTPUTS)
 
 
 def _public_dispatch_toggle_state(dispatch_enabled):
@@ -433,6 +458,8 @@ def _public_layout(*, plant_name_fn, brand_logo_src, measurement_period_s):
             ),
             dcc.Interval(id="public-interval-component", interval=interval_ms, n_intervals=0),
             dcc.Interval(id="public-plots-refresh-interval", interval=30000, n_intervals=0),
+            dcc.Store(id="public-status-output-fingerprint-store", data={}),
+            dcc.Store(id="public-status-graph-revision-store", data={}),
         ],
     )
 
@@ -459,11 +486,16 @@ def build_public_readonly_app(config, shared_data):
     plot_theme = dict(DEFAULT_PLOT_THEME)
     trace_colors = dict(DEFAULT_TRACE_COLORS)
 
-    def plant_name(plant_id):
+    def _resolve_plant_name(plant_id):
         return str((plants_cfg.get(plant_id, {}) or {}).get("name", plant_id.upper()))
 
-    def _plant_suffix_by_id():
-        return {plant_id: sanitize_plant_name(plant_name(plant_id), plant_id) for plant_id in plant_ids}
+    # Plant names come from config, so they are resolved once per app instead of on every render.
+    plant_name_by_id = {plant_id: _resolve_plant_name(plant_id) for plant_id in plant_ids}
+    plant_suffix_by_id = {plant_id: sanitize_plant_name(plant_name_by_id[plant_id], plant_id) for plant_id in plant_ids}
+
+    def plant_name(plant_id):
+        name = plant_name_by_id.get(plant_id)
+        return name if name is not None else _resolve_plant_name(plant_id)
 
     def _manual_status_window_bounds(now_value=None):
         now_value = normalize_timestamp_value(now_value or now_tz(config), tz)
@@ -471,6 +503,11 @@ def build_public_readonly_app(config, shared_data):
         end = start + pd.Timedelta(days=2)
         return start, end
 
+    # Last status figure per plant with the inputs it was built from; reused while the inputs are unchanged.
+    # Revisions let each browser tell the callback which cached figure it already shows.
+    status_figure_cache_by_plant = {}
+    next_figure_revision = figure_revision_factory("public-")
+
     def _voltage_padding_kv_for_plant(plant_id):
         plant_cfg = (plants_cfg.get(plant_id, {}) or {})
         model_cfg = (plant_cfg.get("model", {}) or {})
@@ -510,32 +547,12 @@ def build_public_readonly_app(config, shared_data):
         if not isinstance(index_data, dict) or not index_data.get("has_data"):
             return _empty_history_timeline_figure("No historical measurements found.")
 
-        fig = go.Figure()
         color_by_plant = {"lib": trace_colors["api_lib"], "vrfb": trace_colors["api_vrfb"]}
         label_by_plant = {"lib": plant_name("lib"), "vrfb": plant_name("vrfb")}
-
-        for plant_id in plant_ids:
-            for item in (index_data.get("files_by_plant", {}) or {}).get(plant_id, []):
-                start_ts = _epoch_ms_to_ts(item.get("start_ms"))
-                end_ts = _epoch_ms_to_ts(item.get("end_ms"))
-                if pd.isna(start_ts) or pd.isna(end_ts):
-                    continue
-                fig.add_trace(
-                    go.Scatter(
-                        x=[start_ts, end_ts],
-                        y=[label_by_plant.get(plant_id, plant_id.upper())] * 2,
-                        mode="lines",
-                        line=dict(color=color_by_plant.get(plant_id, plot_theme["muted"]), width=8),
-                        name=label_by_plant.get(plant_id, plant_id.upper()),
-                        legendgroup=plant_id,
-                        showlegend=not any(t.legendgroup == plant_id for t in fig.data),
-                        hovertemplate=(
-                            f"{label_by_plant.get(plant_id, plant_id.upper())}<br>"
-                            f"{os.path.basename(str(item.get('path', '')))}<br>"
-                            "Start: %{x|%Y-%m-%d %H:%M:%S}<extra></extra>"
-                        ),
-                    )
-                )
+        file_spans = history_file_spans(index_data.get("files_by_plant"), plant_ids, tz)
+        fig = go.Figure(
+            data=build_history_timeline_traces(file_spans, label_by_plant, color_by_plant, plot_theme["muted"])
+        )
 
         if selected_range and len(selected_range) == 2:
             try:
@@ -591,46 +608,11 @@ def build_public_readonly_app(config, shared_data):
     )
 
     @app.callback(
-        [
-            Output("public-api-connection-indicator", "children"),
-            Output("public-api-connection-indicator", "className"),
-            Output("public-api-today-indicator", "children"),
-            Output("public-api-today-indicator", "className"),
-            Output("public-api-tomorrow-indicator", "children"),
-            Output("public-api-tomorrow-indicator", "className"),
-            Output("public-transport-text", "children"),
-            Output("public-error-text", "children"),
-            Output("public-plant-summary-table", "children"),
-            Output("public-start-lib", "children"),
-            Output("public-start-lib", "className"),
-            Output("public-stop-lib", "children"),
-            Output("public-stop-lib", "className"),
-            Output("public-dispatch-enable-lib", "children"),
-            Output("public-dispatch-enable-lib", "className"),
-            Output("public-dispatch-disable-lib", "children"),
-            Output("public-dispatch-disable-lib", "className"),
-            Output("public-record-lib", "children"),
-            Output("public-record-lib", "className"),
-            Output("public-record-stop-lib", "children"),
-            Output("public-record-stop-lib", "className"),
-            Output("public-start-vrfb", "children"),
-            Output("public-start-vrfb", "className"),
-            Output("public-stop-vrfb", "children"),
-            Output("public-stop-vrfb", "className"),
-            Output("public-dispatch-enable-vrfb", "children"),
-            Output("public-dispatch-enable-vrfb", "className"),
-            Output("public-dispatch-disable-vrfb", "children"),
-            Output("public-dispatch-disable-vrfb", "className"),
-            Output("public-record-vrfb", "children"),
-            Output("public-record-vrfb", "className"),
-            Output("public-record-stop-vrfb", "children"),
-            Output("public-record-stop-vrfb", "className"),
-            Output("public-graph-lib", "figure"),
-            Output("public-graph-vrfb", "figure"),
-        ],
-        [Input("public-interval-component", "n_intervals")],
+        [Output(component_id, prop) for _group, component_id, prop in _PUBLIC_STATUS_OUTPUTS],
+        [Input("public-interval-component", "n_intervals"), Input("public-main-tabs", "value")],
+        [State("public-status-output-fingerprint-store", "data"), State("public-status-graph-revision-store", "data")],
     )
-    def update_public_status_and_graphs(_n_intervals):
+    def update_public_status_and_graphs(_n_intervals, active_tab, output_fingerprint_by_group, graph_revision_by_plant):
         snapshot = snapshot_locked(
             shared_data,
             lambda data: {
@@ -641,16 +623,10 @@ def build_public_readonly_app(config, shared_data):
                 "observed_state_by_plant": dict(data.get("plant_observed_state_by_plant", {})),
                 "control_engine_status": dict(data.get("control_engine_status", {})),
                 "fetcher_status": dict((data.get("data_fetcher_status", {}) or {})),
-                "api_schedule_map": {
-                    plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id, pd.DataFrame()).copy()
-                    for plant_id in plant_ids
-                },
-                "manual_series_map": dict(data.get("manual_schedule_series_df_by_key", {})),
-                "manual_merge_enabled": dict(data.get("manual_schedule_merge_enabled_by_key", {})),
-                "measurements_map": {
-                    plant_id: data.get("current_file_df_by_plant", {}).get(plant_id, pd.DataFrame()).copy()
-                    for plant_id in plant_ids
-                },
+                "api_schedule_map": dict(data.get("api_schedule_df_by_plant", {})),
+                "manual_series_map": data.get("manual_schedule_series_df_by_key", {}),
+                "manual_merge_enabled": data.get("manual_schedule_merge_enabled_by_key", {}),
+                "measurements_map": dict(data.get("current_file_df_by_plant", {})),
             },
         )
 
@@ -735,19 +711,7 @@ def build_public_readonly_app(config, shared_data):
             )
 
         def _latest_measurements_row(plant_id):
-            measurements_df = snapshot["measurements_map"].get(plant_id, pd.DataFrame())
-            if not isinstance(measurements_df, pd.DataFrame) or measurements_df.empty:
-                return {}
-            df_latest = measurements_df.copy()
-            if "timestamp" in df_latest.columns:
-                df_latest["__ts"] = normalize_datetime_series(df_latest["timestamp"], tz)
-                df_latest = df_latest.dropna(subset=["__ts"]).sort_values("__ts")
-                if df_latest.empty:
-                    return {}
-            try:
-                return dict(df_latest.iloc[-1].to_dict())
-            except Exception:
-                return {}
+            return latest_measurement_row(snapshot["measurements_map"].get(plant_id), tz)
 
         def _status_chip(plant_id):
             is_running = str(runtime_state_by_plant.get(plant_id, "unknown") or "unknown").lower() == "running"
@@ -801,10 +765,26 @@ def build_public_readonly_app(config, shared_data):
 
         status_window_start, status_window_end = _manual_status_window_bounds(now_value=status_now)
 
-        effective_schedule_map = {}
-        for plant_id in plant_ids:
+        def _plant_figure(plant_id):
             p_key, q_key = msm.manual_series_keys_for_plant(plant_id)
-            effective_schedule_map[plant_id] = build_effective_schedule_frame(
+            figure_inputs = (
+                snapshot["api_schedule_map"].get(plant_id),
+                snapshot["manual_series_map"].get(p_key),
+                snapshot["manual_series_map"].get(q_key),
+                bool(snapshot["manual_merge_enabled"].get(p_key, False)),
+                bool(snapshot["manual_merge_enabled"].get(q_key, False)),
+                snapshot["measurements_map"].get(plant_id),
+                transport_mode,
+                status_window_start,
+            )
+            cached = status_figure_cache_by_plant.get(plant_id)
+            if cached is not None and same_figure_inputs(cached["inputs"], figure_inputs):
+                if client_graph_revisions.get(plant_id) == cached["revision"]:
+                    # This browser already shows this figure; only move the time indicator.
+                    return time_indicator_patch(cached["indicator_shape_indexes"], status_now), cached["revision"]
+                return move_time_indicator(cached["figure"], status_now), cached["revision"]
+
+            effective_schedule = build_effective_schedule_frame(
                 snapshot["api_schedule_map"].get(plant_id, pd.DataFrame()),
                 snapshot["manual_series_map"].get(p_key, pd.DataFrame()),
                 snapshot["manual_series_map"].get(q_key, pd.DataFrame()),
@@ -812,6 +792,28 @@ def build_public_readonly_app(config, shared_data):
                 manual_q_enabled=bool(snapshot["manual_merge_enabled"].get(q_key, False)),
                 tz=tz,
             )
+            figure = create_plant_figure(
+                plant_id,
+                plant_name,
+                normalize_schedule_index(effective_schedule, tz),
+                snapshot["measurements_map"].get(plant_id, pd.DataFrame()),
+                uirevision_key=f"public-{plant_id}:merged:{transport_mode}",
+                tz=tz,
+                plot_theme=plot_theme,
+                trace_colors=trace_colors,
+                x_window_start=status_window_start,
+                x_window_end=status_window_end,
+                time_indicator_ts=status_now,
+                voltage_autorange_padding_kv=_voltage_padding_kv_for_plant(plant_id),
+            ).to_dict()
+            revision = next_figure_revision()
+            status_figure_cache_by_plant[plant_id] = {
+                "inputs": figure_inputs,
+                "figure": figure,
+                "revision": revision,
+                "indicator_shape_indexes": time_indicator_shape_indexes(figure),
+            }
+            return figure, revision
 
         def plant_control_labels(plant_id):
             runtime_state = runtime_state_by_plant.get(plant_id, "unknown")
@@ -822,9 +824,9 @@ def build_public_readonly_app(config, shared_data):
             dispatch_state = _public_dispatch_toggle_state(dispatch_enabled)
             record_state = get_recording_toggle_state(recording_active)
 
-            power_classes = _binary_toggle_classes(power_state.get("active_side"))
-            dispatch_classes = _binary_toggle_classes(dispatch_state.get("active_side"))
-            record_classes = _binary_toggle_classes(record_state.get("active_side"))
+            power_classes = binary_toggle_classes(power_state.get("active_side"))
+            dispatch_classes = binary_toggle_classes(dispatch_state.get("active_side"))
+            record_classes = binary_toggle_classes(record_state.get("active_side"))
             return (
                 power_state.get("positive_label", "Run"),
                 power_classes[0],
@@ -843,39 +845,17 @@ def build_public_readonly_app(config, shared_data):
         lib_controls = plant_control_labels("lib")
         vrfb_controls = plant_control_labels("vrfb")
 
-        lib_schedule = normalize_schedule_index(effective_schedule_map.get("lib", pd.DataFrame()), tz)
-        vrfb_schedule = normalize_schedule_index(effective_schedule_map.get("vrfb", pd.DataFrame()), tz)
-
-        lib_fig = create_plant_figure(
-            "lib",
-            plant_name,
-            lib_schedule,
-            snapshot["measurements_map"].get("lib", pd.DataFrame()),
-            uirevision_key=f"public-lib:merged:{transport_mode}",
-            tz=tz,
-            plot_theme=plot_theme,
-            trace_colors=trace_colors,
-            x_window_start=status_window_start,
-            x_window_end=status_window_end,
-            time_indicator_ts=status_now,
-            voltage_autorange_padding_kv=_voltage_padding_kv_for_plant("lib"),
-        )
-        vrfb_fig = create_plant_figure(
-            "vrfb",
-            plant_name,
-            vrfb_schedule,
-            snapshot["measurements_map"].get("vrfb", pd.DataFrame()),
-            uirevision_key=f"public-vrfb:merged:{transport_mode}",
-            tz=tz,
-            plot_theme=plot_theme,
-            trace_colors=trace_colors,
-            x_window_start=status_window_start,
-            x_window_end=status_window_end,
-            time_indicator_ts=status_now,
-            voltage_autorange_padding_kv=_voltage_padding_kv_for_plant("vrfb"),
-        )
+        client_graph_revisions = dict(graph_revision_by_plant or {})
+        if active_tab == "status":
+            lib_fig, lib_revision = _plant_figure("lib")
+            vrfb_fig, vrfb_revision = _plant_figure("vrfb")
+            graph_revisions = {"lib": lib_revision, "vrfb": vrfb_revision}
+        else:
+            # Hidden plots are brought up to date by the tab switch back to Status, which re-runs this callback.
+            lib_fig = vrfb_fig = no_update
+            graph_revisions = client_graph_revisions
 
-        return (
+        outputs = [
             api_connection_children,
             api_connection_class,
             api_today_children,
@@ -885,33 +865,22 @@ def build_public_readonly_app(config, shared_data):
             transport_text,
             error_line,
             summary_table,
-            lib_controls[0],
-            lib_controls[1],
-            lib_controls[2],
-            lib_controls[3],
-            lib_controls[4],
-            lib_controls[5],
-            lib_controls[6],
-            lib_controls[7],
-            lib_controls[8],
-            lib_controls[9],
-            lib_controls[10],
-            lib_controls[11],
-            vrfb_controls[0],
-            vrfb_controls[1],
-            vrfb_controls[2],
-            vrfb_controls[3],
-            vrfb_controls[4],
-            vrfb_controls[5],
-            vrfb_controls[6],
-            vrfb_controls[7],
-            vrfb_controls[8],
-            vrfb_controls[9],
-            vrfb_controls[10],
-            vrfb_controls[11],
+            *lib_controls,
+            *vrfb_controls,
             lib_fig,
             vrfb_fig,
+        ]
+        # Indicators, the summary table and button props only change with API, measurement or plant transitions;
+        # skip groups this browser already shows.
+        outputs, output_fingerprints = skip_unchanged_output_groups(
+            outputs,
+            _PUBLIC_STATUS_OUTPUT_GROUPS,
+            output_fingerprint_by_group,
+            no_update,
         )
+        outputs.append(output_fingerprints if output_fingerprints != output_fingerprint_by_group else no_update)
+        outputs.append(graph_revisions if graph_revisions != client_graph_revisions else no_update)
+        return tuple(outputs)
 
     @app.callback(
         [
@@ -932,7 +901,7 @@ def build_public_readonly_app(config, shared_data):
         if active_tab != "plots":
             raise PreventUpdate
 
-        index_data = scan_measurement_history_index(data_dir, _plant_suffix_by_id(), tz)
+        index_data = scan_measurement_history_index(data_dir, plant_suffix_by_id, tz)
         if not index_data.get("has_data"):
             return (
                 0,
@@ -988,17 +957,16 @@ def build_public_readonly_app(config, shared_data):
         if active_tab != "plots":
             raise PreventUpdate
 
-        suffix_map = _plant_suffix_by_id()
         lib_slice = build_public_history_slice(
             data_dir,
-            suffix_map,
+            plant_suffix_by_id,
             plant_id="lib",
             selected_range=selected_range,
             tz=tz,
         )
         vrfb_slice = build_public_history_slice(
             data_dir,
-            suffix_map,
+            plant_suffix_by_id,
             plant_id="vrfb",
             selected_range=selected_range,
             tz=tz,
@@ -1029,6 +997,7 @@ def build_public_readonly_app(config, shared_data):
                 plot_theme=plot_theme,
                 trace_colors=trace_colors,
                 voltage_autorange_padding_kv=_voltage_padding_kv_for_plant("lib"),
+                max_measurement_rows=HISTORY_MAX_MEASUREMENT_ROWS,
             )
 
         if vrfb_measurements.empty:
@@ -1045,6 +1014,7 @@ def build_public_readonly_app(config, shared_data):
                 plot_theme=plot_theme,
                 trace_colors=trace_colors,
                 voltage_autorange_padding_kv=_voltage_padding_kv_for_plant("vrfb"),
+                max_measurement_rows=HISTORY_MAX_MEASUREMENT_ROWS,
             )
 
         return lib_fig, vrfb_fig
@@ -1070,8 +1040,7 @@ def public_dashboard_agent(config, shared_data):
     thread = threading.Thread(target=run_app, daemon=True)
     thread.start()
 
-    while not shared_data["shutdown_event"].is_set():
-        time.sleep(1)
+    shared_data["shutdown_event"].wait()
 
     logging.info("Public read-only dashboard agent stopped.")
 
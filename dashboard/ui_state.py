@@ -1,5 +1,6 @@
 """Pure UI state helpers for dashboard controls."""
 
+import hashlib
 from datetime import datetime
 
 
@@ -31,20 +32,27 @@ def is_observed_state_effectively_stale(observed_state, *, now_ts, stale_after_s
     return age_s > float(stale_after_s)
 
 
+# (transition_state, enable_state) -> runtime state while a start or stop is in flight; the transition only
+# resolves once the plant reports the target enable state.
+_IN_FLIGHT_TRANSITIONS = {
+    ("starting", 1): "running",
+    ("starting", 0): "starting",
+    ("stopping", 1): "stopping",
+    ("stopping", 0): "stopped",
+}
+_RUNTIME_TRANSITION_STATES = frozenset({"starting", "stopping", "running", "stopped"})
+
+
 def resolve_runtime_transition_state(transition_state, enable_state):
-    if transition_state == "starting" and enable_state == 1:
-        return "running"
-    if transition_state == "stopping" and enable_state == 0:
-        return "stopped"
-    if transition_state == "starting":
-        return "starting"
-    if transition_state == "stopping":
-        return "stopping"
+    enable_state = enable_state if enable_state in (0, 1) else None
+    resolved = _IN_FLIGHT_TRANSITIONS.get((transition_state, enable_state))
+    if resolved is not None:
+        return resolved
     if enable_state == 1:
         return "running"
     if enable_state == 0:
         return "stopped"
-    if transition_state in {"starting", "stopping", "running", "stopped"}:
+    if transition_state in _RUNTIME_TRANSITION_STATES:
         return transition_state
     return "unknown"
 
@@ -165,3 +173,92 @@ def get_recording_toggle_state(recording_active, click_feedback_state=None):
         "negative_disabled": True,
         "active_side": "negative",
     }
+
+
+def _build_binary_toggle_classes(active_side, *, semantic=True):
+    positive = ["toggle-option"]
+    negative = ["toggle-option"]
+    if semantic:
+        positive.append("toggle-option--positive")
+        negative.append("toggle-option--negative")
+    if active_side == "positive":
+        positive.append("active")
+    elif active_side == "negative":
+        negative.append("active")
+    return " ".join(positive), " ".join(negative)
+
+
+_BINARY_TOGGLE_CLASSES_BY_SIDE = {
+    (active_side, semantic): _build_binary_toggle_classes(active_side, semantic=semantic)
+    for active_side in ("positive", "negative", None)
+    for semantic in (True, False)
+}
+
+
+def binary_toggle_classes(active_side, *, semantic=True):
+    """Return (positive, negative) CSS class strings for a two-sided toggle."""
+    classes = _BINARY_TOGGLE_CLASSES_BY_SIDE.get((active_side, semantic))
+    if classes is None:
+        classes = _build_binary_toggle_classes(active_side, semantic=semantic)
+    return classes
+
+
+def diff_editor_rows(previous_rows, next_rows):
+    """Return per-field row edits between two editor row lists, or None when rows were added or removed."""
+    previous = list(previous_rows or [])
+    current = list(next_rows or [])
+    if len(previous) != len(current):
+        return None
+    changes = []
+    for idx, (old_row, new_row) in enumerate(zip(previous, current)):
+        old_row = dict(old_row or {})
+        new_row = dict(new_row or {})
+        if old_row == new_row:
+            continue
+        if set(old_row) != set(new_row):
+            changes.append((idx, None, new_row))
+            continue
+        for field, value in new_row.items():
+            if old_row.get(field) != value:
+                changes.append((idx, field, value))
+    return changes
+
+
+def output_group_slices(output_specs):
+    """
+    Return ``{group: (start, stop)}`` output slices for ``output_specs``, a sequence of ``(group, component_id, prop)``.
+
+    Entries with a ``None`` group are not skipped. Each group must be one contiguous run of outputs.
+    """
+    groups = {}
+    for index, (group, _component_id, _prop) in enumerate(output_specs):
+        if group is None:
+            continue
+        start, stop = groups.get(group, (index, index))
+        if stop != index:
+            raise ValueError(f"Output group {group!r} is not contiguous.")
+        groups[group] = (start, index + 1)
+    return groups
+
+
+def skip_unchanged_output_groups(outputs, groups, previous_fingerprints, skip_value):
+    """
+    Replace output groups the client already shows with ``skip_value``.
+
+    ``groups`` maps a group name to a ``(start, stop)`` slice of ``outputs``. Returns the output list and
+    the per-group fingerprints for the client to send back on its next request.
+    """
+    result = list(outputs)
+    previous_fingerprints = previous_fingerprints if isinstance(previous_fingerprints, dict) else {}
+    fingerprints = {}
+    for group, (start, stop) in groups.items():
+        fingerprint = hashlib.blake2b(repr(tuple(result[start:stop])).encode("utf-8"), digest_size=8).hexdigest()
+        fingerprints[group] = fingerprint
+        if previous_fingerprints.get(group) == fingerprint:
+            result[start:stop] = [skip_value] * (stop - start)
+    return result, fingerprints
+
+
+def skip_unchanged_outputs(outputs, current_values, skip_value):
+    """Replace outputs equal to the property values the client reported with ``skip_value``."""
+    return tuple(skip_value if value == current else value for value, current in zip(outputs, current_values))
@@ -2,8 +2,6 @@ import logging
 import time
 from datetime import timedelta
 
-import pandas as pd
-
 from runtime.api_runtime_state import ensure_api_connection_runtime, publish_api_fetch_health
 from istentore_api import AuthenticationError, IstentoreAPI
 from scheduling.runtime import crop_schedule_frame_to_window, merge_schedule_frames
@@ -100,10 +98,7 @@ def _reconcile_day_status(shared_data, today_date, tomorrow_date, plant_ids):
 def _prune_api_schedule_frames_to_window(shared_data, plant_ids, tz, window_start, window_end):
     existing_map = snapshot_locked(
         shared_data,
-        lambda data: {
-            plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id, pd.DataFrame()).copy()
-            for plant_id in plant_ids
-        },
+        lambda data: {plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id) for plant_id in plant_ids},
     )
     pruned_map = {
         plant_id: crop_schedule_frame_to_window(existing_map.get(plant_id), tz, window_start, window_end)
@@ -113,7 +108,9 @@ def _prune_api_schedule_frames_to_window(shared_data, plant_ids, tz, window_star
     def _write_pruned(data):
         schedule_map = data.setdefault("api_schedule_df_by_plant", {})
         for plant_id in plant_ids:
-            schedule_map[plant_id] = pruned_map[plant_id]
+            # Leave frames another writer replaced after the snapshot alone.
+            if schedule_map.get(plant_id) is existing_map.get(plant_id):
+                schedule_map[plant_id] = pruned_map[plant_id]
 
     mutate_locked(shared_data, _write_pruned)
 
@@ -246,7 +243,7 @@ def data_fetcher_agent(config, shared_data):
                     existing_map = snapshot_locked(
                         shared_data,
                         lambda data: {
-                            plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id, pd.DataFrame())
+                            plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id)
                             for plant_id in plant_ids
                         },
                     )
@@ -382,7 +379,7 @@ def data_fetcher_agent(config, shared_data):
                     existing_map = snapshot_locked(
                         shared_data,
                         lambda data: {
-                            plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id, pd.DataFrame())
+                            plant_id: data.get("api_schedule_df_by_plant", {}).get(plant_id)
                             for plant_id in plant_ids
                         },
                     )
@@ -1,7 +1,6 @@
 import logging
 import queue
 import threading
-import time
 
 import pandas as pd
 
@@ -213,8 +212,10 @@ def main():
             public_port = int(config.get("DASHBOARD_PUBLIC_READONLY_PORT", 8060))
             logging.info("Public read-only dashboard available at http://%s:%s/", public_host, public_port)
 
-        while not shared_data["shutdown_event"].is_set():
-            time.sleep(1)
+        # Returns as soon as shutdown is requested; the timeout only keeps Ctrl+C responsive where a blocking
+        # Event.wait() in the main thread cannot be interrupted (Windows).
+        while not shared_data["shutdown_event"].wait(timeout=1.0):
+            pass
 
     except KeyboardInterrupt:
         logging.info("Keyboard interrupt received. Shutting down...")
@@ -280,22 +280,25 @@ class IstentoreAPI:
                 columns=["datetime", "power_setpoint_kw", "reactive_power_setpoint_kvar"]
             ).set_index("datetime")
 
-        data = []
+        timestamps = []
+        power_values = []
         for dt_str, power_kw in schedule.items():
             if "+" in dt_str or "Z" in dt_str:
                 dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
             else:
                 dt = datetime.fromisoformat(dt_str).replace(tzinfo=timezone.utc)
 
-            data.append(
-                {
-                    "datetime": dt.astimezone(self.timezone),
-                    "power_setpoint_kw": power_kw,
-                    "reactive_power_setpoint_kvar": default_q_kvar,
-                }
-            )
-
-        df = pd.DataFrame(data).set_index("datetime").sort_index()
+            timestamps.append(dt.astimezone(self.timezone))
+            power_values.append(power_kw)
+
+        # Build from per-column lists and an explicit DatetimeIndex rather than one dict per row.
+        df = pd.DataFrame(
+            {
+                "power_setpoint_kw": power_values,
+                "reactive_power_setpoint_kvar": [default_q_kvar] * len(power_values),
+            },
+            index=pd.DatetimeIndex(timestamps, name="datetime"),
+        ).sort_index()
         return df
 
 
@@ -217,9 +217,8 @@ def measurement_agent(config, shared_data):
         for plant_id in plant_ids:
             df = df_snapshot_by_plant.get(plant_id)
             if df is not None and not df.empty:
-                tagged = df.copy()
-                tagged["plant_id"] = plant_id
-                dfs.append(tagged)
+                # assign shares the published columns copy-on-write; concat below makes the only copy.
+                dfs.append(df.assign(plant_id=plant_id))
         aggregate_df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
 
         with shared_data["lock"]:
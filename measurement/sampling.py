@@ -5,12 +5,12 @@ import logging
 from pyModbusTCP.client import ModbusClient
 
 from modbus.codec import read_point_internal
-from runtime.contracts import resolve_modbus_endpoint
+from runtime.contracts import cached_modbus_endpoint
 from time_utils import normalize_timestamp_value
 
 
 def get_transport_endpoint(config, plant_id, transport_mode):
-    return resolve_modbus_endpoint(config, plant_id, transport_mode)
+    return cached_modbus_endpoint(config, plant_id, transport_mode)
 
 
 def ensure_client(state, endpoint, plant_id, transport_mode):
@@ -22,6 +22,7 @@ MEASUREMENT_VALUE_COLUMNS = [
 ]
 MEASUREMENT_COLUMNS = ["timestamp"] + MEASUREMENT_VALUE_COLUMNS
 _DAILY_MEASUREMENT_FILE_RE = re.compile(r"^(?P<date>\d{8})_(?P<suffix>[a-z0-9_-]+)\.csv$", re.IGNORECASE)
+_ISO_OFFSET_SUFFIX_PATTERN = r"(?:Z|[+-]\d{2}:?\d{2})$"
 
 
 def normalize_measurements_df(df, tz):
@@ -37,6 +38,28 @@ def normalize_measurements_df(df, tz):
     return result[MEASUREMENT_COLUMNS].sort_values("timestamp").reset_index(drop=True)
 
 
+def latest_measurement_row(df, tz):
+    """Return the row with the latest valid timestamp as a dict, without copying or mutating ``df``."""
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return {}
+    if "timestamp" not in df.columns:
+        try:
+            return dict(df.iloc[-1].to_dict())
+        except Exception:
+            return {}
+    timestamps = normalize_datetime_series(df["timestamp"], tz)
+    valid = timestamps.notna().to_numpy()
+    if not valid.any():
+        return {}
+    values = timestamps.to_numpy()
+    latest_value = values[valid].max()
+    latest_pos = int(np.flatnonzero(valid & (values == latest_value))[-1])
+    try:
+        return dict(df.iloc[latest_pos].to_dict())
+    except Exception:
+        return {}
+
+
 def build_daily_file_path(plant_name, fallback, timestamp, tz, now_ts):
     safe_name = sanitize_plant_name(plant_name, fallback)
     ts = normalize_timestamp_value(timestamp, tz)
@@ -59,11 +82,25 @@ def append_rows_to_csv(file_path, rows, tz):
     df.to_csv(file_path, mode="a", header=write_header, index=False)
 
 
+def _parse_csv_timestamps(values, tz):
+    """Parse offset-qualified ISO timestamps in one vectorized pass, else fall back to per-value normalization."""
+    text = values.dropna().astype(str)
+    if text.empty or not text.str.contains(_ISO_OFFSET_SUFFIX_PATTERN).all():
+        return normalize_datetime_series(values, tz)
+    try:
+        return pd.to_datetime(values, format="ISO8601", utc=True).dt.tz_convert(tz)
+    except (TypeError, ValueError):
+        return normalize_datetime_series(values, tz)
+
+
 def load_file_for_cache(file_path, tz):
     if not os.path.exists(file_path):
         return pd.DataFrame(columns=MEASUREMENT_COLUMNS)
     try:
-        return normalize_measurements_df(pd.read_csv(file_path), tz)
+        df = pd.read_csv(file_path)
+        if "timestamp" in df.columns:
+            df["timestamp"] = _parse_csv_timestamps(df["timestamp"], tz)
+        return normalize_measurements_df(df, tz)
     except Exception as exc:
         logging.error("Measurement: error reading %s: %s", file_path, exc)
         return pd.DataFrame(columns=MEASUREMENT_COLUMNS)
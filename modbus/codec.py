@@ -2,6 +2,7 @@
 
 import math
 import struct
+from functools import lru_cache
 
 from modbus.units import external_to_internal, internal_to_external
 
@@ -12,6 +13,9 @@ _FORMAT_META = {
     "uint32": {"word_count": 2, "byte_count": 4, "kind": "int", "signed": False},
     "float32": {"word_count": 2, "byte_count": 4, "kind": "float"},
 }
+# Batched reads: largest unmapped gap bridged between points, and the Modbus limit per read request.
+_MAX_READ_GAP_WORDS = 8
+_MAX_READ_WORDS = 125
 
 
 def format_meta(format_name):
@@ -82,9 +86,22 @@ def encode_engineering_value(endpoint_cfg, point_spec, eng_value):
     """Encode an engineering value into holding-register words."""
     byte_order, word_order = _validate_endpoint_ordering(endpoint_cfg)
     format_name = str(point_spec.get("format", "")).strip().lower()
-    meta = format_meta(format_name)
     scale = _validate_scale(point_spec)
-    raw_value = float(eng_value) / scale
+    try:
+        return list(_encode_words(format_name, scale, byte_order, word_order, float(eng_value)))
+    except _RawRangeError as exc:
+        raise ValueError(f"{exc} point={point_spec!r}") from None
+
+
+class _RawRangeError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=4096)
+def _encode_words(format_name, scale, byte_order, word_order, eng_value):
+    # Pure in its arguments; dispatch rewrites the same few schedule setpoints every tick.
+    meta = format_meta(format_name)
+    raw_value = eng_value / scale
 
     if meta["kind"] == "float":
         payload = struct.pack(">f", float(raw_value))
@@ -92,16 +109,13 @@ def encode_engineering_value(endpoint_cfg, point_spec, eng_value):
         raw_int = _quantize_integer_raw(raw_value)
         min_raw, max_raw = _int_bounds(format_name)
         if raw_int < min_raw or raw_int > max_raw:
-            raise ValueError(
-                f"Raw value {raw_int} out of range for {format_name} "
-                f"({min_raw}..{max_raw}) point={point_spec!r}"
-            )
+            raise _RawRangeError(f"Raw value {raw_int} out of range for {format_name} ({min_raw}..{max_raw})")
         payload = int(raw_int).to_bytes(meta["byte_count"], byteorder="big", signed=bool(meta.get("signed")))
 
     words = _canonical_bytes_to_words(payload, byte_order=byte_order, word_order=word_order)
     if len(words) != int(meta["word_count"]):
         raise ValueError("Encoded word count mismatch.")
-    return words
+    return tuple(words)
 
 
 def decode_engineering_value(endpoint_cfg, point_spec, raw_words):
@@ -188,6 +202,57 @@ def read_point_internal(client, endpoint_cfg, point_name_or_spec):
     return external_to_internal(point_name, point_spec.get("unit"), external_value)
 
 
+def read_points_internal(client, endpoint_cfg, point_names_or_specs, *, max_gap_words=_MAX_READ_GAP_WORDS):
+    """
+    Read several points with as few holding-register requests as possible.
+
+    Points whose registers are at most ``max_gap_words`` apart share one request; if a shared request fails
+    (for example because the device rejects an unmapped gap register) its points are read one by one.
+    Returns ``{point_name: internal_value_or_None}``.
+    """
+    points = []
+    for point_name_or_spec in point_names_or_specs:
+        point_name, point_spec = _resolve_point_name_and_spec(endpoint_cfg, point_name_or_spec)
+        start = int(point_spec["address"])
+        word_count = int(point_spec.get("word_count") or format_meta(point_spec.get("format"))["word_count"])
+        points.append((start, start + word_count, point_name, point_spec))
+    points.sort(key=lambda item: (item[0], item[1]))
+
+    values = {}
+    group = []
+    group_end = None
+    for point in points:
+        if group and (point[0] - group_end > int(max_gap_words) or max(point[1], group_end) - group[0][0] > _MAX_READ_WORDS):
+            values.update(_read_point_group(client, endpoint_cfg, group))
+            group = []
+        group_end = point[1] if not group else max(group_end, point[1])
+        group.append(point)
+    if group:
+        values.update(_read_point_group(client, endpoint_cfg, group))
+    return values
+
+
+def _read_point_group(client, endpoint_cfg, group):
+    if len(group) == 1:
+        _, _, point_name, point_spec = group[0]
+        return {point_name: read_point_internal(client, endpoint_cfg, point_spec | {"name": point_name})}
+
+    start = group[0][0]
+    end = max(point_end for _, point_end, _, _ in group)
+    regs = client.read_holding_registers(start, end - start)
+    if not regs or len(regs) != end - start:
+        return {
+            point_name: read_point_internal(client, endpoint_cfg, point_spec | {"name": point_name})
+            for _, _, point_name, point_spec in group
+        }
+
+    values = {}
+    for point_start, point_end, point_name, point_spec in group:
+        external_value = decode_engineering_value(endpoint_cfg, point_spec, regs[point_start - start : point_end - start])
+        values[point_name] = external_to_internal(point_name, point_spec.get("unit"), external_value)
+    return values
+
+
 def encode_point_internal_words(endpoint_cfg, point_name_or_spec, internal_value):
     """Encode an internal runtime value to the raw holding-register words for a point."""
     point_name, point_spec = _resolve_point_name_and_spec(endpoint_cfg, point_name_or_spec)
@@ -199,3 +264,37 @@ def write_point_internal(client, endpoint_cfg, point_name_or_spec, internal_valu
     point_name, point_spec = _resolve_point_name_and_spec(endpoint_cfg, point_name_or_spec)
     external_value = internal_to_external(point_name, point_spec.get("unit"), internal_value)
     return write_point_holding(client, endpoint_cfg, point_spec, external_value)
+
+
+def write_points_internal(client, endpoint_cfg, values_by_point):
+    """
+    Write several points, combining points on consecutive registers into one write_multiple_registers request.
+
+    Registers between points are never written, so points separated by a gap still get separate requests.
+    Returns True only if every write succeeded.
+    """
+    points = []
+    for point_name, internal_value in values_by_point.items():
+        _, point_spec = _resolve_point_name_and_spec(endpoint_cfg, point_name)
+        words = encode_point_internal_words(endpoint_cfg, point_name, internal_value)
+        points.append((int(point_spec["address"]), words, point_name, internal_value))
+    points.sort(key=lambda item: item[0])
+
+    groups = []
+    for point in points:
+        if groups and hasattr(client, "write_multiple_registers"):
+            last_start, last_words, _, _ = groups[-1][-1]
+            if point[0] == last_start + len(last_words):
+                groups[-1].append(point)
+                continue
+        groups.append([point])
+
+    ok = True
+    for group in groups:
+        if len(group) == 1:
+            _, _, point_name, internal_value = group[0]
+            ok = bool(write_point_internal(client, endpoint_cfg, point_name, internal_value)) and ok
+        else:
+            words = [int(word) for _, point_words, _, _ in group for word in point_words]
+            ok = bool(client.write_multiple_registers(group[0][0], words)) and ok
+    return ok
@@ -2,14 +2,20 @@
 
 import copy
 import re
+from functools import lru_cache
+
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^a-z0-9_-]+")
 
 
 def sanitize_plant_name(name, fallback):
     """Normalize plant names for filenames and path-safe IDs."""
-    text = str(name).strip().lower()
-    text = re.sub(r"[^a-z0-9_-]+", "_", text)
-    text = text.strip("_")
-    return text or fallback
+    return _sanitize_name_text(str(name)) or fallback
+
+
+@lru_cache(maxsize=64)
+def _sanitize_name_text(text):
+    # Plant names come from config, so the handful of distinct values are sanitized once.
+    return _UNSAFE_NAME_CHARS_RE.sub("_", text.strip().lower()).strip("_")
 
 
 def resolve_modbus_endpoint(config, plant_id, transport_mode):
@@ -27,3 +33,17 @@ def resolve_modbus_endpoint(config, plant_id, transport_mode):
         "word_order": endpoint.get("word_order"),
         "points": copy.deepcopy(points),
     }
+
+
+# (plant_id, transport_mode) -> (config, endpoint); config is fixed for the life of the process.
+_endpoint_cache = {}
+
+
+def cached_modbus_endpoint(config, plant_id, transport_mode):
+    """Return ``resolve_modbus_endpoint`` for ``config``, resolved once per plant and mode; treat it as read-only."""
+    cached = _endpoint_cache.get((plant_id, transport_mode))
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    endpoint = resolve_modbus_endpoint(config, plant_id, transport_mode)
+    _endpoint_cache[(plant_id, transport_mode)] = (config, endpoint)
+    return endpoint
@@ -7,7 +7,7 @@ from pyModbusTCP.client import ModbusClient
 from runtime.dispatch_write_runtime import publish_dispatch_write_status, set_dispatch_sending_enabled
 import scheduling.manual_schedule_manager as msm
 from modbus.codec import encode_point_internal_words, read_point_words, write_point_internal
-from runtime.contracts import resolve_modbus_endpoint
+from runtime.contracts import cached_modbus_endpoint
 from scheduling.runtime import resolve_schedule_setpoint, resolve_series_setpoint_asof, split_manual_override_series
 from runtime.shared_state import snapshot_locked
 from time_utils import get_config_tz, now_tz
@@ -39,9 +39,18 @@ def scheduler_agent(config, shared_data):
     previous_q = {plant_id: None for plant_id in plant_ids}
     previous_api_stale = {plant_id: None for plant_id in plant_ids}
     last_manual_prune_day = None
+    manual_end_time_by_key = {}
+
+    def manual_end_time(series_key, series_df):
+        # Published manual series are replaced, never mutated, so the end marker is parsed once per frame.
+        cached = manual_end_time_by_key.get(series_key)
+        if cached is None or cached[0] is not series_df:
+            cached = (series_df, split_manual_override_series(series_df, tz).get("end_ts"))
+            manual_end_time_by_key[series_key] = cached
+        return cached[1]
 
     def ensure_client(plant_id, transport_mode):
-        endpoint = resolve_modbus_endpoint(config, plant_id, transport_mode)
+        endpoint = cached_modbus_endpoint(config, plant_id, transport_mode)
         endpoint_key = (endpoint["host"], endpoint["port"])
 
         if endpoints.get(plant_id) != endpoint_key:
@@ -90,8 +99,8 @@ def scheduler_agent(config, shared_data):
                 "transport_mode": data.get("transport_mode", "local"),
                 "scheduler_running": dict(data.get("scheduler_running_by_plant", {})),
                 "api_map": dict(data.get("api_schedule_df_by_plant", {})),
-                "manual_series_map": dict(data.get("manual_schedule_series_df_by_key", {})),
-                "manual_merge_enabled": dict(data.get("manual_schedule_merge_enabled_by_key", {})),
+                "manual_series_map": data.get("manual_schedule_series_df_by_key", {}),
+                "manual_merge_enabled": data.get("manual_schedule_merge_enabled_by_key", {}),
             },
         )
         transport_mode = snapshot["transport_mode"]
@@ -140,8 +149,8 @@ def scheduler_agent(config, shared_data):
                 p_key, q_key = msm.manual_series_keys_for_plant(plant_id)
                 manual_p_value, manual_p_has = resolve_series_setpoint_asof(manual_series_map.get(p_key), loop_now, tz)
                 manual_q_value, manual_q_has = resolve_series_setpoint_asof(manual_series_map.get(q_key), loop_now, tz)
-                manual_p_end_time = split_manual_override_series(manual_series_map.get(p_key), tz).get("end_ts")
-                manual_q_end_time = split_manual_override_series(manual_series_map.get(q_key), tz).get("end_ts")
+                manual_p_end_time = manual_end_time(p_key, manual_series_map.get(p_key))
+                manual_q_end_time = manual_end_time(q_key, manual_series_map.get(q_key))
 
                 if (
                     bool(manual_merge_enabled.get(p_key, False))
@@ -397,23 +397,23 @@ def manual_editor_rows_to_series_and_end_time(rows, start_time, timezone_name: s
     if pd.isna(start_ts):
         raise ValueError("Invalid start datetime")
 
-    data = []
-    end_time = None
+    offsets_s = []
+    setpoints = []
     previous_value = None
     for row in normalized_rows:
-        offset_s = (row["hours"] * 3600) + (row["minutes"] * 60) + row["seconds"]
-        row_ts = start_ts + pd.Timedelta(seconds=offset_s)
+        offsets_s.append((row["hours"] * 3600) + (row["minutes"] * 60) + row["seconds"])
         if str(row.get("kind", "value")) == "end":
-            end_time = row_ts
             if previous_value is None:
                 raise ValueError("End row requires at least one value breakpoint")
-            data.append({"datetime": row_ts, "setpoint": float(previous_value)})
+            setpoints.append(float(previous_value))
             continue
         previous_value = float(row["setpoint"])
-        data.append({"datetime": row_ts, "setpoint": previous_value})
-    if not data:
+        setpoints.append(previous_value)
+    if not setpoints:
         return _empty_manual_series_df(), None
-    df = pd.DataFrame(data).set_index("datetime")
+    # One vectorized shift of the start timestamp instead of a Timestamp + Timedelta per row.
+    index = start_ts + pd.to_timedelta(np.asarray(offsets_s, dtype=np.int64), unit="s")
+    df = pd.DataFrame({"setpoint": setpoints}, index=index.rename("datetime"))
     norm_df = ensure_manual_series_terminal_duplicate_row(df, timezone_name=timezone_name)
     return norm_df, None
 
@@ -429,9 +429,12 @@ def manual_editor_rows_to_relative_csv_text(rows) -> str:
     return buffer.getvalue()
 
 
-def load_manual_editor_rows_from_relative_csv_text(csv_text: str):
+def load_manual_editor_rows_from_relative_csv_text(csv_data: str | bytes):
+    """Parse a relative editor CSV given as text, or as UTF-8 bytes straight from an upload."""
     try:
-        df = pd.read_csv(io.StringIO(csv_text))
+        # The C parser works on UTF-8 bytes, so raw upload bytes skip a decode/re-encode round trip.
+        buffer = io.BytesIO(csv_data) if isinstance(csv_data, bytes) else io.StringIO(csv_data)
+        df = pd.read_csv(buffer)
     except Exception as exc:
         raise ValueError(f"Could not read CSV: {exc}") from exc
 
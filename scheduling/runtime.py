@@ -187,9 +187,14 @@ def resolve_schedule_setpoint(
     if normalized_df.empty:
         return 0.0, 0.0, (True if source == "api" else None)
 
-    row = normalized_df.asof(now_value)
-    if row is None:
+    # Binary search for the last row at or before now; the index is sorted by normalize_schedule_index.
+    position = int(normalized_df.index.searchsorted(pd.Timestamp(now_value), side="right")) - 1
+    if position < 0:
         return 0.0, 0.0, (True if source == "api" else None)
+    row = normalized_df.iloc[position]
+    if row.isna().any():
+        # asof skips rows with any missing column; only pay for its full scan in that rare case.
+        row = normalized_df.asof(now_value)
 
     p_setpoint = float(row.get("power_setpoint_kw", 0.0) or 0.0)
     q_setpoint = float(row.get("reactive_power_setpoint_kvar", 0.0) or 0.0)
@@ -200,8 +205,8 @@ def resolve_schedule_setpoint(
     api_is_stale = None
     if source == "api":
         validity_window = api_validity_window if api_validity_window is not None else pd.Timedelta(minutes=15)
-        row_ts = normalized_df.index.asof(now_value)
-        api_is_stale = pd.isna(row_ts) or (pd.Timestamp(now_value) - pd.Timestamp(row_ts) > validity_window)
+        row_ts = normalized_df.index[position]
+        api_is_stale = pd.Timestamp(now_value) - row_ts > validity_window
         if api_is_stale:
             p_setpoint = 0.0
             q_setpoint = 0.0
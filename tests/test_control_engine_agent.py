@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 from control.command_runtime import enqueue_control_command
 from control.engine_agent import (
     _execute_command,
+    _get_plant_modbus_config,
     _publish_observed_state,
     _run_single_engine_cycle,
     _start_one_plant,
@@ -83,6 +84,20 @@ def _shared_data():
 
 
 class ControlEngineAgentTests(unittest.TestCase):
+    def test_plant_modbus_config_is_resolved_once_per_config_plant_and_mode(self):
+        shared_data = _shared_data()
+        config = {"PLANTS": {"lib": {"modbus": {"remote": {"host": "10.0.0.1", "port": 502}, "local": {"port": 5020}}}}}
+
+        remote_cfg = _get_plant_modbus_config(config, shared_data, "lib")
+        local_cfg = _get_plant_modbus_config(config, shared_data, "lib", transport_mode="local")
+
+        self.assertIs(_get_plant_modbus_config(config, shared_data, "lib"), remote_cfg)
+        self.assertEqual((remote_cfg["mode"], remote_cfg["host"], remote_cfg["port"]), ("remote", "10.0.0.1", 502))
+        self.assertEqual((local_cfg["mode"], local_cfg["host"], local_cfg["port"]), ("local", "localhost", 5020))
+
+        other_config = {"PLANTS": {"lib": {"modbus": {"remote": {"host": "10.0.0.2", "port": 502}}}}}
+        self.assertEqual(_get_plant_modbus_config(other_config, shared_data, "lib")["host"], "10.0.0.2")
+
     def test_start_one_plant_success_preserves_dispatch_gate_and_updates_transition(self):
         shared_data = _shared_data()
         calls = []
@@ -1,10 +1,24 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
-from control.modbus_io import wait_until_battery_power_below_threshold
+from pyModbusTCP.constants import MB_EXCEPT_ERR, MB_NO_ERR, MB_SOCK_CLOSE_ERR
+
+from control.modbus_io import (
+    close_pooled_clients,
+    read_enable_state,
+    send_setpoints,
+    set_enable,
+    wait_until_battery_power_below_threshold,
+)
 
 
 class ControlModbusIoTests(unittest.TestCase):
+    def setUp(self):
+        close_pooled_clients()
+
+    def tearDown(self):
+        close_pooled_clients()
+
     @patch("control.modbus_io.time.sleep")
     @patch("control.modbus_io.ModbusClient")
     def test_wait_until_power_threshold_fail_fast_on_connect_failure(self, client_cls, sleep_mock):
@@ -24,13 +38,13 @@ class ControlModbusIoTests(unittest.TestCase):
         sleep_mock.assert_not_called()
 
     @patch("control.modbus_io.time.sleep")
-    @patch("control.modbus_io.read_point_internal")
+    @patch("control.modbus_io.read_points_internal")
     @patch("control.modbus_io.ModbusClient")
-    def test_wait_until_power_threshold_keeps_reachable_success_behavior(self, client_cls, read_point_mock, sleep_mock):
+    def test_wait_until_power_threshold_keeps_reachable_success_behavior(self, client_cls, read_points_mock, sleep_mock):
         client = MagicMock()
         client.open.return_value = True
         client_cls.return_value = client
-        read_point_mock.side_effect = [0.5, 0.0]
+        read_points_mock.return_value = {"p_battery": 0.5, "q_battery": 0.0}
 
         result = wait_until_battery_power_below_threshold(
             {"host": "127.0.0.1", "port": 502, "mode": "remote"},
@@ -41,7 +55,75 @@ class ControlModbusIoTests(unittest.TestCase):
 
         self.assertTrue(result)
         sleep_mock.assert_not_called()
-        self.assertEqual(read_point_mock.call_count, 2)
+        read_points_mock.assert_called_once_with(client, ANY, ["p_battery", "q_battery"])
+
+    @patch("control.modbus_io.write_points_internal")
+    @patch("control.modbus_io.read_point_internal")
+    @patch("control.modbus_io.ModbusClient")
+    def test_control_io_reuses_connection_until_an_error(self, client_cls, read_point_mock, write_points_mock):
+        endpoint = {"host": "127.0.0.1", "port": 502, "mode": "remote"}
+        first_client = MagicMock()
+        first_client.open.return_value = True
+        second_client = MagicMock()
+        second_client.open.return_value = True
+        client_cls.side_effect = [first_client, second_client]
+        read_point_mock.return_value = 1
+        write_points_mock.return_value = True
+
+        self.assertEqual(read_enable_state(endpoint), 1)
+        self.assertTrue(send_setpoints(endpoint, "LIB", 0.0, 0.0))
+        self.assertEqual(client_cls.call_count, 1)
+        first_client.close.assert_not_called()
+
+        read_point_mock.side_effect = OSError("socket reset")
+        self.assertIsNone(read_enable_state(endpoint))
+        first_client.close.assert_called_once()
+
+        read_point_mock.side_effect = None
+        self.assertEqual(read_enable_state(endpoint), 1)
+        self.assertEqual(client_cls.call_count, 2)
+
+    @patch("control.modbus_io.write_point_internal")
+    @patch("control.modbus_io.read_point_internal")
+    @patch("control.modbus_io.ModbusClient")
+    def test_failed_write_on_pooled_client_retries_on_fresh_connection(self, client_cls, read_point_mock, write_point_mock):
+        endpoint = {"host": "127.0.0.1", "port": 502, "mode": "remote"}
+        stale_client = MagicMock(last_error=MB_NO_ERR)
+        stale_client.open.return_value = True
+        fresh_client = MagicMock(last_error=MB_NO_ERR)
+        fresh_client.open.return_value = True
+        client_cls.side_effect = [stale_client, fresh_client]
+        read_point_mock.return_value = 1
+        self.assertEqual(read_enable_state(endpoint), 1)
+
+        def write_point(client, *_args):
+            if client is stale_client:
+                client.last_error = MB_SOCK_CLOSE_ERR
+                return False
+            return True
+
+        write_point_mock.side_effect = write_point
+
+        self.assertTrue(set_enable(endpoint, "LIB", 0))
+        stale_client.close.assert_called_once()
+        self.assertEqual([call.args[0] for call in write_point_mock.call_args_list], [stale_client, fresh_client])
+
+        self.assertEqual(read_enable_state(endpoint), 1)
+        self.assertEqual(client_cls.call_count, 2)
+        fresh_client.close.assert_not_called()
+
+    @patch("control.modbus_io.write_point_internal")
+    @patch("control.modbus_io.ModbusClient")
+    def test_rejected_write_keeps_connection_without_retry(self, client_cls, write_point_mock):
+        endpoint = {"host": "127.0.0.1", "port": 502, "mode": "remote"}
+        client = MagicMock(last_error=MB_EXCEPT_ERR)
+        client.open.return_value = True
+        client_cls.return_value = client
+        write_point_mock.return_value = False
+
+        self.assertFalse(set_enable(endpoint, "LIB", 1))
+        write_point_mock.assert_called_once()
+        client.close.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ import pandas as pd
 
 from control.flows import (
     perform_transport_switch,
+    safe_stop_all_plants,
     safe_stop_plant,
 )
 
@@ -138,6 +139,20 @@ class DashboardControlFlowTests(unittest.TestCase):
         self.assertEqual(shared_data["plant_transition_by_plant"]["lib"], "unknown")
         self.assertFalse(shared_data["scheduler_running_by_plant"]["lib"])
 
+    def test_safe_stop_all_plants_overlaps_plant_waits(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _safe_stop(plant_id):
+            # Both plants must be stopping at the same time to pass the barrier.
+            barrier.wait()
+            return {"threshold_reached": True, "disable_ok": plant_id == "lib"}
+
+        results = safe_stop_all_plants(["lib", "vrfb"], _safe_stop)
+
+        self.assertEqual(list(results), ["lib", "vrfb"])
+        self.assertTrue(results["lib"]["disable_ok"])
+        self.assertFalse(results["vrfb"]["disable_ok"])
+
 
 if __name__ == "__main__":
     unittest.main()
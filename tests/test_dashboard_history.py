@@ -9,7 +9,9 @@ import pandas as pd
 from dashboard.history import (
     build_slider_marks,
     clamp_epoch_range,
+    history_file_spans,
     load_cropped_measurements_for_range,
+    load_history_file_cached,
     scan_measurement_history_index,
     serialize_measurements_for_download,
 )
@@ -64,6 +66,23 @@ class DashboardHistoryTests(unittest.TestCase):
                 self.assertEqual(index["files_by_plant"]["lib"][0]["rows"], 2)
                 self.assertLess(index["global_start_ms"], index["global_end_ms"])
 
+    def test_history_file_spans_converts_bounds_and_skips_invalid_items(self):
+        tz = ZoneInfo("Europe/Madrid")
+        files_by_plant = {
+            "lib": [
+                {"path": "a.csv", "start_ms": 1711846800000, "end_ms": 1711850400000},
+                {"path": "b.csv", "start_ms": None, "end_ms": 1711850400000},
+            ],
+            "vrfb": [{"path": "c.csv", "start_ms": 1711850400000, "end_ms": 1711854000000}],
+        }
+
+        spans = history_file_spans(files_by_plant, ["vrfb", "lib"], tz)
+
+        self.assertEqual([(plant_id, item["path"]) for plant_id, item, _, _ in spans], [("vrfb", "c.csv"), ("lib", "a.csv")])
+        self.assertEqual(spans[1][2], pd.Timestamp("2024-03-31 03:00:00", tz=tz))
+        self.assertEqual(spans[1][3], pd.Timestamp("2024-03-31 04:00:00", tz=tz))
+        self.assertEqual(history_file_spans(None, ["lib"], tz), [])
+
     def test_clamp_epoch_range_defaults_and_clamps(self):
         self.assertEqual(clamp_epoch_range(None, 100, 200), [100, 200])
         self.assertEqual(clamp_epoch_range([0, 1], 100, 200), [100, 200])
@@ -100,6 +119,24 @@ class DashboardHistoryTests(unittest.TestCase):
                 self.assertEqual(cropped.iloc[0]["p_poi_kw"], 2.0)
                 self.assertEqual(cropped.iloc[1]["p_poi_kw"], 3.0)
 
+    def test_load_history_file_cached_reuses_parse_until_file_changes(self):
+        tz = ZoneInfo("Europe/Madrid")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "20260221_lib.csv")
+            pd.DataFrame([_row("2026-02-21T13:10:03+01:00", 10.0)], columns=MEASUREMENT_COLUMNS).to_csv(path, index=False)
+
+            first = load_history_file_cached(path, tz)
+            self.assertIs(load_history_file_cached(path, tz), first)
+
+            pd.DataFrame(
+                [_row("2026-02-21T13:10:03+01:00", 10.0), _row("2026-02-21T13:11:03+01:00", 11.0)],
+                columns=MEASUREMENT_COLUMNS,
+            ).to_csv(path, index=False)
+            reloaded = load_history_file_cached(path, tz)
+
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(len(reloaded), 2)
+
     def test_serialize_measurements_for_download_keeps_column_order_and_iso(self):
         tz = ZoneInfo("Europe/Madrid")
         df = pd.DataFrame([_row("2026-02-21T13:10:03+01:00", 10.0)], columns=MEASUREMENT_COLUMNS)
@@ -110,12 +147,41 @@ class DashboardHistoryTests(unittest.TestCase):
         self.assertIsInstance(serialized.iloc[0]["timestamp"], str)
         self.assertIn("+01:00", serialized.iloc[0]["timestamp"])
 
+    def test_serialize_measurements_for_download_matches_scalar_iso_across_dst(self):
+        tz = ZoneInfo("Europe/Madrid")
+        timestamps = pd.to_datetime(
+            pd.Series(["2026-03-29T01:59:59+01:00", "2026-03-29T03:00:00.250000+02:00", None]),
+            format="ISO8601",
+            utc=True,
+        ).dt.tz_convert(tz)
+        df = pd.DataFrame([_row(ts, 1.0) for ts in timestamps], columns=MEASUREMENT_COLUMNS)
+        df["timestamp"] = timestamps
+
+        serialized = serialize_measurements_for_download(df, tz)
+
+        self.assertEqual(
+            serialized["timestamp"].tolist(),
+            ["2026-03-29T01:59:59+01:00", "2026-03-29T03:00:00.250000+02:00", ""],
+        )
+
     def test_build_slider_marks_returns_sparse_labels(self):
         tz = ZoneInfo("Europe/Madrid")
         marks = build_slider_marks(1_000, 11_000, tz, max_marks=5)
         self.assertGreaterEqual(len(marks), 2)
         self.assertLessEqual(len(marks), 5)
 
+    def test_build_slider_marks_returns_independent_dicts_for_repeated_bounds(self):
+        tz = ZoneInfo("Europe/Madrid")
+        first = build_slider_marks(11_000, 1_000, tz, max_marks=5)
+        first[0] = "mutated"
+
+        second = build_slider_marks(1_000, 11_000, tz, max_marks=5)
+
+        self.assertNotIn(0, second)
+        self.assertEqual(min(second), 1_000)
+        self.assertEqual(max(second), 11_000)
+        self.assertEqual(build_slider_marks(1_000, 1_000, tz), {1_000: "01-01 01:00"})
+
 
 if __name__ == "__main__":
     unittest.main()
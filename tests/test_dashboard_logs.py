@@ -8,7 +8,14 @@ from zoneinfo import ZoneInfo
 
 from dash import html
 
-from dashboard.logs import get_logs_dir, get_today_log_file_path, parse_and_format_historical_logs, read_log_tail
+from dashboard.logs import (
+    build_log_file_options,
+    get_logs_dir,
+    get_today_log_file_path,
+    list_historical_log_files,
+    parse_and_format_historical_logs,
+    read_log_tail,
+)
 
 
 class DashboardLogsTests(unittest.TestCase):
@@ -30,6 +37,17 @@ class DashboardLogsTests(unittest.TestCase):
         self.assertEqual(formatted[1].children[1].children, "WARNING: ")
         self.assertEqual(formatted[2].children[1].children, "ERROR: ")
 
+    def test_parse_and_format_historical_logs_ignores_surrounding_whitespace(self):
+        content = "  2026-02-21 14:04:51 - debug -  spaced message \t\r\n\n2026-02-21 14:04:52 - INFO - \n"
+
+        formatted = parse_and_format_historical_logs(content)
+
+        self.assertEqual(len(formatted), 1)
+        self.assertEqual(formatted[0].children[0].children, "[2026-02-21 14:04:51] ")
+        self.assertEqual(formatted[0].children[1].children, "DEBUG: ")
+        self.assertEqual(formatted[0].children[1].style["color"], "#94a3b8")
+        self.assertEqual(formatted[0].children[2].children, " spaced message")
+
     def test_get_today_log_file_path_uses_timezone_date(self):
         tz = ZoneInfo("Europe/Madrid")
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -61,6 +79,57 @@ class DashboardLogsTests(unittest.TestCase):
                 tail = read_log_tail(file_path, max_lines=3)
                 self.assertEqual(tail, "".join(deque([f"line-{i}\n" for i in range(1, 11)], maxlen=3)))
 
+    def test_read_log_tail_reads_back_across_blocks_and_normalizes_newlines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "sample.log")
+            with open(file_path, "wb") as handle:
+                handle.write("".join(f"línea-{idx}\r\n" for idx in range(1, 201)).encode("utf-8"))
+                handle.write(b"partial")
+
+            tail = read_log_tail(file_path, max_lines=4, block_size=7)
+            self.assertEqual(tail, "línea-198\nlínea-199\nlínea-200\npartial")
+            self.assertEqual(read_log_tail(file_path, max_lines=500, block_size=7).count("\n"), 200)
+
+    def test_build_log_file_options_limits_filters_and_keeps_selection(self):
+        log_files = [(f"2026-01-{day:02d}", f"/logs/2026-01-{day:02d}_hil.log") for day in range(30, 0, -1)]
+
+        options = build_log_file_options(log_files, selected_value="/logs/2026-01-01_hil.log", limit=3)
+        self.assertEqual(
+            [option["value"] for option in options],
+            [
+                "today",
+                "/logs/2026-01-30_hil.log",
+                "/logs/2026-01-29_hil.log",
+                "/logs/2026-01-28_hil.log",
+                "/logs/2026-01-01_hil.log",
+            ],
+        )
+
+        searched = build_log_file_options(log_files, search_value=" 01-1", limit=3)
+        self.assertEqual([option["label"] for option in searched], ["Today", "2026-01-19", "2026-01-18", "2026-01-17"])
+
+    def test_list_historical_log_files_orders_dated_then_undated_and_skips_today(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in (
+                "2026-02-20_hil_scheduler.log",
+                "2026-02-22_hil_scheduler.log",
+                "2026-02-21_hil_scheduler.log",
+                "2026-13-40_hil_scheduler.log",
+                "session.log",
+                "notes.txt",
+            ):
+                with open(os.path.join(tmpdir, name), "w", encoding="utf-8") as handle:
+                    handle.write("x\n")
+
+            files = list_historical_log_files(tmpdir, exclude_path=os.path.join(tmpdir, "2026-02-22_hil_scheduler.log"))
+
+            self.assertEqual(
+                [label for label, _ in files],
+                ["2026-02-21", "2026-02-20", "session.log", "2026-13-40_hil_scheduler.log"],
+            )
+            self.assertEqual(files[0][1], os.path.join(tmpdir, "2026-02-21_hil_scheduler.log"))
+            self.assertEqual(list_historical_log_files(os.path.join(tmpdir, "missing")), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,23 @@ from zoneinfo import ZoneInfo
 try:
     import pandas as pd
 
-    from dashboard.plotting import DEFAULT_PLOT_THEME, DEFAULT_TRACE_COLORS, create_plant_figure
+    from dashboard.plotting import (
+        DEFAULT_PLOT_THEME,
+        DEFAULT_TRACE_COLORS,
+        apply_figure_theme,
+        build_history_timeline_traces,
+        create_plant_figure,
+        downsample_rows_min_max,
+        figure_revision_factory,
+        float32_column_values,
+        move_time_indicator,
+        numeric_column_values,
+        same_figure_inputs,
+        step_change_rows,
+        time_indicator_patch,
+        time_indicator_shape_indexes,
+        wall_clock_time_values,
+    )
     _IMPORT_ERROR = None
 except ModuleNotFoundError as exc:  # pragma: no cover - environment-dependent test skip
     pd = None
@@ -85,6 +101,17 @@ class DashboardPlottingTests(unittest.TestCase):
         self.plot_theme = dict(DEFAULT_PLOT_THEME)
         self.trace_colors = dict(DEFAULT_TRACE_COLORS)
 
+    def test_apply_figure_theme_styles_every_axis_through_template(self):
+        fig = self._fig(pd.DataFrame(), pd.DataFrame())
+        apply_figure_theme(fig, self.plot_theme, height=300, margin=dict(l=0, r=0, t=0, b=0), uirevision="x", legend_y=1.2)
+
+        layout = fig.to_dict()["layout"]
+        self.assertEqual(layout["template"]["layout"]["xaxis"]["gridcolor"], self.plot_theme["grid"])
+        self.assertEqual(layout["template"]["layout"]["yaxis"]["tickfont"]["color"], self.plot_theme["muted"])
+        self.assertEqual(layout["template"]["layout"]["plot_bgcolor"], self.plot_theme["plot_bg"])
+        self.assertEqual(layout["legend"], {"y": 1.2})
+        self.assertEqual(layout["height"], 300)
+
     def _fig(self, schedule_df, measurements_df, **kwargs):
         return create_plant_figure(
             "lib",
@@ -210,6 +237,28 @@ class DashboardPlottingTests(unittest.TestCase):
         self.assertLess(trace_order.index("P Bat"), trace_order.index("P POI"))
         self.assertLess(trace_order.index("Q Bat"), trace_order.index("Q POI"))
 
+    def test_measurement_traces_use_webgl_and_schedule_traces_stay_svg(self):
+        base = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
+        schedule_df = _schedule_df(base, base + timedelta(hours=1))
+        measurements_df = _measurements_df(base, base + timedelta(hours=1))
+
+        trace_types = {str(trace.name): trace.type for trace in self._fig(schedule_df, measurements_df).data}
+        svg_trace_types = {trace.type for trace in self._fig(schedule_df, measurements_df, use_webgl=False).data}
+
+        self.assertEqual(trace_types.pop("Pref"), "scatter")
+        self.assertEqual(trace_types.pop("Qref"), "scatter")
+        self.assertEqual(set(trace_types.values()), {"scattergl"})
+        self.assertEqual(svg_trace_types, {"scatter"})
+
+    def test_measurement_trace_values_are_sent_as_float32(self):
+        base = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
+        fig = self._fig(None, _measurements_df(base, base + timedelta(hours=1)))
+
+        self.assertEqual(str(_traces_by_suffix(fig, "P POI")[0].y.dtype), "float32")
+        values = float32_column_values(pd.DataFrame({"v": [1.5, "bad", None]}), "v")
+        self.assertEqual(values[0], 1.5)
+        self.assertTrue(all(value != value for value in values[1:]))
+
     def test_time_indicator_adds_vertical_dashed_lines(self):
         base = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
         fig = self._fig(pd.DataFrame(), _measurements_df(base), time_indicator_ts=base)
@@ -221,6 +270,117 @@ class DashboardPlottingTests(unittest.TestCase):
             self.assertEqual(shape["x0"], shape["x1"])
             self.assertEqual(shape["line"]["dash"], "dash")
 
+    def test_move_time_indicator_only_shifts_indicator_lines(self):
+        base = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
+        figure = self._fig(pd.DataFrame(), _measurements_df(base), time_indicator_ts=base).to_dict()
+        later = base + timedelta(minutes=5)
+
+        moved = move_time_indicator(figure, later)
+
+        self.assertEqual(len(moved["layout"]["shapes"]), 4)
+        for shape in moved["layout"]["shapes"]:
+            self.assertEqual(shape["x0"], later)
+            self.assertEqual(shape["x1"], later)
+        for shape in figure["layout"]["shapes"]:
+            self.assertEqual(shape["x0"], base)
+        self.assertIs(moved["data"], figure["data"])
+        self.assertEqual(time_indicator_shape_indexes(figure), [0, 1, 2, 3])
+        self.assertEqual(time_indicator_shape_indexes(self._fig(pd.DataFrame(), _measurements_df(base)).to_dict()), [])
+
+    def test_wall_clock_time_values_keep_local_time_across_dst(self):
+        index = pd.DatetimeIndex(
+            [datetime(2026, 3, 29, 1, 45, tzinfo=self.tz), datetime(2026, 3, 29, 3, 0, tzinfo=self.tz)]
+        )
+
+        values = wall_clock_time_values(index)
+
+        self.assertEqual(values.dtype.kind, "M")
+        self.assertEqual([str(pd.Timestamp(v)) for v in values], ["2026-03-29 01:45:00", "2026-03-29 03:00:00"])
+        self.assertEqual(numeric_column_values(pd.DataFrame({"a": [1.0]}), "a").tolist(), [1.0])
+        self.assertEqual(len(numeric_column_values(pd.DataFrame(), "a")), 0)
+
+    def test_long_measurement_series_are_downsampled_keeping_extremes(self):
+        base = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
+        measurements = _measurements_df(*[base + timedelta(seconds=2 * idx) for idx in range(400)])
+        measurements.loc[123, "p_poi_kw"] = 999.0
+        measurements.loc[250, "v_poi_kV"] = 30.0
+
+        fig = self._fig(pd.DataFrame(), measurements, max_measurement_rows=60, voltage_autorange_padding_kv=0.5)
+
+        p_poi = _trace_by_suffix(fig, "P POI")
+        self.assertLessEqual(len(p_poi.x), 60)
+        self.assertIn(999.0, list(p_poi.y))
+        self.assertEqual(_x_as_timestamps(p_poi, self.tz)[0], base)
+        self.assertEqual(_x_as_timestamps(p_poi, self.tz)[-1], base + timedelta(seconds=798))
+        self.assertEqual(_voltage_axis_range(fig)[1], 30.5)
+
+    def test_downsample_rows_min_max_returns_short_frames_unchanged(self):
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+        self.assertIs(downsample_rows_min_max(df, ["a"], 10), df)
+        self.assertIs(downsample_rows_min_max(df, ["missing"], 1), df)
+
+    def test_step_change_rows_keeps_change_points_and_last_row(self):
+        df = pd.DataFrame({"a": [1.0, 1.0, 2.0, 2.0, float("nan"), float("nan"), 2.0, 2.0]})
+        self.assertEqual(step_change_rows(df, "a").index.tolist(), [0, 2, 3, 4, 6, 7])
+        held = pd.DataFrame({"a": [100.0, 100.0, 100.0, float("nan")]})
+        self.assertEqual(step_change_rows(held, "a").index.tolist(), [0, 2, 3])
+        changing = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+        self.assertIs(step_change_rows(changing, "a"), changing)
+        self.assertIs(step_change_rows(df, "missing"), df)
+
+    def test_build_history_timeline_traces_joins_files_into_one_trace_per_plant(self):
+        t0 = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
+        spans = [
+            ("lib", {"path": "data/a/lib_1.csv"}, t0, t0 + timedelta(hours=1)),
+            ("vrfb", {"path": "data/b/vrfb_1.csv"}, t0, t0 + timedelta(hours=2)),
+            ("lib", {"path": "data/a/lib_2.csv"}, t0 + timedelta(hours=3), t0 + timedelta(hours=4)),
+        ]
+
+        traces = build_history_timeline_traces(spans, {"lib": "LIB"}, {"lib": "#111111"}, "#999999")
+
+        self.assertEqual([trace.legendgroup for trace in traces], ["lib", "vrfb"])
+        lib, vrfb = traces
+        self.assertEqual(len(lib.x), 5)
+        self.assertIsNone(lib.x[2])
+        self.assertEqual(list(lib.y), ["LIB", "LIB", None, "LIB", "LIB"])
+        self.assertEqual(list(lib.customdata), ["lib_1.csv", "lib_1.csv", None, "lib_2.csv", "lib_2.csv"])
+        self.assertEqual(lib.line.color, "#111111")
+        self.assertEqual((vrfb.name, vrfb.line.color), ("VRFB", "#999999"))
+        self.assertEqual(build_history_timeline_traces([], {}, {}, "#999999"), [])
+
+    def test_time_indicator_patch_moves_only_listed_shapes(self):
+        ts = datetime(2026, 2, 23, 12, 0, tzinfo=self.tz)
+
+        operations = time_indicator_patch([1, 3], ts).to_plotly_json()["operations"]
+
+        self.assertEqual(
+            [(op["location"], op["params"]["value"]) for op in operations],
+            [
+                (["layout", "shapes", 1, "x0"], ts),
+                (["layout", "shapes", 1, "x1"], ts),
+                (["layout", "shapes", 3, "x0"], ts),
+                (["layout", "shapes", 3, "x1"], ts),
+            ],
+        )
+        self.assertEqual(time_indicator_patch([], ts).to_plotly_json()["operations"], [])
+
+    def test_figure_revision_factory_yields_unique_tagged_ids(self):
+        next_revision = figure_revision_factory("public-")
+
+        first, second, api = next_revision(), next_revision(), next_revision("api")
+
+        self.assertTrue(first.startswith("public-"))
+        self.assertEqual(len({first, second, api}), 3)
+        self.assertTrue(api.endswith(":api:3"))
+
+    def test_same_figure_inputs_compares_frames_by_identity(self):
+        frame = pd.DataFrame({"a": [1.0]})
+
+        self.assertTrue(same_figure_inputs((frame, "local", 1), (frame, "local", 1)))
+        self.assertFalse(same_figure_inputs((frame, "local"), (frame.copy(), "local")))
+        self.assertFalse(same_figure_inputs((frame, "local"), (frame, "remote")))
+        self.assertFalse(same_figure_inputs((frame,), (frame, "local")))
+
     def test_custom_voltage_padding_sets_row4_range(self):
         base = datetime(2026, 2, 23, 0, 0, tzinfo=self.tz)
         measurements_df = _measurements_df(base, base + timedelta(hours=1))
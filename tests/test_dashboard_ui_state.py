@@ -2,15 +2,28 @@ import unittest
 from datetime import datetime, timedelta, timezone
 
 from dashboard.ui_state import (
+    binary_toggle_classes,
+    diff_editor_rows,
     get_plant_power_toggle_state,
     get_recording_toggle_state,
     is_observed_state_effectively_stale,
+    output_group_slices,
     resolve_click_feedback_transition_state,
     resolve_runtime_transition_state,
+    skip_unchanged_output_groups,
+    skip_unchanged_outputs,
 )
 
 
 class DashboardUiStateTests(unittest.TestCase):
+    def test_binary_toggle_classes_mark_active_side(self):
+        self.assertEqual(
+            binary_toggle_classes("positive"),
+            ("toggle-option toggle-option--positive active", "toggle-option toggle-option--negative"),
+        )
+        self.assertEqual(binary_toggle_classes("negative", semantic=False), ("toggle-option", "toggle-option active"))
+        self.assertEqual(binary_toggle_classes("unexpected"), binary_toggle_classes(None))
+
     def test_runtime_transition_prefers_observed_enable_state(self):
         self.assertEqual(resolve_runtime_transition_state("running", 0), "stopped")
         self.assertEqual(resolve_runtime_transition_state("stopped", 1), "running")
@@ -19,6 +32,13 @@ class DashboardUiStateTests(unittest.TestCase):
         self.assertEqual(resolve_runtime_transition_state("starting", 0), "starting")
         self.assertEqual(resolve_runtime_transition_state("stopping", 1), "stopping")
 
+    def test_runtime_transition_falls_back_without_definite_enable_state(self):
+        self.assertEqual(resolve_runtime_transition_state("starting", None), "starting")
+        self.assertEqual(resolve_runtime_transition_state("running", None), "running")
+        self.assertEqual(resolve_runtime_transition_state(None, 1), "running")
+        self.assertEqual(resolve_runtime_transition_state("unknown", 0), "stopped")
+        self.assertEqual(resolve_runtime_transition_state(None, None), "unknown")
+
     def test_click_feedback_holds_latest_transition_for_short_window(self):
         now_ts = datetime(2026, 2, 25, 12, 0, 1, tzinfo=timezone.utc)
         now_ms = int(now_ts.timestamp() * 1000)
@@ -141,6 +161,55 @@ class DashboardUiStateTests(unittest.TestCase):
             )
         )
 
+    def test_diff_editor_rows_reports_field_edits_and_structure_changes(self):
+        previous = [
+            {"hours": 0, "minutes": 0, "seconds": 0, "setpoint": 1.0, "kind": "value"},
+            {"hours": 1, "minutes": 0, "seconds": 0, "setpoint": None, "kind": "end"},
+        ]
+        edited = [dict(previous[0], setpoint=2.5), dict(previous[1])]
+        self.assertEqual(diff_editor_rows(previous, edited), [(0, "setpoint", 2.5)])
+        self.assertEqual(diff_editor_rows(previous, [dict(row) for row in previous]), [])
+        self.assertIsNone(diff_editor_rows(previous, previous[:1]))
+        reshaped = [previous[0], {"hours": 1, "minutes": 0, "seconds": 0, "kind": "end"}]
+        self.assertEqual(diff_editor_rows(previous, reshaped), [(1, None, reshaped[1])])
+
+    def test_output_group_slices_follow_output_spec_order(self):
+        specs = [
+            ("labels", "run", "children"),
+            ("labels", "stop", "children"),
+            (None, "graph", "figure"),
+            ("flags", "run", "disabled"),
+            ("flags", "stop", "disabled"),
+            (None, "store", "data"),
+        ]
+        self.assertEqual(output_group_slices(specs), {"labels": (0, 2), "flags": (3, 5)})
+        with self.assertRaises(ValueError):
+            output_group_slices([("labels", "run", "children"), (None, "graph", "figure"), ("labels", "stop", "children")])
+
+    def test_skip_unchanged_output_groups_only_skips_groups_the_client_already_has(self):
+        groups = {"labels": (0, 2), "flags": (2, 4)}
+        outputs = ["Run", "Stop", True, False, "figure"]
+        skip = object()
+
+        first, fingerprints = skip_unchanged_output_groups(outputs, groups, None, skip)
+        self.assertEqual(first, outputs)
+        self.assertEqual(set(fingerprints), {"labels", "flags"})
+
+        changed = ["Run", "Stop", False, False, "figure"]
+        second, second_fingerprints = skip_unchanged_output_groups(changed, groups, fingerprints, skip)
+        self.assertEqual(second, [skip, skip, False, False, "figure"])
+        self.assertEqual(second_fingerprints["labels"], fingerprints["labels"])
+        self.assertNotEqual(second_fingerprints["flags"], fingerprints["flags"])
+
+    def test_skip_unchanged_outputs_compares_against_client_props(self):
+        skip = object()
+        outputs = ("local", "Local", "toggle-option active", True)
+        self.assertEqual(
+            skip_unchanged_outputs(outputs, ("local", "Local", "toggle-option", True), skip),
+            (skip, skip, "toggle-option active", skip),
+        )
+        self.assertEqual(skip_unchanged_outputs(outputs, (None, None, None, None), skip), outputs)
+
 
 if __name__ == "__main__":
     unittest.main()
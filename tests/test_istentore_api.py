@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+try:
+    import pandas as pd
+    from istentore_api import IstentoreAPI
+    _IMPORT_ERROR = None
+except ModuleNotFoundError as exc:  # pragma: no cover - environment-dependent test skip
+    pd = None
+    _IMPORT_ERROR = exc
+
+
+@unittest.skipIf(pd is None, f"pandas unavailable: {_IMPORT_ERROR}")
+class IstentoreScheduleToDataFrameTests(unittest.TestCase):
+    def setUp(self):
+        self.api = IstentoreAPI(timezone_name="Europe/Madrid")
+        self.tz = ZoneInfo("Europe/Madrid")
+
+    def test_parses_zulu_offset_and_naive_timestamps_into_sorted_local_index(self):
+        df = self.api.schedule_to_dataframe(
+            {
+                "2026-03-29T01:30:00Z": 30.0,
+                "2026-03-29T02:00:00+01:00": 10.0,
+                "2026-03-29T00:30:00": 20.0,
+            },
+            default_q_kvar=5.0,
+        )
+
+        self.assertEqual(df.index.name, "datetime")
+        self.assertEqual(str(df.index.tz), "Europe/Madrid")
+        self.assertEqual(
+            list(df.index),
+            [
+                datetime(2026, 3, 29, 0, 30, tzinfo=timezone.utc).astimezone(self.tz),
+                datetime(2026, 3, 29, 1, 0, tzinfo=timezone.utc).astimezone(self.tz),
+                datetime(2026, 3, 29, 1, 30, tzinfo=timezone.utc).astimezone(self.tz),
+            ],
+        )
+        self.assertEqual(df.index[-1].hour, 3)
+        self.assertEqual(list(df["power_setpoint_kw"]), [20.0, 10.0, 30.0])
+        self.assertEqual(list(df["reactive_power_setpoint_kvar"]), [5.0, 5.0, 5.0])
+        self.assertEqual(list(df.columns), ["power_setpoint_kw", "reactive_power_setpoint_kvar"])
+
+    def test_empty_schedule_returns_empty_frame_with_datetime_index_name(self):
+        df = self.api.schedule_to_dataframe({})
+
+        self.assertTrue(df.empty)
+        self.assertEqual(df.index.name, "datetime")
+        self.assertEqual(list(df.columns), ["power_setpoint_kw", "reactive_power_setpoint_kvar"])
+
+
+if __name__ == "__main__":
+    unittest.main()
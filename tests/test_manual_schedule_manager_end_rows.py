@@ -94,6 +94,11 @@ class ManualScheduleManagerEndRowsTests(unittest.TestCase):
         self.assertEqual(rows[-1]["kind"], "end")
         self.assertIsNone(rows[-1]["setpoint"])
 
+    def test_csv_upload_bytes_with_bom_match_text(self):
+        csv_text = "hours,minutes,seconds,setpoint\n0,0,0,1\n0,10,0,2\n"
+        from_bytes = msm.load_manual_editor_rows_from_relative_csv_text(("\ufeff" + csv_text).encode("utf-8"))
+        self.assertEqual(from_bytes, msm.load_manual_editor_rows_from_relative_csv_text(csv_text))
+
 
 if __name__ == "__main__":
     unittest.main()
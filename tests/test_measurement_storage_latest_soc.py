@@ -6,7 +6,13 @@ from zoneinfo import ZoneInfo
 
 import pandas as pd
 
-from measurement.storage import MEASUREMENT_COLUMNS, find_latest_persisted_soc_for_plant
+from measurement.storage import (
+    MEASUREMENT_COLUMNS,
+    find_latest_persisted_soc_for_plant,
+    latest_measurement_row,
+    load_file_for_cache,
+)
+from time_utils import normalize_timestamp_value
 
 
 def _row(ts, soc_pu, p_kw=0.0):
@@ -108,6 +114,42 @@ class MeasurementStorageLatestSocTests(unittest.TestCase):
                 self.assertIsNotNone(result)
                 self.assertEqual(result["soc_pu"], 1.0)
 
+    def test_latest_measurement_row_uses_latest_valid_timestamp_without_mutating_frame(self):
+        tz = ZoneInfo("Europe/Madrid")
+        df = pd.DataFrame(
+            [
+                _row("2026-02-23T10:00:00+01:00", 0.1),
+                _row("2026-02-23T12:00:00+01:00", 0.3),
+                _row(None, 0.9),
+                _row("2026-02-23T11:00:00+01:00", 0.2),
+            ]
+        )
+        columns_before = list(df.columns)
+
+        latest = latest_measurement_row(df, tz)
+
+        self.assertEqual(latest["soc_pu"], 0.3)
+        self.assertEqual(list(df.columns), columns_before)
+        self.assertEqual(latest_measurement_row(pd.DataFrame(), tz), {})
+
+    def test_load_file_for_cache_parses_offset_and_naive_timestamps_like_scalar_normalization(self):
+        tz = ZoneInfo("Europe/Madrid")
+        for timestamps in (
+            ["2026-03-29T01:59:59+01:00", "2026-03-29T03:00:00+02:00"],
+            ["2026-03-28T10:00:00+01:00", "2026-03-28 11:00:00"],
+        ):
+            with self.subTest(timestamps=timestamps), tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "20260329_lib.csv")
+                pd.DataFrame([_row(ts, 0.5) for ts in timestamps], columns=MEASUREMENT_COLUMNS).to_csv(path, index=False)
+
+                df = load_file_for_cache(path, tz)
+
+                self.assertEqual(
+                    list(df["timestamp"]),
+                    sorted(normalize_timestamp_value(ts, tz) for ts in timestamps),
+                )
+                self.assertEqual(str(df["timestamp"].dt.tz), "Europe/Madrid")
+
 
 if __name__ == "__main__":
     unittest.main()
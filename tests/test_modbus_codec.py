@@ -4,7 +4,9 @@ from modbus.codec import (
     decode_engineering_value,
     encode_engineering_value,
     read_point_internal,
+    read_points_internal,
     write_point_internal,
+    write_points_internal,
 )
 
 
@@ -46,6 +48,19 @@ class ModbusCodecTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "out of range"):
             encode_engineering_value(endpoint, point, 4000.0)
 
+    def test_repeated_encodes_return_independent_word_lists(self):
+        endpoint = self._endpoint(byte_order="little", word_order="lsw_first")
+        point = {"format": "int32", "eng_per_count": 0.1}
+        first = encode_engineering_value(endpoint, point, -12.5)
+        first.append(0)
+
+        second = encode_engineering_value(endpoint, point, -12.5)
+
+        self.assertEqual(len(second), 2)
+        self.assertAlmostEqual(decode_engineering_value(endpoint, point, second), -12.5, places=4)
+        with self.assertRaisesRegex(ValueError, "point="):
+            encode_engineering_value(self._endpoint(), {"format": "int16", "eng_per_count": 0.1}, 4000.0)
+
     def test_integer_quantization_truncates_toward_zero(self):
         endpoint = self._endpoint()
         point = {"format": "int16", "eng_per_count": 0.1}
@@ -115,6 +130,74 @@ class ModbusCodecTests(unittest.TestCase):
         self.assertEqual(client.regs[20], 20000)
         self.assertAlmostEqual(read_point_internal(client, endpoint, "v_poi"), 20.0, places=6)
 
+    def test_read_points_internal_batches_nearby_points_and_falls_back_per_point(self):
+        endpoint = {
+            **self._endpoint(),
+            "points": {
+                "enable": {"address": 1, "format": "uint16", "eng_per_count": 1.0, "unit": "raw"},
+                "p_battery": {"address": 270, "format": "int16", "eng_per_count": 0.1, "unit": "kW"},
+                "q_battery": {"address": 272, "format": "int16", "eng_per_count": 0.1, "unit": "kvar"},
+            },
+        }
+
+        class _Client:
+            def __init__(self, rejected_addresses=()):
+                self.regs = {1: 1, 270: 15, 272: 65535}
+                self.rejected_addresses = set(rejected_addresses)
+                self.reads = []
+
+            def read_holding_registers(self, address, count):
+                self.reads.append((int(address), int(count)))
+                span = range(int(address), int(address) + int(count))
+                if any(addr in self.rejected_addresses for addr in span):
+                    return None
+                return [self.regs.get(addr, 0) for addr in span]
+
+        client = _Client()
+        values = read_points_internal(client, endpoint, ["p_battery", "enable", "q_battery"])
+
+        self.assertEqual(client.reads, [(1, 1), (270, 3)])
+        self.assertEqual(values["enable"], 1.0)
+        self.assertAlmostEqual(values["p_battery"], 1.5, places=6)
+        self.assertAlmostEqual(values["q_battery"], -0.1, places=6)
+
+        gap_rejecting_client = _Client(rejected_addresses={271})
+        values = read_points_internal(gap_rejecting_client, endpoint, ["p_battery", "q_battery"])
+
+        self.assertEqual(gap_rejecting_client.reads, [(270, 3), (270, 1), (272, 1)])
+        self.assertAlmostEqual(values["p_battery"], 1.5, places=6)
+        self.assertAlmostEqual(values["q_battery"], -0.1, places=6)
+
+    def test_write_points_internal_combines_only_consecutive_registers(self):
+        def _endpoint(q_address):
+            return {
+                **self._endpoint(),
+                "points": {
+                    "p_setpoint": {"address": 1, "format": "int16", "eng_per_count": 0.1, "unit": "kW"},
+                    "q_setpoint": {"address": q_address, "format": "int16", "eng_per_count": 0.1, "unit": "kvar"},
+                },
+            }
+
+        class _Client:
+            def __init__(self):
+                self.requests = []
+
+            def write_single_register(self, address, value):
+                self.requests.append(("single", int(address), [int(value)]))
+                return True
+
+            def write_multiple_registers(self, address, values):
+                self.requests.append(("multiple", int(address), list(values)))
+                return True
+
+        client = _Client()
+        self.assertTrue(write_points_internal(client, _endpoint(2), {"q_setpoint": -0.1, "p_setpoint": 1.5}))
+        self.assertEqual(client.requests, [("multiple", 1, [15, 65535])])
+
+        gapped_client = _Client()
+        self.assertTrue(write_points_internal(gapped_client, _endpoint(3), {"p_setpoint": 1.5, "q_setpoint": -0.1}))
+        self.assertEqual(gapped_client.requests, [("single", 1, [15]), ("single", 3, [65535])])
+
 
 if __name__ == "__main__":
     unittest.main()
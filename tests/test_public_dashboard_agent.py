@@ -160,6 +160,55 @@ class PublicDashboardAgentTests(unittest.TestCase):
         self.assertNotIn("public-status-lib", by_id)
         self.assertNotIn("public-status-vrfb", by_id)
 
+    def test_public_status_refresh_patches_figures_the_browser_already_shows(self):
+        config = load_config("config.yaml")
+        config["DASHBOARD_PUBLIC_READONLY_AUTH_MODE"] = "none"
+        app = build_public_readonly_app(config, _minimal_shared_data())
+        client = app.server.test_client()
+        deps = client.get("/_dash-dependencies").get_json()
+        dep = next(item for item in deps if "public-status-graph-revision-store.data" in item["output"])
+        outputs = [
+            {"id": output.split(".")[0], "property": output.split(".")[1]}
+            for output in dep["output"].strip(".").split("...")
+        ]
+
+        def _refresh(fingerprints, revisions, active_tab="status"):
+            response = client.post(
+                "/_dash-update-component",
+                json={
+                    "output": dep["output"],
+                    "outputs": outputs,
+                    "inputs": [
+                        {"id": "public-interval-component", "property": "n_intervals", "value": 1},
+                        {"id": "public-main-tabs", "property": "value", "value": active_tab},
+                    ],
+                    "state": [
+                        {"id": "public-status-output-fingerprint-store", "property": "data", "value": fingerprints},
+                        {"id": "public-status-graph-revision-store", "property": "data", "value": revisions},
+                    ],
+                    "changedPropIds": ["public-interval-component.n_intervals"],
+                },
+            )
+            self.assertEqual(response.status_code, 200)
+            return response.get_json()["response"]
+
+        first = _refresh({}, {})
+        self.assertIn("data", first["public-graph-lib"]["figure"])
+        revisions = first["public-status-graph-revision-store"]["data"]
+
+        second = _refresh(first["public-status-output-fingerprint-store"]["data"], revisions)
+        self.assertIn("__dash_patch_update", second["public-graph-lib"]["figure"])
+        self.assertNotIn("public-plant-summary-table", second)
+        self.assertNotIn("public-status-graph-revision-store", second)
+
+        third = _refresh(first["public-status-output-fingerprint-store"]["data"], {})
+        self.assertIn("data", third["public-graph-lib"]["figure"])
+        self.assertEqual(third["public-status-graph-revision-store"]["data"], revisions)
+
+        hidden = _refresh(first["public-status-output-fingerprint-store"]["data"], {}, active_tab="plots")
+        self.assertNotIn("public-graph-lib", hidden)
+        self.assertNotIn("public-status-graph-revision-store", hidden)
+
     def test_public_basic_auth_challenges_unauthenticated_requests(self):
         if importlib.util.find_spec("dash_auth") is None:
             self.skipTest("dash_auth is not installed in this environment")
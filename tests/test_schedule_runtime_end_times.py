@@ -3,7 +3,7 @@ from zoneinfo import ZoneInfo
 
 import pandas as pd
 
-from scheduling.runtime import build_effective_schedule_frame
+from scheduling.runtime import build_effective_schedule_frame, crop_schedule_frame_to_window, resolve_schedule_setpoint
 
 
 class ScheduleRuntimeEndTimeTests(unittest.TestCase):
@@ -64,6 +64,61 @@ class ScheduleRuntimeEndTimeTests(unittest.TestCase):
         self.assertAlmostEqual(float(effective.loc[p_end, "reactive_power_setpoint_kvar"]), 50.0)
         self.assertAlmostEqual(float(effective.loc[q_end, "reactive_power_setpoint_kvar"]), 10.0)
 
+    def test_crop_schedule_frame_normalizes_naive_and_aware_datetime_index(self):
+        tz = ZoneInfo("Europe/Madrid")
+        naive_df = pd.DataFrame(
+            {"power_setpoint_kw": [2.0, 1.0, 3.0]},
+            index=pd.DatetimeIndex(["2026-02-26 11:00", "2026-02-26 10:00", "2026-02-26 12:00"]),
+        )
+        aware_df = naive_df.copy()
+        aware_df.index = naive_df.index.tz_localize("UTC")
+
+        start = pd.Timestamp("2026-02-26T10:00:00+01:00")
+        end = pd.Timestamp("2026-02-26T12:00:00+01:00")
+        cropped_naive = crop_schedule_frame_to_window(naive_df, tz, start, end)
+        cropped_aware = crop_schedule_frame_to_window(aware_df, tz, start, end + pd.Timedelta(hours=1))
+
+        self.assertEqual(list(cropped_naive["power_setpoint_kw"]), [1.0, 2.0])
+        self.assertEqual(str(cropped_naive.index.tz), "Europe/Madrid")
+        self.assertEqual(list(cropped_aware["power_setpoint_kw"]), [1.0, 2.0])
+        self.assertEqual(cropped_aware.index[0], pd.Timestamp("2026-02-26T10:00:00+00:00"))
+
+    def test_crop_schedule_frame_reuses_already_normalized_frame_data(self):
+        tz = ZoneInfo("Europe/Madrid")
+        schedule_df = pd.DataFrame(
+            {"power_setpoint_kw": [1.0, 2.0]},
+            index=pd.date_range("2026-02-26T10:00:00", periods=2, freq="h", tz=tz),
+        )
+
+        cropped = crop_schedule_frame_to_window(schedule_df, tz, None, None)
+
+        self.assertIsNot(cropped, schedule_df)
+        self.assertTrue(cropped.index.equals(schedule_df.index))
+        self.assertEqual(list(cropped["power_setpoint_kw"]), [1.0, 2.0])
+
+    def test_resolve_schedule_setpoint_uses_last_complete_row_at_or_before_now(self):
+        tz = ZoneInfo("Europe/Madrid")
+        base = pd.Timestamp("2026-02-26T10:00:00+01:00")
+        schedule_df = pd.DataFrame(
+            {
+                "power_setpoint_kw": [100.0, 200.0, float("nan")],
+                "reactive_power_setpoint_kvar": [10.0, 20.0, 30.0],
+            },
+            index=pd.DatetimeIndex([base, base + pd.Timedelta(minutes=15), base + pd.Timedelta(minutes=30)]),
+        )
+
+        self.assertEqual(resolve_schedule_setpoint(schedule_df, base - pd.Timedelta(minutes=1), tz, source="api"), (0.0, 0.0, True))
+        self.assertEqual(resolve_schedule_setpoint(schedule_df, base + pd.Timedelta(minutes=15), tz), (200.0, 20.0, None))
+        # Rows with a missing column fall back to the previous complete row; staleness uses the latest row time.
+        self.assertEqual(
+            resolve_schedule_setpoint(schedule_df, base + pd.Timedelta(minutes=40), tz, source="api"),
+            (200.0, 20.0, False),
+        )
+        self.assertEqual(
+            resolve_schedule_setpoint(schedule_df, base + pd.Timedelta(minutes=50), tz, source="api"),
+            (0.0, 0.0, True),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -53,6 +53,11 @@ def normalize_timestamp_value(value: Any, tz: ZoneInfo, naive_policy: str = "con
 
 def normalize_datetime_series(series: pd.Series, tz: ZoneInfo, naive_policy: str = "config_tz") -> pd.Series:
     """Normalize a series of mixed datetime values to configured timezone."""
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return series.dt.tz_convert(tz)
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        localized = series.dt.tz_localize(timezone.utc if naive_policy == "utc" else tz)
+        return localized.dt.tz_convert(tz)
     normalized = [normalize_timestamp_value(value, tz, naive_policy=naive_policy) for value in series]
     return pd.Series(normalized, index=series.index)
 
@@ -64,11 +69,28 @@ def normalize_schedule_index(df: pd.DataFrame, tz: ZoneInfo, naive_policy: str =
     if df.empty:
         return df.copy()
 
+    index = df.index
+    if (
+        isinstance(index, pd.DatetimeIndex)
+        and index.tz == tz
+        and index.name is None
+        and not index.hasnans
+        and index.is_monotonic_increasing
+    ):
+        # Already normalized (the usual case for published frames); a shallow copy shares the data copy-on-write.
+        return df.copy(deep=False)
+
     result = df.copy()
-    normalized_index = [
-        normalize_timestamp_value(value, tz, naive_policy=naive_policy) for value in result.index
-    ]
-    dt_index = pd.DatetimeIndex(normalized_index)
+    if isinstance(result.index, pd.DatetimeIndex):
+        dt_index = result.index
+        if dt_index.tz is None:
+            dt_index = dt_index.tz_localize(timezone.utc if naive_policy == "utc" else tz)
+        dt_index = dt_index.tz_convert(tz).rename(None)
+    else:
+        normalized_index = [
+            normalize_timestamp_value(value, tz, naive_policy=naive_policy) for value in result.index
+        ]
+        dt_index = pd.DatetimeIndex(normalized_index)
     valid_mask = ~dt_index.isna()
     if not valid_mask.any():
         return result.iloc[0:0].copy()
@@ -91,3 +113,27 @@ def serialize_iso_with_tz(value: Any, tz: ZoneInfo = None, naive_policy: str = "
         ts = ts.tz_localize(timezone.utc)
 
     return ts.isoformat()
+
+
+def serialize_iso_series_with_tz(series: pd.Series, tz: ZoneInfo, naive_policy: str = "config_tz") -> pd.Series:
+    """Serialize a timestamp series like ``serialize_iso_with_tz`` per value, vectorized for datetime columns."""
+    if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series.apply(lambda value: serialize_iso_with_tz(value, tz=tz, naive_policy=naive_policy))
+
+    local = normalize_datetime_series(series, tz, naive_policy=naive_policy)
+    wall = local.dt.tz_localize(None)
+    if (wall.dt.nanosecond.fillna(0) != 0).any():
+        return series.apply(lambda value: serialize_iso_with_tz(value, tz=tz, naive_policy=naive_policy))
+
+    microseconds = wall.dt.microsecond.fillna(0).astype("int64")
+    fraction = ("." + microseconds.astype(str).str.zfill(6)).where(microseconds != 0, "")
+    offset_s = (wall - local.dt.tz_convert("UTC").dt.tz_localize(None)).dt.total_seconds().fillna(0).astype("int64")
+    offset_abs = offset_s.abs()
+    offset = (
+        offset_s.lt(0).map({True: "-", False: "+"})
+        + (offset_abs // 3600).astype(str).str.zfill(2)
+        + ":"
+        + (offset_abs % 3600 // 60).astype(str).str.zfill(2)
+    )
+    serialized = wall.dt.strftime("%Y-%m-%dT%H:%M:%S") + fraction + offset
+    return serialized.where(local.notna(), "")